@@ -0,0 +1,100 @@
+"""
+BENCHMARK - IconManager
+Compara o custo, na thread da GUI, de obter os ícones usados na construção
+da janela: modo antigo (os.path.exists + QPixmap + scaled) vs cache de
+assets pré-carregado em segundo plano.
+
+Uso: python benchmarks/bench_assets.py [--rounds 50]
+"""
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QPixmap
+from PySide6.QtWidgets import QApplication
+
+from src.utils.asset_bundle import PROJECT_DIR
+from src.utils.icon_manager import UI_ICONS, IconManager
+
+
+def legacy_icons():
+    """Como Sidebar/MainWindow faziam: checar caminhos, decodificar e escalar"""
+    for name, size in UI_ICONS:
+        icon_path = os.path.join(str(PROJECT_DIR), 'assets', 'icons', name)
+        if not os.path.exists(icon_path):
+            icon_path = os.path.join(str(PROJECT_DIR), 'src', 'ui', 'icons', name)
+        if os.path.exists(icon_path):
+            QPixmap(icon_path).scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+
+def report(name, samples):
+    samples.sort()
+    mean = sum(samples) / len(samples)
+    p50 = samples[len(samples) // 2]
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+    print(f"{name:>22} {mean:9.3f} {p50:9.3f} {p95:9.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do IconManager")
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    print(f"IconManager, {len(UI_ICONS)} ícones por rodada, {args.rounds} rodadas (ms por rodada)")
+    print(f"{'case':>22} {'mean ms':>9} {'p50 ms':>9} {'p95 ms':>9}")
+
+    samples = []
+    for _ in range(args.rounds):
+        start = time.perf_counter()
+        legacy_icons()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    report("legacy decode+scale", samples)
+
+    # Primeira construção: pré-carga agendada e pixmaps retirados em seguida
+    # (espera o que o pool ainda não terminou)
+    samples = []
+    for _ in range(args.rounds):
+        manager = IconManager()
+        start = time.perf_counter()
+        manager.preload(fonts=False)
+        for name, size in UI_ICONS:
+            manager.pixmap(name, size)
+        samples.append((time.perf_counter() - start) * 1000.0)
+        manager.shutdown()
+    report("preload + get (cold)", samples)
+
+    # Pré-carga já concluída (caso do app: agendada antes da janela)
+    samples = []
+    for _ in range(args.rounds):
+        manager = IconManager()
+        manager.preload(fonts=False)
+        for future in list(manager._pending.values()):
+            future.result()
+        start = time.perf_counter()
+        for name, size in UI_ICONS:
+            manager.pixmap(name, size)
+        samples.append((time.perf_counter() - start) * 1000.0)
+        manager.shutdown()
+    report("get after preload", samples)
+
+    manager = IconManager.instance()
+    for name, size in UI_ICONS:
+        manager.pixmap(name, size)
+    samples = []
+    for _ in range(args.rounds):
+        start = time.perf_counter()
+        for name, size in UI_ICONS:
+            manager.pixmap(name, size)
+        samples.append((time.perf_counter() - start) * 1000.0)
+    report("shared pixmap (hit)", samples)
+
+
+if __name__ == "__main__":
+    main()
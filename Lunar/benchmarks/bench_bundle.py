@@ -0,0 +1,104 @@
+"""
+BENCHMARK - Pacote de assets
+Mede o carregamento de assets de uma partida a frio (tema compilado,
+ícones da interface, fontes e app.ico), cada rodada num processo novo:
+arquivos soltos em disco vs lunar_assets.rcc. Reporta o tempo, as leituras
+feitas pelo processo (/proc/self/io, só Linux) e os arquivos abertos pelo
+Python.
+
+Uso: python benchmarks/bench_bundle.py [--runs 15]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+
+def read_proc_io():
+    try:
+        with open("/proc/self/io", "r") as f:
+            return {key: int(value) for key, value in
+                    (line.split(":") for line in f)}
+    except OSError:
+        return {}
+
+
+def child(use_bundle):
+    """Uma partida: carrega os assets e imprime as medidas em JSON"""
+    opened = []
+    sys.addaudithook(lambda event, args: opened.append(args[0]) if event == "open" else None)
+
+    from PySide6.QtGui import QIcon
+    from PySide6.QtWidgets import QApplication
+    app = QApplication(sys.argv)
+
+    from src.utils import asset_bundle
+    from src.ui.adapters.theme_manager import ThemeManager
+    from src.utils.icon_manager import UI_ICONS, IconManager
+
+    before = read_proc_io()
+    opened.clear()
+    start = time.perf_counter()
+
+    if use_bundle:
+        asset_bundle.register()
+    else:
+        asset_bundle._state["checked"] = True  # Ignora o .rcc: só disco
+
+    QIcon(asset_bundle.resolve("assets/icons/app.ico"))
+    assets = IconManager()
+    assets.preload()
+    assets.load_fonts()
+    ThemeManager().stylesheet("dark")
+    for name, size in UI_ICONS:
+        assets.pixmap(name, size)
+
+    elapsed = (time.perf_counter() - start) * 1000.0
+    after = read_proc_io()
+    assets.shutdown()
+
+    print(json.dumps({
+        "ms": elapsed,
+        "reads": after.get("syscr", 0) - before.get("syscr", 0),
+        "opened": len(opened),
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do pacote de assets")
+    parser.add_argument("--runs", type=int, default=15)
+    parser.add_argument("--child", choices=("files", "bundle"))
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child == "bundle")
+        return
+
+    from src.utils.asset_bundle import BUNDLE_PATH, build_bundle
+    if not BUNDLE_PATH.exists():
+        build_bundle()
+
+    print(f"Assets a frio, {args.runs} processos por caso")
+    print(f"{'case':>8} {'p50 ms':>9} {'p95 ms':>9} {'reads':>7} {'py opens':>9}")
+    for case in ("files", "bundle"):
+        results = []
+        for _ in range(args.runs):
+            output = subprocess.run([sys.executable, __file__, "--child", case],
+                                    capture_output=True, text=True, cwd=ROOT, check=True)
+            results.append(json.loads(output.stdout.strip().splitlines()[-1]))
+
+        times = sorted(result["ms"] for result in results)
+        reads = sorted(result["reads"] for result in results)[len(results) // 2]
+        opened = sorted(result["opened"] for result in results)[len(results) // 2]
+        p95 = times[min(len(times) - 1, int(len(times) * 0.95))]
+        print(f"{case:>8} {times[len(times) // 2]:9.2f} {p95:9.2f} {reads:7d} {opened:9d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+BENCHMARK - MiniGraphWidget
+Mede tempo e memória Python transitória (tracemalloc) por paint do
+MiniGraphWidget na plataforma Qt offscreen, comparando com o paintEvent
+original (um QImage, um QPainter, três gradientes e várias QColor por paint).
+
+Uso: python benchmarks/bench_graphs.py [--paints 2000]
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import numpy as np
+from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import Qt, QPointF
+from PySide6.QtGui import QPainter, QColor, QPolygonF, QLinearGradient, QImage
+
+from src.ui.components.hardware_graphs import MiniGraphWidget
+
+
+class LegacyMiniGraphWidget(MiniGraphWidget):
+    """Referência: paintEvent original, que recria todos os recursos a cada paint"""
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        w = self.width()
+        h = self.height()
+        data_points = list(self.series.values())
+
+        current_value = data_points[-1]
+        half_range = self.MIN_VERTICAL_RANGE / 2.0
+        graph_min = current_value - half_range
+        graph_max = current_value + half_range
+        if graph_min < 0.0:
+            graph_max += 0.0 - graph_min
+            graph_min = 0.0
+        current_range = graph_max - graph_min
+
+        polygon = QPolygonF()
+        polygon.append(QPointF(0, h))
+        line_polygon = QPolygonF()
+        step_x = w / (self.max_points - 1)
+        for i, value in enumerate(data_points):
+            normalized_y = min(1.0, max(0.0, (value - graph_min) / current_range))
+            y = h - (normalized_y * h)
+            polygon.append(QPointF(i * step_x, y))
+            line_polygon.append(QPointF(i * step_x, y))
+        polygon.append(QPointF(w, h))
+
+        solid_color = QColor(self.graph_color)
+        faded_color = QColor(self.graph_color)
+        faded_color.setAlphaF(0.0)
+
+        buffer = QImage(self.size(), QImage.Format_ARGB32_Premultiplied)
+        buffer.fill(Qt.transparent)
+        buffer_painter = QPainter(buffer)
+        buffer_painter.setRenderHint(QPainter.Antialiasing)
+        v_grad = QLinearGradient(0, 0, 0, h)
+        v_grad.setColorAt(0.0, solid_color.lighter(120))
+        v_grad.setColorAt(1.0, faded_color)
+        buffer_painter.setPen(Qt.NoPen)
+        buffer_painter.setBrush(v_grad)
+        buffer_painter.drawPolygon(polygon)
+        buffer_painter.setCompositionMode(QPainter.CompositionMode_DestinationIn)
+        h_grad_mask = QLinearGradient(0, 0, w, 0)
+        h_grad_mask.setColorAt(0.0, QColor(0, 0, 0, 0))
+        h_grad_mask.setColorAt(0.8, QColor(0, 0, 0, 255))
+        h_grad_mask.setColorAt(1.0, QColor(0, 0, 0, 0))
+        buffer_painter.fillRect(self.rect(), h_grad_mask)
+        buffer_painter.end()
+        painter.drawImage(0, 0, buffer)
+
+        h_grad_line = QLinearGradient(0, 0, w, 0)
+        h_grad_line.setColorAt(0.0, faded_color)
+        h_grad_line.setColorAt(0.8, solid_color)
+        h_grad_line.setColorAt(1.0, faded_color)
+        pen = painter.pen()
+        pen.setBrush(h_grad_line)
+        pen.setWidthF(1.5)
+        painter.setPen(pen)
+        painter.setBrush(Qt.NoBrush)
+        painter.drawPolyline(line_polygon)
+
+
+def measure(widget_class, values, paints_per_sample):
+    """Retorna (tempos por paint em ms, pico médio de memória transitória em bytes)"""
+    widget = widget_class()
+    widget.set_color("#50E3C2")
+    widget.show()
+    QApplication.processEvents()
+
+    for value in values[:50]:  # Aquecimento
+        widget.add_data_point(value)
+        widget.repaint()
+
+    times = []
+    peaks = []
+    tracemalloc.start()
+    for index, value in enumerate(values):
+        widget.add_data_point(value)
+        for _ in range(paints_per_sample):
+            base = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            start = time.perf_counter()
+            widget.repaint()
+            times.append((time.perf_counter() - start) * 1000.0)
+            peaks.append(tracemalloc.get_traced_memory()[1] - base)
+    tracemalloc.stop()
+
+    widget.close()
+    widget.deleteLater()
+    QApplication.processEvents()
+
+    times.sort()
+    return times, sum(peaks) / len(peaks)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do MiniGraphWidget")
+    parser.add_argument("--paints", type=int, default=2000)
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    rng = np.random.default_rng(7)
+    values = np.abs(np.cumsum(rng.normal(0.0, 1.5, args.paints))) + 5.0
+
+    # (cenário, repaints por amostra): 1 = só dados novos; 4 = repaints extras
+    # sem dados novos (hover, widgets vizinhos, partículas por trás)
+    scenarios = (("new sample", 1), ("repaint x4", 4))
+
+    print(f"MiniGraphWidget 100x40, {args.paints} amostras")
+    print(f"{'widget':>8} {'scenario':>11} {'mean ms':>9} {'p50 ms':>9} {'p95 ms':>9} {'py bytes':>9}")
+    for name, widget_class in (("legacy", LegacyMiniGraphWidget), ("cached", MiniGraphWidget)):
+        for scenario, repeats in scenarios:
+            times, peak = measure(widget_class, values, repeats)
+            mean = sum(times) / len(times)
+            p50 = times[len(times) // 2]
+            p95 = times[int(len(times) * 0.95) - 1]
+            print(f"{name:>8} {scenario:>11} {mean:>9.4f} {p50:>9.4f} {p95:>9.4f} {peak:>9.0f}")
+
+    del app
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+"""
+BENCHMARK - Visualizador de logs
+Gera um log no formato do logger (com tracebacks) e mede: indexação em
+segundo plano, memória do índice, tempo por frame ao rolar (saltos
+aleatórios e página a página) e os filtros de nível e de texto, na
+plataforma Qt offscreen.
+
+Uso: python benchmarks/bench_log_viewer.py [--lines 10000000] [--frames 300]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from PySide6.QtWidgets import QApplication
+
+from src.ui.components.log_viewer import LogViewer
+
+
+def write_log(path, lines):
+    """Log sintético: ~1 traceback de 4 linhas a cada 50 entradas"""
+    levels = ("INFO   ", "INFO   ", "DEBUG  ", "WARNING", "INFO   ")
+    block = []
+    for i in range(1000):
+        stamp = f"2026-10-18 04:{i // 60 % 60:02d}:{i % 60:02d},{i % 1000:03d}"
+        if i % 50 == 49:
+            block.append(f"{stamp} ERROR   lunar.ui.components.particles: Erro no ParticleSystem paintEvent: boom {i}")
+            block.append("Traceback (most recent call last):")
+            block.append('  File "src/ui/components/particles.py", line 452, in paintEvent')
+            block.append("ZeroDivisionError: division by zero")
+        else:
+            block.append(f"{stamp} {levels[i % len(levels)]} lunar.core.app: evento {i} do módulo mac/guid/hwid")
+    text = "\n".join(block) + "\n"
+    per_block = len(block)
+    with open(path, "w", encoding="utf-8") as f:
+        for _ in range(lines // per_block):
+            f.write(text)
+        f.write("\n".join(block[:lines % per_block]) + ("\n" if lines % per_block else ""))
+
+
+def anonymous_memory():
+    """Memória anônima do processo (sem o cache de páginas do arquivo), em bytes"""
+    try:
+        with open("/proc/self/status", "r") as f:
+            for line in f:
+                if line.startswith("RssAnon:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    import psutil
+    return psutil.Process().memory_info().rss
+
+
+def wait_for(condition, timeout=600.0):
+    start = time.perf_counter()
+    while not condition():
+        QApplication.processEvents()
+        time.sleep(0.001)
+        if time.perf_counter() - start > timeout:
+            raise TimeoutError
+    return (time.perf_counter() - start) * 1000.0
+
+
+def stats(samples):
+    samples = sorted(samples)
+    mean = sum(samples) / len(samples)
+    return mean, samples[len(samples) // 2], samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do visualizador de logs")
+    parser.add_argument("--lines", type=int, default=2_000_000)
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--size", default="1200x800")
+    args = parser.parse_args()
+    width, height = (int(value) for value in args.size.split("x"))
+
+    app = QApplication(sys.argv)
+    folder = tempfile.mkdtemp(prefix="lunar-logview-")
+    path = os.path.join(folder, "lunar.log")
+    write_log(path, args.lines)
+    size_mb = os.path.getsize(path) / (1024 * 1024)
+
+    memory_before = anonymous_memory()
+
+    # Indexação em segundo plano (follow ligado: linhas entram conforme chegam)
+    start = time.perf_counter()
+    viewer = LogViewer(path)
+    viewer.tail_timer.stop()
+    viewer.resize(width, height)
+    viewer.show()
+    construct = (time.perf_counter() - start) * 1000.0
+    index_ms = wait_for(lambda: viewer.log_index.line_count >= args.lines) + construct
+    QApplication.processEvents()
+    memory_after = anonymous_memory()
+
+    print(f"Log: {args.lines:,} linhas, {size_mb:.0f} MB")
+    print(f"Janela pronta em {construct:.1f} ms; índice completo em {index_ms:.0f} ms "
+          f"({size_mb / (index_ms / 1000.0):.0f} MB/s)")
+    index = viewer.log_index
+    index_mb = (index._offsets.view().nbytes + index._levels.view().nbytes) / (1024 * 1024)
+    print(f"Índice: {index_mb:.0f} MB; memória anônima +{(memory_after - memory_before) / (1024 * 1024):.0f} MB "
+          f"(texto fica no arquivo)")
+
+    view = viewer.log_view
+    scroll_bar = view.verticalScrollBar()
+    viewer.follow_check.setChecked(False)
+
+    def frame(value):
+        started = time.perf_counter()
+        scroll_bar.setValue(value)
+        view.viewport().repaint()
+        return (time.perf_counter() - started) * 1000.0
+
+    random.seed(1)
+    cases = {
+        "jump": [frame(random.randint(0, scroll_bar.maximum())) for _ in range(args.frames)],
+    }
+    position = scroll_bar.maximum() // 2
+    cases["page"] = [frame(position + step * scroll_bar.pageStep()) for step in range(args.frames)]
+    cases["line"] = [frame(position + step) for step in range(args.frames)]
+
+    print(f"\nRolagem ({width}x{height}, {args.frames} frames)")
+    print(f"{'case':>6} {'mean ms':>9} {'p50 ms':>9} {'p95 ms':>9}")
+    for name, samples in cases.items():
+        mean, p50, p95 = stats(samples)
+        print(f"{name:>6} {mean:9.2f} {p50:9.2f} {p95:9.2f}")
+
+    # Filtros
+    print(f"\n{'filter':>16} {'ms':>9} {'rows':>11}")
+    start = time.perf_counter()
+    viewer.level_combo.setCurrentIndex(viewer.level_combo.findText("ERROR"))
+    QApplication.processEvents()
+    print(f"{'level>=ERROR':>16} {(time.perf_counter() - start) * 1000.0:9.1f} {viewer.model.available():11,}")
+
+    viewer.level_combo.setCurrentIndex(0)
+    viewer.filter_edit.setText("boom 949")
+    start = time.perf_counter()
+    viewer.apply_filter()
+    elapsed = wait_for(lambda: viewer.model._search_token is None)
+    print(f"{'text':>16} {elapsed:9.1f} {viewer.model.available():11,}")
+
+    viewer.log_index.close()
+    viewer.close()
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
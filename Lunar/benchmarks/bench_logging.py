@@ -0,0 +1,110 @@
+"""
+BENCHMARK - Log assíncrono
+Mede quanto cada chamada de log custa para a thread que loga (a GUI, no
+app): print() direto num arquivo, logging síncrono (FileHandler) e o
+logger do Lunar (fila + thread de escrita, com limite de repetições).
+
+Casos: mensagens distintas de várias linhas de código e uma "tempestade"
+de erros com traceback vindos da mesma linha (ex.: paintEvent falhando a
+cada frame).
+
+Uso: python benchmarks/bench_logging.py [--messages 5000]
+"""
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src.utils.logger import REPEAT_BURST, get_logger, setup_logging, shutdown_logging
+
+
+def stats(samples):
+    samples = sorted(samples)
+    mean = sum(samples) / len(samples)
+    return mean, samples[len(samples) // 2], samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+
+
+def run_case(emit, messages, storm):
+    """Tempo (µs) de cada chamada de `emit(i, erro)`"""
+    samples = []
+    for i in range(messages):
+        error = None
+        if storm:
+            try:
+                raise ZeroDivisionError("division by zero")
+            except ZeroDivisionError as e:
+                error = e
+        start = time.perf_counter()
+        emit(i, error)
+        samples.append((time.perf_counter() - start) * 1e6)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do log assíncrono")
+    parser.add_argument("--messages", type=int, default=5000)
+    args = parser.parse_args()
+
+    folder = tempfile.mkdtemp(prefix="lunar-log-")
+
+    # print() num arquivo (como o console redirecionado)
+    stream = open(os.path.join(folder, "print.log"), "w", encoding="utf-8", buffering=1)
+
+    def emit_print(i, error):
+        if error is not None:
+            import traceback
+            print(f"Erro no paintEvent: {error}\n{traceback.format_exc()}", file=stream)
+        else:
+            print(f"Navegando para: página {i % 7}", file=stream)
+
+    # logging síncrono: formata e escreve na thread que loga
+    sync = logging.getLogger("bench.sync")
+    sync.propagate = False
+    sync.setLevel(logging.INFO)
+    handler = logging.FileHandler(os.path.join(folder, "sync.log"), encoding="utf-8")
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)-7s %(name)s: %(message)s"))
+    sync.addHandler(handler)
+
+    def emit_sync(i, error):
+        if error is not None:
+            sync.exception("Erro no paintEvent: %s", error)
+        else:
+            sync.info("Navegando para: página %s", i % 7)
+
+    # Logger do Lunar: só enfileira (sem o limite de repetições nas
+    # mensagens distintas, para a comparação ser justa)
+    lunar = get_logger("bench.async")
+    lunar_log = os.path.join(folder, "lunar.log")
+
+    def emit_async(i, error):
+        if error is not None:
+            lunar.exception("Erro no paintEvent: %s", error)
+        else:
+            lunar.info("Navegando para: página %s", i % 7)
+
+    cases = (("print", emit_print), ("sync", emit_sync), ("async", emit_async))
+
+    print(f"Custo por chamada na thread que loga, {args.messages} mensagens")
+    print(f"{'case':>8} {'scenario':>9} {'mean µs':>9} {'p50 µs':>9} {'p95 µs':>9}")
+    for scenario, storm in (("distinct", False), ("storm", True)):
+        setup_logging(log_file=lunar_log, console=False,
+                      repeat_burst=REPEAT_BURST if storm else args.messages)
+        for name, emit in cases:
+            mean, p50, p95 = stats(run_case(emit, args.messages, storm))
+            print(f"{name:>8} {scenario:>9} {mean:9.2f} {p50:9.2f} {p95:9.2f}")
+
+    shutdown_logging()
+    stream.close()
+    handler.close()
+    sizes = {name: os.path.getsize(os.path.join(folder, f"{name}.log"))
+             for name in ("print", "sync", "lunar")}
+    print("\nBytes gravados: " + ", ".join(f"{name}={size}" for name, size in sizes.items()))
+
+
+if __name__ == "__main__":
+    main()
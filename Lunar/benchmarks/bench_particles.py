@@ -0,0 +1,100 @@
+"""
+BENCHMARK - ParticleSystem
+Mede o tempo por frame (step + rasterização + paint) e a área repintada
+para várias quantidades de partículas na plataforma Qt offscreen.
+
+Uso: python benchmarks/bench_particles.py [--frames 200] [--size 1400x900]
+"""
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from PySide6.QtWidgets import QApplication
+
+from src.ui.components.particles import ParticleSystem
+
+PARTICLE_COUNTS = (60, 250, 1000, 2500, 5000)
+
+# (nome, kwargs do ParticleSystem)
+MODES = (
+    ("full", {"dirty_regions": False}),
+    ("dirty", {"dirty_regions": True}),
+    ("dirty+bg", {"dirty_regions": True, "background": "#141414"}),
+)
+
+
+class MeasuredParticleSystem(ParticleSystem):
+    """ParticleSystem que contabiliza a área entregue ao paintEvent"""
+
+    painted_pixels = 0
+
+    def paintEvent(self, event):
+        for rect in event.region():
+            self.painted_pixels += rect.width() * rect.height()
+        super().paintEvent(event)
+
+
+def measure(count, width, height, frames, options):
+    """Retorna (tempos de frame em ms, fração média da área repintada)"""
+    widget = MeasuredParticleSystem(particle_count=count, **options)
+    widget.clock.unsubscribe(widget)  # O benchmark controla os frames
+    widget.resize(width, height)
+    widget.show()
+    QApplication.processEvents()
+
+    for _ in range(10):  # Aquecimento
+        widget.update_particles()
+        QApplication.processEvents()
+
+    widget.painted_pixels = 0
+    samples = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        widget.update_particles()
+        QApplication.processEvents()
+        samples.append((time.perf_counter() - start) * 1000.0)
+
+    area = widget.painted_pixels / (frames * width * height)
+    widget.close()
+    widget.deleteLater()
+    QApplication.processEvents()
+
+    samples.sort()
+    return samples, area
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do ParticleSystem")
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--size", default="1400x900")
+    args = parser.parse_args()
+
+    width, height = (int(v) for v in args.size.lower().split("x"))
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    print(f"ParticleSystem {width}x{height}, {args.frames} frames")
+    print(f"{'mode':>9} {'particles':>10} {'mean ms':>9} {'p50 ms':>9} {'p95 ms':>9} {'area':>7}")
+
+    for name, options in MODES:
+        results = {}
+        for count in PARTICLE_COUNTS:
+            samples, area = measure(count, width, height, args.frames, options)
+            mean = sum(samples) / len(samples)
+            p50 = samples[len(samples) // 2]
+            p95 = samples[int(len(samples) * 0.95) - 1]
+            results[count] = p50
+            print(f"{name:>9} {count:>10} {mean:>9.3f} {p50:>9.3f} {p95:>9.3f} {area:>6.1%}")
+
+        ratio = results[PARTICLE_COUNTS[-1]] / results[PARTICLE_COUNTS[0]]
+        print(f"{name:>9} p50 {PARTICLE_COUNTS[-1]} / {PARTICLE_COUNTS[0]}: {ratio:.2f}x")
+
+    del app
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,331 @@
+"""
+BENCHMARK - Renderização dos widgets customizados
+Renderiza MiniGraphWidget, ParticleSystem, ProgressButton, SwitchButton e o
+Dashboard completo em QImage, em vários tamanhos e devicePixelRatio, na
+plataforma Qt offscreen. Cada DPR roda num processo próprio com
+QT_SCALE_FACTOR, então os widgets enxergam a escala de verdade.
+
+Por caso: p50/p95/p99 do tempo de paint, memória Python transitória por
+frame (pico do tracemalloc), blocos Python que sobram por frame (vazamento)
+e FPS sustentável (1000 / p95). Compara com o baseline gravado e sai com
+código 1 quando algum caso piora além do limite (por padrão no p50, que
+varia bem menos entre rodadas que o p95/p99).
+
+Uso: python benchmarks/bench_render.py [--frames 100] [--repeat 3] [--threshold 0.25]
+     python benchmarks/bench_render.py --save-baseline
+     python benchmarks/bench_render.py --only graph --images /tmp/render
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "render_baseline.json")
+DEVICE_PIXEL_RATIOS = (1.0, 1.5, 2.0)
+DEFAULT_THRESHOLD = 0.25    # Piora relativa tolerada (25%)
+DEFAULT_METRIC = "p50"
+MIN_REGRESSION_MS = 0.05    # Abaixo disso a diferença é ruído do relógio
+MIN_REGRESSION_KB = 1.0
+DEFAULT_REPEAT = 3          # Rodadas por caso (fica a mais rápida)
+ALLOC_FRAMES = 20           # Frames medidos com tracemalloc (passada separada)
+
+# (nome, tamanhos)
+CASES = (
+    ("graph", ((120, 40), (300, 100), (600, 200))),
+    ("particles", ((800, 600), (1400, 900), (2560, 1440))),
+    ("progress_button", ((200, 48), (320, 64))),
+    ("switch", ((50, 24),)),
+    ("dashboard", ((1100, 700), (1400, 900))),
+)
+
+
+# ----------------------------------------------------------------------
+# Widgets: cada fábrica devolve (widget, avança um frame)
+
+def make_graph():
+    import numpy as np
+    from src.ui.components.hardware_graphs import MiniGraphWidget
+
+    rng = np.random.default_rng(7)
+    widget = MiniGraphWidget(history_points=3600)
+    widget.set_color("#50E3C2")
+    widget.add_data_points(np.clip(np.cumsum(rng.normal(0, 2, 3600)) + 50, 0, 100))
+
+    def step(frame):
+        widget.add_data_point(50 + 40 * np.sin(frame / 10.0))
+    return widget, step
+
+
+def make_particles():
+    from src.ui.components.particles import ParticleSystem
+
+    widget = ParticleSystem(background="#141414")
+    widget.clock.unsubscribe(widget)   # O benchmark controla os frames
+
+    def step(frame):
+        widget.update_particles()
+    return widget, step
+
+
+def make_progress_button():
+    from src.ui.components.progress_button import ProgressButton
+
+    widget = ProgressButton("START SPOOFING")
+    widget.start_loading()
+
+    def step(frame):
+        widget.set_progress(frame % 101)
+    return widget, step
+
+
+def make_switch():
+    from src.ui.components.switch import SwitchButton
+
+    widget = SwitchButton()
+
+    def step(frame):
+        widget.set_circle_position(3 + frame % 27)
+    return widget, step
+
+
+def make_dashboard():
+    from src.core.telemetry_sampler import TelemetrySampler
+    from src.ui.components.dashboard import Dashboard
+
+    widget = Dashboard()
+    widget.suspend()   # Sem amostras do sampler: o benchmark alimenta os gráficos
+    TelemetrySampler.instance().stop()
+    graphs = [getattr(widget, name) for name in ("cpu_graph", "memory_graph", "disk_graph")
+              if hasattr(widget, name)]
+
+    def step(frame):
+        for offset, graph in enumerate(graphs):
+            graph.add_data_point((frame * 7 + offset * 30) % 100)
+    return widget, step
+
+
+FACTORIES = {
+    "graph": make_graph,
+    "particles": make_particles,
+    "progress_button": make_progress_button,
+    "switch": make_switch,
+    "dashboard": make_dashboard,
+}
+
+
+# ----------------------------------------------------------------------
+# Medição (processo filho, um DPR)
+
+def percentile(samples, fraction):
+    return samples[min(len(samples) - 1, int(len(samples) * fraction))]
+
+
+def measure(name, size, frames, images=None):
+    from PySide6.QtGui import QColor, QImage
+    from PySide6.QtWidgets import QApplication
+    from src.ui.adapters.theme_manager import ThemeManager
+
+    widget, step = FACTORIES[name]()
+    widget.setFixedSize(*size)
+    widget.show()
+    QApplication.processEvents()
+
+    dpr = widget.devicePixelRatioF()
+    width, height = widget.width(), widget.height()
+    image = QImage(round(width * dpr), round(height * dpr), QImage.Format_ARGB32_Premultiplied)
+    image.setDevicePixelRatio(dpr)
+    background = QColor(ThemeManager.instance().variable("background"))
+
+    def frame(number):
+        step(number)
+        image.fill(background)
+        widget.render(image)
+
+    for number in range(10):   # Aquecimento (caches, fontes, glifos)
+        frame(number)
+
+    samples = []
+    for number in range(frames):
+        start = time.perf_counter()
+        frame(number)
+        samples.append((time.perf_counter() - start) * 1000.0)
+    samples.sort()
+
+    # Memória: passada separada (tracemalloc deixa tudo mais lento)
+    tracemalloc.start()
+    peaks = []
+    blocks = sys.getallocatedblocks()
+    for number in range(ALLOC_FRAMES):
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        frame(number)
+        peaks.append(tracemalloc.get_traced_memory()[1] - before)
+    leaked = (sys.getallocatedblocks() - blocks) / ALLOC_FRAMES
+    tracemalloc.stop()
+
+    if images:
+        os.makedirs(images, exist_ok=True)
+        image.save(os.path.join(images, f"{name}_{width}x{height}@{dpr:g}x.png"))
+
+    widget.close()
+    widget.deleteLater()
+    QApplication.processEvents()
+
+    mean = sum(samples) / len(samples)
+    p95 = percentile(samples, 0.95)
+    return {
+        "case": f"{name} {size[0]}x{size[1]} @{dpr:g}x",
+        "mean": mean,
+        "p50": percentile(samples, 0.50),
+        "p95": p95,
+        "p99": percentile(samples, 0.99),
+        "fps": 1000.0 / p95 if p95 > 0 else float("inf"),
+        "alloc_kb": sum(peaks) / len(peaks) / 1024.0,
+        "blocks": leaked,
+    }
+
+
+def child(args):
+    from PySide6.QtWidgets import QApplication
+    from src.ui.adapters.theme_manager import ThemeManager
+
+    from src.core.telemetry_sampler import TelemetrySampler
+
+    app = QApplication(sys.argv)
+    app.setStyleSheet(ThemeManager.instance().stylesheet())
+    # Sem TelemetryStore: o benchmark não cria arquivo de histórico
+    TelemetrySampler.ephemeral()
+
+    cases = [(name, size) for name, sizes in CASES if not args.only or args.only in name
+             for size in sizes]
+
+    # Rodadas intercaladas entre os casos; fica a rodada com o menor p50 de
+    # cada caso (ruído da máquina só deixa as medidas mais lentas)
+    best = {}
+    for _ in range(args.repeat):
+        for name, size in cases:
+            result = measure(name, size, args.frames, args.images)
+            if result["case"] not in best or result["p50"] < best[result["case"]]["p50"]:
+                best[result["case"]] = result
+    for result in best.values():
+        print(json.dumps(result), flush=True)
+
+    from src.core.telemetry_sampler import TelemetrySampler
+    TelemetrySampler.instance().stop()
+    del app
+
+
+# ----------------------------------------------------------------------
+# Baseline
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD, metric=DEFAULT_METRIC):
+    """Linhas (resultado, base, variação, falhou) por caso"""
+    rows = []
+    for result in results:
+        base = baseline.get(result["case"])
+        if base is None:
+            rows.append((result, None, None, False))
+            continue
+        change = (result[metric] - base[metric]) / base[metric] if base[metric] else 0.0
+        slower = (result[metric] > base[metric] * (1.0 + threshold)
+                  and result[metric] - base[metric] > MIN_REGRESSION_MS)
+        heavier = (result["alloc_kb"] > base["alloc_kb"] * (1.0 + threshold)
+                   and result["alloc_kb"] - base["alloc_kb"] > MIN_REGRESSION_KB)
+        rows.append((result, base, change, slower or heavier))
+    return rows
+
+
+def run(frames=100, dprs=DEVICE_PIXEL_RATIOS, only=None, images=None, repeat=DEFAULT_REPEAT):
+    """Roda todos os casos (um processo por DPR) e devolve a lista de resultados"""
+    results = []
+    for dpr in dprs:
+        env = dict(os.environ, QT_SCALE_FACTOR=f"{dpr:g}", QT_QPA_PLATFORM="offscreen")
+        command = [sys.executable, os.path.abspath(__file__), "--child",
+                   "--frames", str(frames), "--repeat", str(repeat)]
+        if only:
+            command += ["--only", only]
+        if images:
+            command += ["--images", images]
+        output = subprocess.run(command, capture_output=True, text=True, cwd=ROOT, env=env)
+        if output.returncode != 0:
+            raise RuntimeError(f"DPR {dpr:g}: {output.stderr.strip()[-2000:]}")
+        results += [json.loads(line) for line in output.stdout.splitlines() if line.startswith("{")]
+    return results
+
+
+def load_baseline(path=BASELINE_PATH):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def save_baseline(results, path=BASELINE_PATH):
+    from PySide6 import __version__ as pyside_version
+    data = {
+        "python": platform.python_version(),
+        "pyside": pyside_version,
+        "platform": platform.platform(),
+        "cases": {result.pop("case"): result for result in [dict(r) for r in results]},
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de renderização dos widgets")
+    parser.add_argument("--frames", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT,
+                        help="Rodadas por caso; vale a de menor p50")
+    parser.add_argument("--dpr", type=float, nargs="+", default=list(DEVICE_PIXEL_RATIOS))
+    parser.add_argument("--only", help="Só casos cujo nome contém este texto")
+    parser.add_argument("--images", help="Pasta onde gravar o último frame de cada caso (PNG)")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Piora relativa tolerada antes de falhar (0.25 = 25%%)")
+    parser.add_argument("--metric", choices=("p50", "p95", "p99", "mean"), default=DEFAULT_METRIC)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args)
+        return 0
+
+    results = run(args.frames, args.dpr, args.only, args.images, args.repeat)
+    if args.save_baseline:
+        save_baseline(results, args.baseline)
+        print(f"Baseline gravado em {args.baseline} ({len(results)} casos)")
+
+    baseline = load_baseline(args.baseline)
+    rows = compare(results, baseline["cases"] if baseline else {}, args.threshold, args.metric)
+
+    print(f"Renderização offscreen, {args.frames} frames por caso (melhor de {args.repeat}); "
+          f"limite +{args.threshold:.0%} em {args.metric}")
+    print(f"{'case':<34} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'fps':>7} "
+          f"{'alloc KB':>9} {'blocks':>7} {'vs base':>8}")
+    failed = 0
+    for result, base, change, regression in rows:
+        delta = "novo" if base is None else f"{change:+.0%}"
+        flag = "  FALHOU" if regression else ""
+        failed += regression
+        print(f"{result['case']:<34} {result['p50']:8.3f} {result['p95']:8.3f} {result['p99']:8.3f} "
+              f"{result['fps']:7.0f} {result['alloc_kb']:9.1f} {result['blocks']:7.1f} {delta:>8}{flag}")
+
+    if failed:
+        print(f"\n{failed} caso(s) acima do limite")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,399 @@
+"""
+SOAK - MainWindow rodando por muito tempo (vazamentos)
+Sobe a MainWindow completa na plataforma Qt offscreen, com telemetria
+sintética em tempo real (replay em loop) e navegação sintética: troca de
+página, de tema, switches de módulos, botão de spoofing, HUD de desempenho
+e redimensionamento. A cada intervalo registra RSS, heap Python
+(tracemalloc), QObjects vivos, widgets, objetos do coletor e estatísticas
+do GC.
+
+Depois do aquecimento, cada métrica tem a inclinação (regressão linear)
+convertida para crescimento por hora. Falha só crescimento sustentado: a
+inclinação passa do limite E a mediana do último terço passa a do primeiro
+terço por mais que o mínimo da métrica (picos isolados não reprovam).
+
+O relatório JSON (chaves ordenadas, valores arredondados) é feito para
+diff entre versões; --compare imprime a comparação com um relatório
+anterior. Sai com código 1 se alguma métrica reprovar.
+
+Uso: python benchmarks/bench_soak.py [--duration 600] [--interval 10]
+     [--report soak_report.json] [--compare relatorio_anterior.json]
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import Counter
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import psutil
+import PySide6
+from PySide6.QtCore import QEventLoop, QObject, QTimer
+from PySide6.QtWidgets import QApplication
+
+from src.core.telemetry_sampler import TelemetrySampler
+from src.ui.adapters.theme_manager import ThemeManager
+from src.utils.telemetry_trace import synthetic_trace, write_trace
+
+REPORT_VERSION = 1
+PAGES = ("dashboard", "tools", "system_info", "settings")
+SIZES = ((1400, 900), (1200, 800), (1600, 1000))
+TOP_TYPES = 15            # Tipos que mais cresceram no relatório
+TOP_ALLOCATIONS = 15      # Linhas do tracemalloc que mais cresceram
+TRACE_FRAMES = 1          # Frames por alocação no tracemalloc (1 = linha)
+
+# Métrica -> (descrição, limite padrão por hora, crescimento mínimo para reprovar)
+METRICS = {
+    "rss_mb":      ("RSS do processo (MB)", 30.0, 4.0),
+    "heap_mb":     ("heap Python, tracemalloc (MB)", 10.0, 1.0),
+    "py_objects":  ("objetos rastreados pelo GC", 20000.0, 2000.0),
+    "qobjects":    ("QObjects vivos", 200.0, 20.0),
+    "widgets":     ("QWidgets vivos", 100.0, 10.0),
+}
+
+
+class DummyController:
+    status = "Ready"
+
+
+def run_loop(seconds):
+    # Loop local: app.quit() emitiria aboutToQuit, que para o sampler
+    loop = QEventLoop()
+    QTimer.singleShot(int(seconds * 1000), loop.quit)
+    loop.exec()
+
+
+def median(values):
+    values = sorted(values)
+    middle = len(values) // 2
+    return values[middle] if len(values) % 2 else (values[middle - 1] + values[middle]) / 2.0
+
+
+def slope_per_hour(times, values):
+    """Inclinação da regressão linear (unidades por hora)"""
+    count = len(times)
+    mean_t = sum(times) / count
+    mean_v = sum(values) / count
+    spread = sum((t - mean_t) ** 2 for t in times)
+    if not spread:
+        return 0.0
+    return sum((t - mean_t) * (v - mean_v) for t, v in zip(times, values)) / spread * 3600.0
+
+
+def live_qobjects(app):
+    """QObjects alcançáveis a partir da aplicação e das janelas de topo"""
+    objects = app.findChildren(QObject)
+    for widget in app.topLevelWidgets():
+        objects.append(widget)
+        objects.extend(widget.findChildren(QObject))
+    return objects
+
+
+class SyntheticUser:
+    """Ações de navegação sorteadas (com semente) sobre a MainWindow"""
+
+    def __init__(self, window, seed):
+        self.window = window
+        self.rng = random.Random(seed)
+        self.theme = ThemeManager.instance()
+        self.actions = Counter()
+        self.page = "dashboard"
+
+    def step(self):
+        action = self.rng.choice((self.navigate, self.navigate, self.navigate,
+                                  self.toggle_module, self.toggle_module,
+                                  self.spoof, self.switch_theme, self.toggle_hud, self.resize))
+        action()
+        self.actions[action.__name__] += 1
+
+    def navigate(self):
+        self.page = self.rng.choice([page for page in PAGES if page != self.page])
+        self.window.sidebar.on_navigation_click(self.page)
+
+    def toggle_module(self):
+        dashboard = self.window.dashboard
+        if dashboard is None or not dashboard.isVisible():
+            return self.navigate()
+        switch = self.rng.choice(list(dashboard.module_switches.values()))
+        switch.setChecked(not switch.isChecked())
+
+    def spoof(self):
+        dashboard = self.window.dashboard
+        if dashboard is None or not dashboard.isVisible():
+            return self.navigate()
+        if dashboard.spoof_button.isEnabled():
+            dashboard.spoof_button.click()
+
+    def switch_theme(self):
+        themes = [theme for theme in self.theme.themes() if theme != self.theme.current]
+        if themes:
+            # apply() e não set_theme(): não grava o tema no config.json
+            self.theme.apply(self.window, self.rng.choice(themes))
+
+    def toggle_hud(self):
+        # Sem toggle_perf_hud: não grava o estado no config.json
+        self.window.perf_hud.toggle()
+
+    def resize(self):
+        self.window.resize(*self.rng.choice(SIZES))
+
+
+class SoakProbe:
+    """Coleta as amostras de memória/objetos/GC"""
+
+    def __init__(self, app, heap):
+        self.app = app
+        self.heap = heap
+        self.process = psutil.Process()
+        self.started = time.monotonic()
+        self.samples = []
+
+    def sample(self, phase):
+        # Coleta completa antes de contar: só sobra o que está realmente vivo
+        gc.collect()
+        stats = gc.get_stats()
+        heap_current, heap_peak = tracemalloc.get_traced_memory() if self.heap else (0, 0)
+        qobjects = live_qobjects(self.app)
+        sample = {
+            "t": round(time.monotonic() - self.started, 1),
+            "phase": phase,
+            "rss_mb": round(self.process.memory_info().rss / 1024 / 1024, 2),
+            "heap_mb": round(heap_current / 1024 / 1024, 3),
+            "heap_peak_mb": round(heap_peak / 1024 / 1024, 3),
+            "py_objects": len(gc.get_objects()),
+            "allocated_blocks": sys.getallocatedblocks(),
+            "qobjects": len(qobjects),
+            "widgets": len(QApplication.allWidgets()),
+            "gc_collections": [generation["collections"] for generation in stats],
+            "gc_uncollectable": sum(generation["uncollectable"] for generation in stats),
+            "gc_garbage": len(gc.garbage),
+        }
+        del qobjects
+        self.samples.append(sample)
+        return sample
+
+
+def type_counts():
+    gc.collect()
+    return Counter(type(obj).__name__ for obj in gc.get_objects())
+
+
+def qobject_counts(app):
+    return Counter(type(obj).__name__ for obj in live_qobjects(app))
+
+
+def top_growth(before, after, limit):
+    growth = after.copy()
+    growth.subtract(before)
+    return [[name, count] for name, count in growth.most_common(limit) if count > 0]
+
+
+def analyse(samples, limits):
+    """Crescimento de cada métrica depois do aquecimento"""
+    measured = [sample for sample in samples if sample["phase"] == "soak"]
+    result = {}
+    for metric, (description, _, minimum) in METRICS.items():
+        values = [sample[metric] for sample in measured]
+        if len(values) < 3:
+            result[metric] = {"description": description, "passed": True, "samples": len(values)}
+            continue
+        third = max(1, len(values) // 3)
+        growth = median(values[-third:]) - median(values[:third])
+        slope = slope_per_hour([sample["t"] for sample in measured], values)
+        sustained = growth > minimum
+        result[metric] = {
+            "description": description,
+            "start": values[0],
+            "end": values[-1],
+            "growth": round(growth, 3),
+            "slope_per_hour": round(slope, 3),
+            "limit_per_hour": limits[metric],
+            "sustained": sustained,
+            "passed": not (sustained and slope > limits[metric]),
+            "samples": len(values),
+        }
+
+    # Lixo que o GC não consegue liberar não pode aparecer durante o soak
+    uncollectable = (measured[-1]["gc_uncollectable"] - measured[0]["gc_uncollectable"]
+                     if measured else 0)
+    result["gc_uncollectable"] = {
+        "description": "objetos incoletáveis novos",
+        "growth": uncollectable,
+        "passed": uncollectable == 0,
+    }
+    return result
+
+
+def compare(report, previous):
+    print(f"\nComparação com {previous['meta'].get('label') or 'relatório anterior'}")
+    print(f"{'métrica':<18} {'antes/h':>12} {'agora/h':>12} {'cresc. antes':>13} {'cresc. agora':>13}")
+    for metric in METRICS:
+        new = report["growth"].get(metric, {})
+        old = previous.get("growth", {}).get(metric, {})
+        print(f"{metric:<18} {old.get('slope_per_hour', 0):12.2f} {new.get('slope_per_hour', 0):12.2f} "
+              f"{old.get('growth', 0):13.2f} {new.get('growth', 0):13.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Soak da MainWindow (vazamentos de memória/objetos)")
+    parser.add_argument("--duration", type=float, default=600.0, help="Segundos de soak (após o aquecimento)")
+    parser.add_argument("--warmup", type=float, default=30.0, help="Segundos de aquecimento (fora da análise)")
+    parser.add_argument("--interval", type=float, default=10.0, help="Segundos entre amostras")
+    parser.add_argument("--action-interval", type=float, default=0.25,
+                        help="Segundos entre ações de navegação sintética")
+    parser.add_argument("--telemetry-rate", type=float, default=10.0, help="Amostras/s da telemetria sintética")
+    parser.add_argument("--evict-after", type=float, default=20.0,
+                        help="Páginas escondidas destruídas após N s (suspensas na metade)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-tracemalloc", action="store_true", help="Sem heap Python (menos overhead)")
+    parser.add_argument("--report", default="soak_report.json")
+    parser.add_argument("--label", help="Nome da versão no relatório (ex.: tag do release)")
+    parser.add_argument("--compare", help="Relatório anterior para comparar")
+    for metric, (description, limit, _) in METRICS.items():
+        parser.add_argument(f"--max-{metric.replace('_', '-')}", type=float, default=limit,
+                            dest=f"max_{metric}", help=f"Limite por hora: {description}")
+    args = parser.parse_args()
+    limits = {metric: getattr(args, f"max_{metric}") for metric in METRICS}
+
+    heap = not args.no_tracemalloc
+    if heap:
+        tracemalloc.start(TRACE_FRAMES)
+
+    app = QApplication(sys.argv)
+    app.setStyleSheet(ThemeManager.instance().stylesheet())
+
+    # Telemetria sintética em tempo real, em loop (sem TelemetryStore em disco)
+    folder = tempfile.mkdtemp(prefix="lunar-soak-")
+    trace = os.path.join(folder, "trace.bin")
+    write_trace(trace, synthetic_trace(60.0, rate=args.telemetry_rate, seed=args.seed))
+    TelemetrySampler.replaying(trace, speed=1.0, loop=True)
+
+    from src.ui.main_window import MainWindow
+    window = MainWindow(DummyController())
+    window.show()
+    run_loop(0.5)   # initialize_ui roda no singleShot da própria janela
+    window.content_stack.evict_after = args.evict_after
+    window.content_stack.suspend_after = args.evict_after / 2.0
+
+    user = SyntheticUser(window, args.seed)
+    actions = QTimer()
+    actions.setInterval(int(args.action_interval * 1000))
+    actions.timeout.connect(user.step)
+    actions.start()
+
+    probe = SoakProbe(app, heap)
+    print(f"Soak: {args.warmup:g} s de aquecimento + {args.duration:g} s, "
+          f"amostras a cada {args.interval:g} s")
+    print(f"{'t s':>7} {'fase':>7} {'RSS MB':>8} {'heap MB':>8} {'objetos':>9} {'QObjects':>9} {'widgets':>8}")
+
+    def report_sample(phase):
+        sample = probe.sample(phase)
+        print(f"{sample['t']:7.0f} {phase:>7} {sample['rss_mb']:8.1f} {sample['heap_mb']:8.2f} "
+              f"{sample['py_objects']:9d} {sample['qobjects']:9d} {sample['widgets']:8d}", flush=True)
+
+    elapsed = 0.0
+    while elapsed < args.warmup:
+        run_loop(min(args.interval, args.warmup - elapsed))
+        elapsed += args.interval
+        report_sample("warmup")
+
+    # Referências para "o que cresceu": contagens por tipo e snapshot do heap
+    types_before = type_counts()
+    qtypes_before = qobject_counts(app)
+    heap_before = tracemalloc.take_snapshot() if heap else None
+    report_sample("soak")
+
+    elapsed = 0.0
+    while elapsed < args.duration:
+        run_loop(min(args.interval, args.duration - elapsed))
+        elapsed += args.interval
+        report_sample("soak")
+
+    actions.stop()
+    types_after = type_counts()
+    qtypes_after = qobject_counts(app)
+    allocations = []
+    if heap:
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            (tracemalloc.Filter(False, tracemalloc.__file__),))
+        for stat in snapshot.compare_to(heap_before, "lineno")[:TOP_ALLOCATIONS]:
+            if stat.size_diff > 0:
+                frame = stat.traceback[0]
+                allocations.append([f"{os.path.relpath(frame.filename)}:{frame.lineno}",
+                                    round(stat.size_diff / 1024, 1), stat.count_diff])
+        del snapshot, heap_before
+
+    growth = analyse(probe.samples, limits)
+    passed = all(metric["passed"] for metric in growth.values())
+    report = {
+        "version": REPORT_VERSION,
+        "meta": {
+            "label": args.label,
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "pyside": PySide6.__version__,
+            "platform": platform.platform(),
+            "qpa": os.environ.get("QT_QPA_PLATFORM"),
+            "duration": args.duration,
+            "warmup": args.warmup,
+            "interval": args.interval,
+            "action_interval": args.action_interval,
+            "telemetry_rate": args.telemetry_rate,
+            "evict_after": args.evict_after,
+            "seed": args.seed,
+            "tracemalloc": heap,
+            "actions": dict(user.actions),
+        },
+        "growth": growth,
+        "top_py_types": top_growth(types_before, types_after, TOP_TYPES),
+        "top_qobject_types": top_growth(qtypes_before, qtypes_after, TOP_TYPES),
+        "top_allocations": allocations,
+        "samples": probe.samples,
+        "passed": passed,
+    }
+    with open(args.report, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True, ensure_ascii=False)
+        f.write("\n")
+
+    print(f"\n{'métrica':<18} {'início':>10} {'fim':>10} {'cresc.':>10} {'por hora':>10} {'limite/h':>10}")
+    for metric in METRICS:
+        result = growth[metric]
+        if "slope_per_hour" not in result:
+            continue
+        status = "ok" if result["passed"] else "FALHOU"
+        print(f"{metric:<18} {result['start']:10.2f} {result['end']:10.2f} {result['growth']:10.2f} "
+              f"{result['slope_per_hour']:10.2f} {result['limit_per_hour']:10.0f}  {status}")
+    print(f"{'gc_uncollectable':<18} {growth['gc_uncollectable']['growth']:>32}  "
+          f"{'ok' if growth['gc_uncollectable']['passed'] else 'FALHOU'}")
+    if report["top_py_types"]:
+        print("\nTipos Python que mais cresceram: " +
+              ", ".join(f"{name} +{count}" for name, count in report["top_py_types"][:5]))
+    if report["top_qobject_types"]:
+        print("QObjects que mais cresceram: " +
+              ", ".join(f"{name} +{count}" for name, count in report["top_qobject_types"][:5]))
+    print("Ações: " + ", ".join(f"{name} {count}" for name, count in sorted(user.actions.items())))
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(report, json.load(f))
+
+    print(f"\nRelatório: {args.report} ({'passou' if passed else 'REPROVADO'})")
+
+    TelemetrySampler.instance().stop()
+    window.hide()
+    window.deleteLater()
+    shutil.rmtree(folder)
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()
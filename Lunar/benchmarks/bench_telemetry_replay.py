@@ -0,0 +1,106 @@
+"""
+BENCHMARK - Telemetria até os pixels, com replay determinístico
+Alimenta o Dashboard com um trace de telemetria (sintético ou gravado com
+--record-telemetry) em vez do psutil, na plataforma Qt offscreen:
+
+  pipeline: replay pela thread do TelemetrySampler (coalescência + entrega
+            na GUI), medindo amostras por segundo e snapshots entregues
+  frames:   cada amostra do trace aplicada no Dashboard e repintada,
+            medindo o tempo telemetria -> pixels por amostra
+
+Uso: python benchmarks/bench_telemetry_replay.py [--rate 100] [--seconds 30]
+     [--speed 0] [--trace arquivo.bin] [--write arquivo.bin]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from PySide6.QtWidgets import QApplication
+
+from src.core.telemetry_sampler import TelemetrySampler
+from src.ui.adapters.theme_manager import ThemeManager
+from src.utils.telemetry_trace import read_trace, synthetic_trace, write_trace
+
+
+def stats(samples):
+    samples = sorted(samples)
+    mean = sum(samples) / len(samples)
+    return mean, samples[len(samples) // 2], samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do pipeline de telemetria com replay")
+    parser.add_argument("--trace", help="Trace gravado (padrão: sintético)")
+    parser.add_argument("--rate", type=float, default=100.0, help="Amostras/s do trace sintético")
+    parser.add_argument("--seconds", type=float, default=30.0, help="Duração do trace sintético")
+    parser.add_argument("--speed", type=float, default=0.0,
+                        help="Velocidade do replay no pipeline (1 = tempo real, 0 = máximo)")
+    parser.add_argument("--write", help="Grava o trace sintético neste caminho e sai")
+    parser.add_argument("--size", default="1100x700")
+    args = parser.parse_args()
+    width, height = (int(value) for value in args.size.split("x"))
+
+    path = args.write or args.trace
+    if args.write or not args.trace:
+        path = path or os.path.join(tempfile.mkdtemp(prefix="lunar-trace-"), "trace.bin")
+        count = write_trace(path, synthetic_trace(args.seconds, rate=args.rate))
+        print(f"Trace sintético: {count:,} amostras a {args.rate:g}/s, "
+              f"{os.path.getsize(path) / count:.0f} bytes/amostra ({path})")
+        if args.write:
+            return
+
+    app = QApplication(sys.argv)
+    app.setStyleSheet(ThemeManager.instance().stylesheet())
+
+    # O Dashboard pega o sampler compartilhado: instalar o replay antes
+    sampler = TelemetrySampler.replaying(path, speed=args.speed)
+    delivered = []
+    sampler.snapshot_ready.connect(lambda snapshot: delivered.append(snapshot.timestamp))
+    finished = []
+    sampler.replay_finished.connect(lambda: finished.append(time.perf_counter()))
+
+    from src.ui.components.dashboard import Dashboard
+    dashboard = Dashboard()
+    dashboard.resize(width, height)
+    dashboard.show()
+
+    start = time.perf_counter()
+    while not finished:
+        app.processEvents()
+        time.sleep(0.0005)
+    app.processEvents()
+    elapsed = finished[0] - start
+    total = sum(1 for _ in read_trace(path))
+
+    print(f"\nPipeline (speed {args.speed:g}): {total:,} amostras em {elapsed:.2f} s "
+          f"({total / elapsed:,.0f}/s); {len(delivered):,} snapshots entregues à GUI "
+          f"({total / max(1, len(delivered)):.1f} amostras por entrega)")
+
+    # Quadros determinísticos: a mesma sequência de amostras, uma por repintura
+    sampler.stop()
+    sampler.snapshot_ready.disconnect(dashboard.update_hardware_stats)
+    samples = []
+    for snapshot in read_trace(path):
+        started = time.perf_counter()
+        dashboard.update_hardware_stats(snapshot)
+        dashboard.repaint()
+        samples.append((time.perf_counter() - started) * 1000.0)
+
+    mean, p50, p95 = stats(samples)
+    print(f"\nTelemetria -> pixels ({width}x{height}, {len(samples):,} amostras)")
+    print(f"{'mean ms':>9} {'p50 ms':>9} {'p95 ms':>9} {'max fps':>9}")
+    print(f"{mean:9.2f} {p50:9.2f} {p95:9.2f} {1000.0 / p95:9.0f}")
+
+    dashboard.close()
+    if not args.trace:
+        os.remove(path)
+        os.rmdir(os.path.dirname(path))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+BENCHMARK - ThemeManager
+Mede, com a MainWindow completa na plataforma Qt offscreen:
+  - troca de tema sem cache (ler as folhas do disco, compilar, setStyleSheet)
+  - compilação a frio de um tema
+  - troca entre temas já compilados (apply na janela de topo)
+  - mudança de estado de um label: setStyleSheet vs propriedade dinâmica
+
+Uso: python benchmarks/bench_theme.py [--switches 40] [--states 400]
+"""
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from PySide6.QtWidgets import QApplication
+
+from src.core.telemetry_sampler import TelemetrySampler
+from src.ui.adapters.theme_manager import ThemeManager
+
+# Cores que o Dashboard aplicava via setStyleSheet antes das propriedades
+LEGACY_STATE_COLORS = ("#4ECDC4", "#FFD93D", "#FF6B6B")
+STATE_LEVELS = ("optimal", "moderate", "high")
+
+
+class DummyController:
+    status = "Ready"
+
+
+def timed(action, repeat):
+    samples = []
+    for i in range(repeat):
+        start = time.perf_counter()
+        action(i)
+        QApplication.processEvents()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    samples.sort()
+    return samples
+
+
+def report(name, samples):
+    mean = sum(samples) / len(samples)
+    p50 = samples[len(samples) // 2]
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+    print(f"{name:>28} {mean:9.3f} {p50:9.3f} {p95:9.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do ThemeManager")
+    parser.add_argument("--switches", type=int, default=40)
+    parser.add_argument("--states", type=int, default=400)
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    # Amostrador sem TelemetryStore: o benchmark não cria arquivo de histórico
+    TelemetrySampler.ephemeral()
+
+    from src.ui.main_window import MainWindow
+    window = MainWindow(DummyController())
+    window.initialize_ui()
+    window.show()
+    QApplication.processEvents()
+
+    manager = ThemeManager.instance()
+    label = window.dashboard.value_labels["STATUS"]
+
+    print(f"ThemeManager, {args.switches} trocas de tema, {args.states} mudanças de estado")
+    print(f"{'case':>28} {'mean ms':>9} {'p50 ms':>9} {'p95 ms':>9}")
+
+    themes = ("cyan", "dark")
+
+    def uncached_switch(i):
+        # Como antes do cache: folhas relidas do disco a cada troca
+        fresh = ThemeManager()
+        window.setStyleSheet(fresh.stylesheet(themes[i % 2]))
+
+    report("uncached read+compile+apply", timed(uncached_switch, args.switches))
+
+    def cold_compile(i):
+        fresh = ThemeManager()
+        fresh.stylesheet(fresh.themes()[i % len(fresh.themes())])
+
+    report("cold compile", timed(cold_compile, args.switches))
+
+    # Volta ao estado do app antes de medir as trocas compiladas
+    window.setStyleSheet("")
+    manager._applied.clear()
+    manager.apply(window, "dark")
+    QApplication.processEvents()
+
+    # Sem theme_changed: mesma carga de trabalho do caso sem cache
+    manager.blockSignals(True)
+    report("compiled apply", timed(lambda i: manager.apply(window, themes[i % 2]), args.switches))
+    manager.blockSignals(False)
+    report("compiled apply + particles", timed(lambda i: manager.apply(window, themes[i % 2]), args.switches))
+    report("compiled apply (no-op)", timed(lambda i: manager.apply(window, manager.current), args.switches))
+    manager.apply(window, "dark")
+
+    def legacy_state(i):
+        label.setStyleSheet(f"color: {LEGACY_STATE_COLORS[i % 3]};")
+
+    report("state via setStyleSheet", timed(legacy_state, args.states))
+    label.setStyleSheet("")
+
+    report("state via property", timed(
+        lambda i: ThemeManager.set_state(label, "level", STATE_LEVELS[i % 3]), args.states))
+
+    TelemetrySampler.instance().stop()
+    window.hide()
+    window.deleteLater()
+    QApplication.processEvents()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+BENCHMARK - Watchdog de travamentos da GUI
+Provoca travamentos conhecidos no event loop (laço Python ocupado,
+time.sleep e código C que segura o GIL, em pontos diferentes e repetidos)
+com o StallWatchdog ligado e
+mede: atraso da detecção além do limite, erro da duração registrada,
+agrupamento por ponto e o custo de CPU do watchdog com a GUI ociosa.
+
+Uso: python benchmarks/bench_watchdog.py [--threshold 200] [--repeat 3]
+"""
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from PySide6.QtCore import QEventLoop, QTimer
+from PySide6.QtWidgets import QApplication
+
+from src.core.stall_watchdog import StallWatchdog
+from src.utils.logger import log_ring
+
+_GIL_RATE = 0.0   # Itens do sum(range()) por ms (calibrado no início)
+
+
+def busy_paint(ms):
+    """Simula um paintEvent caro (Python puro, solta o GIL a cada 5 ms)"""
+    end = time.perf_counter() + ms / 1000.0
+    total = 0
+    while time.perf_counter() < end:
+        total += 1
+    return total
+
+
+def blocking_io(ms):
+    """Simula uma chamada de E/S síncrona na GUI"""
+    time.sleep(ms / 1000.0)
+
+
+def gil_held(ms):
+    """Simula uma chamada C lenta que não solta o GIL (ex.: psutil): o watchdog também para"""
+    sum(range(int(_GIL_RATE * ms)))
+
+
+def _calibrate_gil():
+    """Itens por ms do sum(range()) nesta máquina"""
+    count = 2_000_000
+    start = time.perf_counter()
+    sum(range(count))
+    return count / ((time.perf_counter() - start) * 1000.0)
+
+
+def run_loop(seconds):
+    # Loop local: app.quit() emitiria aboutToQuit, que desliga o watchdog
+    loop = QEventLoop()
+    QTimer.singleShot(int(seconds * 1000), loop.quit)
+    loop.exec()
+
+
+def idle_cpu(seconds):
+    start = time.process_time()
+    run_loop(seconds)
+    return (time.process_time() - start) / seconds * 100.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do watchdog de travamentos")
+    parser.add_argument("--threshold", type=int, default=200, help="Limite em ms")
+    parser.add_argument("--repeat", type=int, default=3, help="Travamentos por ponto")
+    parser.add_argument("--idle", type=float, default=3.0, help="Segundos ociosos medidos")
+    args = parser.parse_args()
+
+    global _GIL_RATE
+    _GIL_RATE = _calibrate_gil()
+    app = QApplication(sys.argv)
+    watchdog = StallWatchdog(app, threshold_ms=args.threshold)
+
+    # Custo com a GUI ociosa: sem e com o watchdog
+    cpu_off = idle_cpu(args.idle)
+    watchdog.start()
+    cpu_on = idle_cpu(args.idle)
+
+    # Travamentos provocados: (função, duração em ms)
+    stalls = [(busy_paint, 600), (blocking_io, 400), (busy_paint, 350), (gil_held, 500)] * args.repeat
+    started = []
+
+    seq = log_ring().last_seq
+    for function, ms in stalls:
+        run_loop(0.3)
+        started.append(time.time())
+        function(ms)
+    run_loop(0.5)
+    watchdog.stop()
+    time.sleep(0.2)   # Log assíncrono: esperar a thread de escrita
+
+    entries = [entry for entry in log_ring().since(seq) if entry.name.endswith("stall_watchdog")]
+    stacks = sum(1 for entry in entries if "\n" in entry.message)
+
+    print(f"CPU ociosa: {cpu_off:.2f}% sem watchdog, {cpu_on:.2f}% com watchdog")
+    print(f"\nTravamentos provocados: {len(stalls)} (limite {args.threshold} ms)")
+    print(f"Detectados: {watchdog.stall_count}; pilhas registradas: {stacks}; "
+          f"linhas de log: {len(entries)}")
+
+    print(f"\n{'ponto':<44} {'vezes':>6} {'esperado':>9} {'média ms':>9} {'máx ms':>8}")
+    expected = {}
+    for function, ms in stalls:
+        expected.setdefault(function.__name__, []).append(ms)
+    for site in watchdog.sites.values():
+        wanted = expected.get(site.key[2], [])
+        mean_wanted = f"{sum(wanted) / len(wanted):9.0f}" if wanted else f"{'-':>9}"
+        print(f"{str(site):<44} {site.count:6d} {mean_wanted} "
+              f"{site.total_ms / max(1, site.count):9.0f} {site.longest_ms:8.0f}")
+
+
+if __name__ == "__main__":
+    main()
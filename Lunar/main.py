@@ -20,12 +20,24 @@ def setup_environment():
     if src_path not in sys.path:
         sys.path.insert(0, src_path)
 
+def setup_profiler():
+    """Liga o perfil de inicialização com --profile-startup[=arquivo.json]"""
+    from src.utils.startup_profiler import StartupProfiler
+
+    profiler = StartupProfiler.instance()
+    report_path = StartupProfiler.requested(sys.argv)
+    if report_path is not None:
+        # --profile-exit: fecha depois de gravar o relatório (CI / regressões)
+        profiler.enable(report_path, exit_when_done="--profile-exit" in sys.argv)
+    return profiler
+
 def main():
     """Função principal"""
     print("Inicializando Lunar Spoofer...")
 
     # Configurar ambiente
     setup_environment()
+    profiler = setup_profiler()
 
     # Verificar privilégios
     if not check_admin_privileges():
@@ -34,10 +46,12 @@ def main():
         return 1
 
     try:
-        from src.core.app import LunarApp
+        with profiler.phase("imports"):
+            from src.core.app import LunarApp
 
         # Criar e executar aplicação
-        app = LunarApp()
+        with profiler.phase("lunar_app"):
+            app = LunarApp()
         return app.run()
 
     except Exception as e:
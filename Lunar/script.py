@@ -1,49 +1,248 @@
+import argparse
+import codecs
+import fnmatch
 import os
-import pathlib
-
-def export_project_structure(root_dir, output_file):
-    # Lista de extensões de arquivos de código (personalizável)
-    code_extensions = {
-        '.py', '.js', '.html', '.css', '.java', '.c', '.cpp', '.cs', '.php', '.rb',
-        '.go', '.rs', '.ts', '.sql', '.json', '.xml', '.yaml', '.yml', '.md', '.cfg',
-        '.conf', '.ini', '.sh', '.bat', '.ps1', '.vue', '.jsx',
-        '.tsx', '.scss', '.sass', '.less', '.asm', '.swift', '.kt', '.dart'
-    }
-    
-    with open(output_file, 'w', encoding='utf-8') as outfile:
-        for root, dirs, files in os.walk(root_dir):
-            # Ignorar pastas de versão (personalizável)
-            ignore_dirs = {'.git', '__pycache__', 'node_modules', 'vendor', 'dist', 'build'}
-            dirs[:] = [d for d in dirs if d not in ignore_dirs]
-            
-            for file in files:
-                file_path = pathlib.Path(root) / file
-                relative_path = file_path.relative_to(root_dir)
-                
-                # Verificar se é um arquivo de código
-                if file_path.suffix.lower() in code_extensions:
+import sys
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# Lista de extensões de arquivos de código (personalizável)
+CODE_EXTENSIONS = {
+    '.py', '.js', '.html', '.css', '.java', '.c', '.cpp', '.cs', '.php', '.rb',
+    '.go', '.rs', '.ts', '.sql', '.json', '.xml', '.yaml', '.yml', '.md', '.cfg',
+    '.conf', '.ini', '.sh', '.bat', '.ps1', '.vue', '.jsx',
+    '.tsx', '.scss', '.sass', '.less', '.asm', '.swift', '.kt', '.dart'
+}
+
+# Ignorar pastas de versão (personalizável)
+IGNORE_DIRS = {'.git', '__pycache__', 'node_modules', 'vendor', 'dist', 'build'}
+
+OUTPUT_FILE = "projeto_completo.txt"
+SNIFF_SIZE = 8 * 1024             # Primeiro bloco lido para detectar binário/encoding
+STREAM_THRESHOLD = 1024 * 1024    # Acima disso o arquivo é copiado em pedaços
+CHUNK_SIZE = 256 * 1024           # Caracteres por pedaço na cópia em streaming
+PREFETCH_PER_WORKER = 4           # Leituras adiantadas por thread (limita a memória)
+DEFAULT_WORKERS = min(16, (os.cpu_count() or 1) * 2)
+
+
+class _Entry:
+    """Arquivo a exportar e o resultado da leitura na thread"""
+    __slots__ = ("path", "relative", "content", "encoding", "error")
+
+    def __init__(self, path, relative):
+        self.path = path
+        self.relative = relative
+        self.content = None     # Texto já lido (arquivos pequenos)
+        self.encoding = None    # Encoding do streaming (só arquivos grandes)
+        self.error = None
+
+
+def _display(relative):
+    """Caminho relativo como no cabeçalho: separador do sistema (como o os.walk)"""
+    return relative.replace("/", os.sep)
+
+
+def _matches(relative, patterns):
+    name = relative.rsplit("/", 1)[-1]
+    return any(fnmatch.fnmatch(relative, pattern) or fnmatch.fnmatch(name, pattern)
+               for pattern in patterns)
+
+
+def _wanted(relative, include, exclude):
+    if exclude and _matches(relative, exclude):
+        return False
+    if include:
+        return _matches(relative, include)
+    return os.path.splitext(relative)[1].lower() in CODE_EXTENSIONS
+
+
+def _list_dir(path, relative, exclude):
+    """Uma pasta: (arquivos, subpastas), cada um como (caminho, relativo) em ordem de nome"""
+    files, dirs = [], []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                child = f"{relative}/{entry.name}" if relative else entry.name
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in IGNORE_DIRS and not (exclude and _matches(child, exclude)):
+                            dirs.append((entry.path, child))
+                    elif entry.is_file():
+                        files.append((entry.path, child))
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    files.sort(key=lambda item: item[1])
+    dirs.sort(key=lambda item: item[1])
+    return files, dirs
+
+
+def scan_files(pool, root_dir, include=None, exclude=None, skip=()):
+    """
+    Varredura das pastas em paralelo, um nível por vez (um scandir por
+    pasta). A ordem do resultado é a do os.walk com nomes ordenados,
+    independente de qual thread terminou primeiro: a saída é determinística.
+    """
+    listings = {}
+    level = [(root_dir, "")]
+    while level:
+        results = pool.map(lambda item: _list_dir(item[0], item[1], exclude), level)
+        next_level = []
+        for (_, relative), (files, dirs) in zip(level, results):
+            listings[relative] = (files, dirs)
+            next_level.extend(dirs)
+        level = next_level
+
+    ordered = []
+    stack = [""]
+    while stack:
+        files, dirs = listings[stack.pop()]
+        ordered.extend(_Entry(path, relative) for path, relative in files
+                       if _wanted(relative, include, exclude)
+                       and os.path.abspath(path) not in skip)
+        stack.extend(relative for _, relative in reversed(dirs))
+    return ordered
+
+
+def _sniff_encoding(block):
+    """utf-8 se o bloco decodifica (pode terminar no meio de um caractere), senão latin-1"""
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(block, final=False)
+        return "utf-8"
+    except UnicodeDecodeError:
+        return "latin-1"
+
+
+def _universal_newlines(text):
+    # Mesmo resultado da leitura em modo texto (newline=None)
+    if "\r" not in text:
+        return text
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def read_entry(entry):
+    """
+    Thread de leitura. Arquivos pequenos são lidos inteiros e decodificados
+    em memória (o fallback para latin-1 não relê o disco); nos grandes só o
+    primeiro bloco é lido para escolher o encoding, e o escritor copia o
+    resto em pedaços.
+    """
+    try:
+        with open(entry.path, "rb") as infile:
+            block = infile.read(SNIFF_SIZE)
+            if b"\0" in block:
+                entry.content = f"[Arquivo binário ignorado: {_display(entry.relative)}]\n"
+                return entry
+
+            if os.fstat(infile.fileno()).st_size > STREAM_THRESHOLD:
+                entry.encoding = _sniff_encoding(block)
+                return entry
+
+            data = block + infile.read()
+        try:
+            text = data.decode("utf-8")
+        except UnicodeDecodeError:
+            # Bytes inválidos depois do primeiro bloco
+            text = data.decode("latin-1")
+        entry.content = _universal_newlines(text)
+    except Exception as e:
+        entry.error = f"[ERRO: {str(e)}]\n"
+    return entry
+
+
+def _copy_stream(entry, outfile):
+    """Arquivo grande: pedaços de CHUNK_SIZE, nunca o arquivo inteiro em memória"""
+    # utf-8 detectado no primeiro bloco: bytes inválidos adiante viram U+FFFD
+    errors = "replace" if entry.encoding == "utf-8" else "strict"
+    with open(entry.path, "r", encoding=entry.encoding, errors=errors, newline=None) as infile:
+        while True:
+            chunk = infile.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            outfile.write(chunk)
+
+
+def _ordered_reads(pool, entries, workers):
+    """Leituras em paralelo entregues na ordem da varredura (janela limitada)"""
+    window = deque()
+    queued = iter(entries)
+    for entry in queued:
+        window.append(pool.submit(read_entry, entry))
+        if len(window) >= workers * PREFETCH_PER_WORKER:
+            break
+    while window:
+        entry = window.popleft().result()
+        next_entry = next(queued, None)
+        if next_entry is not None:
+            window.append(pool.submit(read_entry, next_entry))
+        yield entry
+
+
+def export_project_structure(root_dir, output_file, include=None, exclude=None,
+                             workers=DEFAULT_WORKERS):
+    """
+    Exporta os arquivos de código de `root_dir` para um único arquivo texto
+    (cabeçalho `# caminho/relativo` seguido do conteúdo). Varredura e
+    leituras em paralelo, escrita em uma única thread na ordem da
+    varredura. Retorna (arquivos exportados, bytes escritos).
+    """
+    root_dir = os.path.abspath(root_dir)
+    skip = {os.path.abspath(output_file)}
+    workers = max(1, workers)
+    exported = 0
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="export") as pool:
+        entries = scan_files(pool, root_dir, include, exclude, skip)
+
+        with open(output_file, 'w', encoding='utf-8') as outfile:
+            for entry in _ordered_reads(pool, entries, workers):
+                # Escrever no arquivo de saída
+                outfile.write(f"# {_display(entry.relative)}\n\n")
+                if entry.error is not None:
+                    outfile.write(entry.error)
+                elif entry.content is not None:
+                    outfile.write(entry.content)
+                else:
                     try:
-                        with open(file_path, 'r', encoding='utf-8') as infile:
-                            content = infile.read()
-                    except UnicodeDecodeError:
-                        try:
-                            with open(file_path, 'r', encoding='latin-1') as infile:
-                                content = infile.read()
-                        except Exception:
-                            content = f"[ERRO: Não foi possível ler o arquivo {relative_path}]\n"
-                    except Exception as e:
-                        content = f"[ERRO: {str(e)}]\n"
-
-                    # Escrever no arquivo de saída
-                    outfile.write(f"# {relative_path}\n\n")
-                    outfile.write(content)
-                    outfile.write("\n\n")
+                        _copy_stream(entry, outfile)
+                    except Exception:
+                        outfile.write(f"[ERRO: Não foi possível ler o arquivo {_display(entry.relative)}]\n")
+                outfile.write("\n\n")
+                exported += 1
+            written = outfile.tell()
+
+    return exported, written
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Exporta os arquivos de código de um projeto para um único arquivo texto")
+    parser.add_argument("root", nargs="?",
+                        help="Pasta do projeto (padrão: pergunta no terminal, ou a pasta atual)")
+    parser.add_argument("-o", "--output", default=OUTPUT_FILE, help=f"Arquivo gerado (padrão: {OUTPUT_FILE})")
+    parser.add_argument("--include", action="append", default=[], metavar="GLOB",
+                        help="Só arquivos que casam com o glob (repetível; substitui as extensões padrão)")
+    parser.add_argument("--exclude", action="append", default=[], metavar="GLOB",
+                        help="Ignora arquivos/pastas que casam com o glob (repetível)")
+    parser.add_argument("-j", "--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"Threads de varredura/leitura (padrão: {DEFAULT_WORKERS})")
+    parser.add_argument("-q", "--quiet", action="store_true")
+    return parser.parse_args(argv)
+
 
 if __name__ == "__main__":
-    project_root = input("Digite o caminho completo do projeto (ou Enter para usar o diretório atual): ").strip()
+    args = parse_args()
+    project_root = args.root
+    if project_root is None and sys.stdin.isatty():
+        project_root = input("Digite o caminho completo do projeto (ou Enter para usar o diretório atual): ").strip()
     if not project_root:
         project_root = os.getcwd()
-    
-    output_filename = "projeto_completo.txt"
-    export_project_structure(project_root, output_filename)
-    print(f"Arquivo '{output_filename}' gerado com sucesso!")
\ No newline at end of file
+
+    started = time.perf_counter()
+    count, size = export_project_structure(project_root, args.output, args.include,
+                                           args.exclude, args.workers)
+    if not args.quiet:
+        print(f"Arquivo '{args.output}' gerado com sucesso! "
+              f"({count} arquivos, {size / 1024:.0f} KB em {time.perf_counter() - started:.2f} s)")
@@ -0,0 +1,274 @@
+import time
+from PySide6.QtCore import QObject, QTimer, QEvent, Qt, Signal
+from PySide6.QtGui import QGuiApplication
+from PySide6.QtWidgets import QWidget
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class _Subscription:
+    """Um widget inscrito no relógio e o callback chamado a cada frame"""
+    __slots__ = ("widget", "callback", "interval", "next_due", "last_tick")
+
+    def __init__(self, widget, callback, fps):
+        self.widget = widget
+        self.callback = callback
+        self.interval = 1.0 / fps
+        self.next_due = 0.0
+        self.last_tick = None
+
+
+class AnimationClock(QObject):
+    """
+    Relógio central de animação compartilhado pelos widgets animados.
+
+    Um único QTimer alimenta todos os inscritos, que recebem o tempo
+    decorrido (em segundos) desde o último frame. O timer só roda enquanto
+    algum inscrito está visível em uma janela não minimizada e a aplicação
+    está ativa; caso contrário fica parado (0 FPS). O FPS também cai quando
+    o custo dos callbacks passa de `frame_budget_ms` ou quando o uso de CPU
+    do próprio processo passa de `cpu_threshold`.
+    """
+
+    fps_changed = Signal(int)
+    ticked = Signal(float)  # Custo do frame em ms (emitido depois dos callbacks)
+
+    ADAPT_INTERVAL = 1.0  # Segundos entre reavaliações do FPS
+    MAX_FRAME_DELTA = 0.25  # Limite do dt entregue após uma pausa
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """Relógio compartilhado pelo processo"""
+        if cls._instance is None:
+            cls._instance = cls(QGuiApplication.instance())
+        return cls._instance
+
+    def __init__(self, parent=None, target_fps=30, min_fps=10, background_fps=0,
+                 cpu_threshold=35.0, frame_budget_ms=8.0):
+        super().__init__(parent)
+        self._subscriptions = {}
+        self._tracked = set()  # Widgets com destroyed já conectado
+        self._watched_windows = set()
+
+        self.target_fps = target_fps
+        self.min_fps = min_fps
+        self.background_fps = background_fps
+        self.cpu_threshold = cpu_threshold
+        self.frame_budget_ms = frame_budget_ms
+
+        self.fps = target_fps  # FPS atual após a adaptação
+        self._frame_cost = 0.0  # Média móvel do custo dos callbacks (ms)
+        self._cpu_percent = 0.0
+        self._adapt_wall = time.perf_counter()
+        self._adapt_cpu = time.process_time()
+
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self._tick)
+
+        # Reavaliação agendada (coalesce vários eventos de visibilidade)
+        self._reschedule_timer = QTimer(self)
+        self._reschedule_timer.setSingleShot(True)
+        self._reschedule_timer.timeout.connect(self._reschedule)
+
+        app = QGuiApplication.instance()
+        if app is not None:
+            app.applicationStateChanged.connect(self._schedule_reschedule)
+
+    def configure(self, **options):
+        """Altera fps/limites em tempo de execução (mesmos nomes do construtor)"""
+        for name, value in options.items():
+            if name not in ("target_fps", "min_fps", "background_fps",
+                            "cpu_threshold", "frame_budget_ms"):
+                raise ValueError(f"Opção desconhecida do AnimationClock: {name}")
+            setattr(self, name, value)
+        self.fps = max(self.min_fps, min(self.fps, self.target_fps))
+        self._schedule_reschedule()
+
+    @property
+    def cpu_percent(self):
+        """Uso de CPU do processo medido na última janela de adaptação"""
+        return self._cpu_percent
+
+    @property
+    def running(self):
+        return self._timer.isActive()
+
+    @property
+    def interval(self):
+        """Intervalo atual do timer em ms"""
+        return self._timer.interval()
+
+    def subscribe(self, widget, callback, fps=30):
+        """Inscreve `callback(dt)` para ser chamado enquanto `widget` estiver visível"""
+        key = id(widget)
+        is_new = key not in self._subscriptions
+        self._subscriptions[key] = _Subscription(widget, callback, fps)
+
+        if is_new:
+            widget.installEventFilter(self)
+            # Uma conexão por widget: assinar de novo após unsubscribe não acumula
+            if key not in self._tracked:
+                self._tracked.add(key)
+                widget.destroyed.connect(lambda *args, k=key: self._forget(k))
+            self._watch_window(widget)
+
+        self._schedule_reschedule()
+
+    def unsubscribe(self, widget):
+        """Remove o widget do relógio"""
+        subscription = self._subscriptions.pop(id(widget), None)
+        if subscription is not None:
+            widget.removeEventFilter(self)
+        self._schedule_reschedule()
+
+    def is_subscribed(self, widget):
+        return id(widget) in self._subscriptions
+
+    def _forget(self, key):
+        """Widget destruído: descartar sem tocar no objeto C++"""
+        self._subscriptions.pop(key, None)
+        self._tracked.discard(key)
+        self._schedule_reschedule()
+
+    def _watch_window(self, widget):
+        """Observa minimizar/restaurar/ocultar da janela de topo do widget"""
+        window = widget.window()
+        self._watch_object(window)
+
+        # O QWindow nativo recebe os eventos de exposição (janela encoberta)
+        handle = window.windowHandle()
+        if handle is not None:
+            self._watch_object(handle)
+
+    def _watch_object(self, obj):
+        key = id(obj)
+        if key in self._watched_windows:
+            return
+        obj.installEventFilter(self)
+        self._watched_windows.add(key)
+        obj.destroyed.connect(lambda *args, k=key: self._watched_windows.discard(k))
+
+    def eventFilter(self, watched, event):
+        event_type = event.type()
+        if event_type in (QEvent.Show, QEvent.Hide, QEvent.WindowStateChange, QEvent.Expose):
+            if event_type == QEvent.Show and isinstance(watched, QWidget):
+                # O widget pode ter mudado de janela (ou ganho um QWindow) desde a inscrição
+                self._watch_window(watched)
+            self._schedule_reschedule()
+        return False
+
+    def _schedule_reschedule(self, *args):
+        if not self._reschedule_timer.isActive():
+            self._reschedule_timer.start(0)
+
+    @staticmethod
+    def _is_visible(widget):
+        """Visível na tela: mostrado, janela não minimizada e não encoberta"""
+        if not widget.isVisible():
+            return False
+        window = widget.window()
+        if window.isMinimized():
+            return False
+        handle = window.windowHandle()
+        return handle is None or handle.isExposed()
+
+    def _application_active(self):
+        app = QGuiApplication.instance()
+        return app is None or app.applicationState() == Qt.ApplicationActive
+
+    def _effective_fps(self):
+        """FPS que o timer deve usar agora (0 = parado)"""
+        visible = [s for s in self._subscriptions.values() if self._is_visible(s.widget)]
+        if not visible:
+            return 0
+
+        wanted = max(1.0 / s.interval for s in visible)
+        fps = min(self.fps, wanted)
+        if not self._application_active():
+            fps = min(fps, self.background_fps)
+        return int(round(fps))
+
+    def _reschedule(self):
+        """Liga, desliga ou ajusta o intervalo do timer"""
+        fps = self._effective_fps()
+        if fps <= 0:
+            if self._timer.isActive():
+                self._timer.stop()
+                self.fps_changed.emit(0)
+            return
+
+        interval = max(1, int(1000 / fps))
+        if not self._timer.isActive():
+            # Retomada: descartar o dt acumulado durante a pausa
+            for subscription in self._subscriptions.values():
+                subscription.last_tick = None
+            self._adapt_wall = time.perf_counter()
+            self._adapt_cpu = time.process_time()
+            self._timer.start(interval)
+            self.fps_changed.emit(fps)
+        elif self._timer.interval() != interval:
+            self._timer.setInterval(interval)
+            self.fps_changed.emit(fps)
+
+    def _tick(self):
+        """Um frame: chama os inscritos visíveis cujo intervalo venceu"""
+        now = time.perf_counter()
+        slack = self._timer.interval() / 2000.0  # Alinha inscritos com fps menores
+        any_visible = False
+
+        for subscription in list(self._subscriptions.values()):
+            if not self._is_visible(subscription.widget):
+                subscription.last_tick = None
+                continue
+            any_visible = True
+            if now + slack < subscription.next_due:
+                continue
+
+            if subscription.last_tick is None:
+                dt = subscription.interval
+            else:
+                dt = min(now - subscription.last_tick, self.MAX_FRAME_DELTA)
+            subscription.last_tick = now
+            subscription.next_due = now + subscription.interval
+
+            try:
+                subscription.callback(dt)
+            except Exception as e:
+                logger.exception("Erro no callback de animação: %s", e)
+
+        cost = (time.perf_counter() - now) * 1000.0
+        self._frame_cost = self._frame_cost * 0.9 + cost * 0.1
+        self.ticked.emit(cost)
+
+        if not any_visible:
+            self._reschedule()
+            return
+
+        if now - self._adapt_wall >= self.ADAPT_INTERVAL:
+            self._adapt(now)
+
+    def _adapt(self, now):
+        """Reduz ou recupera o FPS conforme custo por frame e CPU do processo"""
+        cpu_now = time.process_time()
+        self._cpu_percent = (cpu_now - self._adapt_cpu) / (now - self._adapt_wall) * 100.0
+        self._adapt_wall = now
+        self._adapt_cpu = cpu_now
+
+        over = (self._cpu_percent > self.cpu_threshold or
+                self._frame_cost > self.frame_budget_ms)
+        relaxed = (self._cpu_percent < self.cpu_threshold * 0.5 and
+                   self._frame_cost < self.frame_budget_ms * 0.5)
+
+        if over and self.fps > self.min_fps:
+            self.fps = max(self.min_fps, int(self.fps * 2 / 3))
+        elif relaxed and self.fps < self.target_fps:
+            self.fps = min(self.target_fps, self.fps + 5)
+        else:
+            return
+
+        self._reschedule()
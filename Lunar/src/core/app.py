@@ -1,46 +1,146 @@
 import sys
-import os
+import math
 from PySide6.QtWidgets import QApplication, QMessageBox
 from PySide6.QtCore import QTimer
 from PySide6.QtGui import QIcon
 
+from src.core.config import Config
+from src.core.stall_watchdog import StallWatchdog
+from src.utils import asset_bundle
+from src.utils.icon_manager import IconManager
+from src.utils.startup_profiler import StartupProfiler
+from src.utils.logger import LOG_FILE, get_logger, set_level, setup_logging
+
+logger = get_logger(__name__)
+
+
+def _argv_option(argv, name):
+    """Valor de `--nome=valor` em argv, senão None"""
+    for arg in argv:
+        if arg.startswith(name + "="):
+            return arg.split("=", 1)[1]
+    return None
+
+
+def _replay_speed(argv):
+    """--replay-speed como número finito >= 0; valor inválido vira 1.0 (tempo real)"""
+    value = _argv_option(argv, "--replay-speed")
+    if not value:
+        return 1.0
+    try:
+        speed = float(value)
+    except ValueError:
+        speed = math.nan
+    if not (math.isfinite(speed) and speed >= 0):
+        logger.error("--replay-speed inválido: %r (use um número >= 0, 0 = o mais rápido "
+                     "possível); usando 1.0", value)
+        return 1.0
+    return speed
+
+
 class LunarApp:
     def __init__(self):
+        self.profiler = StartupProfiler.instance()
+
         # Criar QApplication PRIMEIRO
-        self.qt_app = QApplication(sys.argv)
+        with self.profiler.phase("qapplication"):
+            self.qt_app = QApplication(sys.argv)
         self.main_window = None
 
         # Configuração básica
-        self.setup_application()
+        with self.profiler.phase("setup_application"):
+            self.setup_application()
 
     def setup_application(self):
         """Configurações iniciais seguras"""
         self.qt_app.setApplicationName("Lunar Spoofer")
         self.qt_app.setApplicationVersion("1.0.0")
 
-        # Tentar carregar ícone, mas não crítico
+        # Log também em arquivo (logs/lunar.log), no nível do config.json
+        config = Config.instance()
+        setup_logging(level=config.get("log_level", "INFO"), log_file=LOG_FILE)
+        config.subscribe("log_level", set_level)
+
+        # Watchdog do event loop: pilha da thread principal no log quando a GUI travar
+        config.subscribe("stall_threshold_ms", StallWatchdog.instance().set_threshold,
+                         initial=True)
+
+        # Gravação/replay de telemetria (testes de desempenho reproduzíveis)
+        self.setup_telemetry()
+
+        # Pacote de assets (lunar_assets.rcc), se foi gerado pelo build
+        asset_bundle.register()
+
+        # Decodificar ícones e ler fontes em segundo plano enquanto o resto
+        # inicializa; as fontes são registradas antes de criar os widgets
+        assets = IconManager.instance()
+        assets.preload()
+        assets.load_fonts()
+
+        # Tentar carregar ícone, mas não crítico (relativo ao projeto, não ao CWD)
         try:
-            icon_path = "assets/icons/app.ico"
-            if os.path.exists(icon_path):
+            icon_path = asset_bundle.resolve("assets/icons/app.ico")
+            if icon_path is not None:
                 self.qt_app.setWindowIcon(QIcon(icon_path))
         except:
             pass  # Ícone não é crítico
 
+    def setup_telemetry(self):
+        """
+        --replay-telemetry=trace.bin alimenta o dashboard com um trace gravado
+        (--replay-speed=N, 0 = o mais rápido possível; --replay-loop);
+        --record-telemetry=trace.bin grava as leituras da sessão.
+        metrics_port / telemetry_export_file no config.json ligam o exportador.
+        """
+        self.exporter = None
+        replay = _argv_option(sys.argv, "--replay-telemetry")
+        record = _argv_option(sys.argv, "--record-telemetry")
+        config = Config.instance()
+        port = config.get("metrics_port")
+        export_file = config.get("telemetry_export_file")
+        if replay is None and record is None and port is None and not export_file:
+            return
+
+        from src.core.telemetry_sampler import TelemetrySampler
+        if replay is not None:
+            speed = _replay_speed(sys.argv)
+            try:
+                TelemetrySampler.replaying(replay, speed=speed, loop="--replay-loop" in sys.argv)
+                logger.info("Replay de telemetria: %s (velocidade %g)", replay, speed)
+            except OSError as e:
+                logger.error("Replay de telemetria indisponível, usando leituras reais: %s", e)
+        if record is not None:
+            TelemetrySampler.instance().record(record)
+
+        # Exportador local (config.json): reaproveita as leituras do sampler
+        if port is not None or export_file:
+            from src.core.telemetry_exporter import TelemetryExporter
+            try:
+                self.exporter = TelemetryExporter(
+                    TelemetrySampler.instance(), port=port, path=export_file,
+                    fmt=config.get("telemetry_export_format", "csv"))
+                self.exporter.start()
+                self.qt_app.aboutToQuit.connect(self.exporter.stop)
+            except Exception as e:
+                logger.error("Exportador de telemetria indisponível: %s", e)
+
     def initialize_components(self):
         """Inicialização segura dos componentes"""
         try:
             # Importar aqui para evitar dependências circulares
-            from src.ui.main_window import MainWindow
+            with self.profiler.phase("import_main_window"):
+                from src.ui.main_window import MainWindow
 
             # Inicializar controladores básicos (simplificado por enquanto)
             spoofer_controller = self.create_dummy_controller()
 
             # Criar janela principal
-            self.main_window = MainWindow(spoofer_controller)
+            with self.profiler.phase("main_window"):
+                self.main_window = MainWindow(spoofer_controller)
             return True
 
         except Exception as e:
-            print(f"Erro crítico na inicialização: {e}")
+            logger.exception("Erro crítico na inicialização: %s", e)
             self.show_error_message(str(e))
             return False
 
@@ -64,18 +164,20 @@ class LunarApp:
 
     def run(self):
         """Executa a aplicação de forma segura"""
-        print("Iniciando Lunar Spoofer...")
+        logger.info("Iniciando Lunar Spoofer...")
 
         try:
             if self.initialize_components():
-                self.main_window.show()
-                print("Aplicação iniciada com sucesso")
+                self.profiler.mark_next_paint(self.main_window, "first_paint")
+                with self.profiler.phase("show"):
+                    self.main_window.show()
+                logger.info("Aplicação iniciada com sucesso")
                 return self.qt_app.exec()
             else:
-                print("Falha na inicialização")
+                logger.error("Falha na inicialização")
                 return 1
 
         except Exception as e:
-            print(f"Erro fatal: {e}")
+            logger.exception("Erro fatal: %s", e)
             self.show_error_message(str(e))
             return 1
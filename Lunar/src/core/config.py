@@ -1,17 +1,148 @@
+import atexit
 import json
 import os
+import threading
+import time
+import weakref
+from contextlib import contextmanager
 from pathlib import Path
 
-class Config:
-    def __init__(self):
-        self.config_path = Path("config.json")
+from PySide6.QtCore import QCoreApplication, QObject, Signal
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Na pasta do projeto, não na pasta de onde o app foi iniciado (o .tmp da
+# gravação atômica fica ao lado)
+PROJECT_DIR = Path(__file__).resolve().parent.parent.parent
+CONFIG_FILE = PROJECT_DIR / "config.json"
+
+# Write-behind: grava depois de SAVE_DELAY s sem mudanças, mas nunca
+# segura uma mudança por mais de SAVE_MAX_DELAY s (ex.: resize contínuo)
+SAVE_DELAY = 0.5
+SAVE_MAX_DELAY = 2.0
+
+# Configurações vivas, gravadas ao sair do processo
+_OPEN_CONFIGS = weakref.WeakSet()
+
+
+@atexit.register
+def _close_all():
+    for config in list(_OPEN_CONFIGS):
+        config.close()
+
+
+class _ConfigWriter(threading.Thread):
+    """Thread que grava o config.json fora da GUI (debounce + troca atômica)"""
+
+    def __init__(self, config):
+        super().__init__(name="config-writer", daemon=True)
+        self.config = config
+        self.condition = threading.Condition()
+        self.first_change = None   # Momento da mudança mais antiga não gravada
+        self.last_change = None    # ... e da mais recente
+        self.written = 0           # Gerações gravadas (para flush)
+        self.generation = 0        # Gerações pedidas
+        self.stopping = False
+
+    def schedule(self):
+        with self.condition:
+            now = time.monotonic()
+            if self.first_change is None:
+                self.first_change = now
+            self.last_change = now
+            self.generation += 1
+            self.condition.notify()
+
+    def run(self):
+        while True:
+            with self.condition:
+                while not self.stopping and self.first_change is None:
+                    self.condition.wait()
+                if self.first_change is None:
+                    return
+
+                # Espera o debounce (ou o limite máximo), acordando a cada mudança
+                while not self.stopping:
+                    now = time.monotonic()
+                    due = min(self.last_change + SAVE_DELAY, self.first_change + SAVE_MAX_DELAY)
+                    if now >= due:
+                        break
+                    self.condition.wait(due - now)
+
+                generation = self.generation
+                self.first_change = self.last_change = None
+
+            self.config._write()
+
+            with self.condition:
+                self.written = generation
+                self.condition.notify_all()
+
+    def flush(self, timeout=None):
+        """Força a gravação do que estiver pendente e espera terminar"""
+        with self.condition:
+            target = self.generation
+            if self.written >= target:
+                return True
+            self.first_change = self.last_change = time.monotonic() - SAVE_MAX_DELAY
+            self.condition.notify_all()
+            return self.condition.wait_for(lambda: self.written >= target, timeout)
+
+    def stop(self):
+        with self.condition:
+            self.stopping = True
+            self.condition.notify_all()
+
+
+class Config(QObject):
+    """
+    Configuração em config.json com gravação em segundo plano.
+
+    `set()`/`update()` só alteram o dicionário em memória, emitem
+    `changed(chave, valor)` e agendam a gravação: uma thread grava depois
+    de um intervalo sem mudanças (arquivo temporário + os.replace, então o
+    config.json nunca fica pela metade). A GUI nunca espera pelo disco;
+    `flush()` grava na hora (ex.: ao sair).
+    """
+
+    changed = Signal(str, object)
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """Configuração compartilhada pelo processo"""
+        if cls._instance is None:
+            cls._instance = cls(parent=QCoreApplication.instance())
+        return cls._instance
+
+    def __init__(self, config_path=CONFIG_FILE, parent=None):
+        super().__init__(parent)
+        self.config_path = Path(config_path)
         self.default_config = {
             "theme": "purple",
             "window_size": [1400, 900],
             "auto_start": False,
             "admin_required": True,
-            "log_level": "INFO"
+            "log_level": "INFO",
+            "perf_hud": False,
+            "stall_threshold_ms": 500,   # 0 desliga o watchdog da GUI
+            # Exportação de telemetria (desligada por padrão): porta local do
+            # /metrics e arquivo CSV/NDJSON com as amostras
+            "metrics_port": None,
+            "telemetry_export_file": None,
+            "telemetry_export_format": "csv"
         }
+        self._lock = threading.RLock()
+        self._batch = None          # Mudanças acumuladas dentro de batch()
+        self._subscribers = {}      # chave -> [callbacks]
+
+        self._writer = _ConfigWriter(self)
+        self._writer.start()
+        _OPEN_CONFIGS.add(self)
+
         self.config = self.load_config()
 
     def load_config(self):
@@ -21,30 +152,108 @@ class Config:
                 with open(self.config_path, 'r', encoding='utf-8') as f:
                     return {**self.default_config, **json.load(f)}
             except Exception as e:
-                print(f"Erro ao carregar config: {e}")
-                return self.default_config
+                logger.error("Erro ao carregar config: %s", e)
+                return dict(self.default_config)
         else:
-            self.save_config(self.default_config)
-            return self.default_config
+            # Primeira execução: o padrão é gravado em segundo plano
+            self._writer.schedule()
+            return dict(self.default_config)
 
     def save_config(self, config=None):
-        """Salva configuração no arquivo"""
-        if config is None:
-            config = self.config
+        """Agenda a gravação da configuração (não bloqueia)"""
+        if config is not None:
+            with self._lock:
+                self.config = dict(config)
+        self._writer.schedule()
+        return True
 
+    def _write(self):
+        """Grava o config.json (thread de gravação)"""
+        with self._lock:
+            text = json.dumps(self.config, indent=4, ensure_ascii=False)
+
+        temporary = self.config_path.with_name(self.config_path.name + ".tmp")
         try:
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=4, ensure_ascii=False)
+            with open(temporary, 'w', encoding='utf-8') as f:
+                f.write(text)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temporary, self.config_path)
             return True
         except Exception as e:
-            print(f"Erro ao salvar config: {e}")
+            logger.error("Erro ao salvar config: %s", e)
             return False
 
+    def flush(self, timeout=5.0):
+        """Grava agora o que estiver pendente; retorna False se estourar o timeout"""
+        return self._writer.flush(timeout)
+
+    def close(self):
+        """Grava o que estiver pendente e encerra a thread de gravação"""
+        if self._writer.is_alive():
+            self.flush()
+            self._writer.stop()
+            self._writer.join(timeout=5.0)
+
     def get(self, key, default=None):
         """Obtém valor da configuração"""
         return self.config.get(key, default)
 
     def set(self, key, value):
         """Define valor da configuração"""
-        self.config[key] = value
-        return self.save_config()
+        return self.update({key: value})
+
+    def update(self, values=None, **changes):
+        """Altera várias chaves de uma vez: um sinal por chave alterada, uma gravação"""
+        if values:
+            changes = {**values, **changes}
+
+        with self._lock:
+            changed = {key: value for key, value in changes.items()
+                       if key not in self.config or self.config[key] != value}
+            self.config.update(changed)
+            if self._batch is not None:
+                self._batch.update(changed)
+                return True
+
+        if changed:
+            self._writer.schedule()
+            self._notify(changed)
+        return True
+
+    @contextmanager
+    def batch(self):
+        """Agrupa set()/update(): sinais e gravação só no final do bloco"""
+        with self._lock:
+            outer = self._batch is not None
+            if not outer:
+                self._batch = {}
+        try:
+            yield self
+        finally:
+            if not outer:
+                with self._lock:
+                    changed, self._batch = self._batch, None
+                if changed:
+                    self._writer.schedule()
+                    self._notify(changed)
+
+    def subscribe(self, key, callback, initial=False):
+        """callback(valor) quando a chave mudar (com `initial`, também agora)"""
+        self._subscribers.setdefault(key, []).append(callback)
+        if initial:
+            callback(self.get(key))
+
+    def unsubscribe(self, key, callback):
+        callbacks = self._subscribers.get(key, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+
+    def _notify(self, changed):
+        for key, value in changed.items():
+            self.changed.emit(key, value)
+            for callback in list(self._subscribers.get(key, ())):
+                try:
+                    callback(value)
+                except Exception as e:
+                    logger.exception("Erro ao notificar mudança de '%s': %s", key, e)
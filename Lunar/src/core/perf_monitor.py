@@ -0,0 +1,227 @@
+import gc
+import time
+from collections import deque
+
+from PySide6.QtCore import QCoreApplication, QObject, QTimer, Qt
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+WINDOW = 2.0              # Segundos de histórico usados nas estatísticas
+SAMPLES_MAX = 2000        # Amostras guardadas por série (limite de memória)
+LAG_PROBE_INTERVAL = 100  # ms do timer que mede o atraso do event loop
+
+# Classes com paintEvent medido (preenchido por @profiled_paint)
+_PAINT_CLASSES = {}
+
+
+def profiled_paint(name):
+    """
+    Registra o paintEvent da classe para o PerfMonitor. Não altera a
+    classe: o paintEvent só é trocado pela versão medida enquanto o
+    monitor está ligado, então com o HUD desligado o custo é zero.
+    """
+    def register(cls):
+        _PAINT_CLASSES[cls] = name
+        return cls
+    return register
+
+
+class _Series:
+    """Amostras (instante, valor) dos últimos WINDOW segundos"""
+    __slots__ = ("samples",)
+
+    def __init__(self):
+        self.samples = deque(maxlen=SAMPLES_MAX)
+
+    def add(self, now, value):
+        self.samples.append((now, value))
+
+    def clear(self):
+        self.samples.clear()
+
+    def stats(self, now):
+        """(contagem por segundo, média, p95, máximo) na janela"""
+        samples = self.samples
+        while samples and samples[0][0] < now - WINDOW:
+            samples.popleft()
+        if not samples:
+            return 0.0, 0.0, 0.0, 0.0
+        values = sorted(value for _, value in samples)
+        count = len(values)
+        return (count / WINDOW, sum(values) / count,
+                values[min(count - 1, int(count * 0.95))], values[-1])
+
+
+class PerfMonitor(QObject):
+    """
+    Instrumentação para o HUD de desempenho (ligada só enquanto o HUD está
+    visível).
+
+    Ligado, mede o tempo de cada paintEvent registrado com
+    @profiled_paint, o jitter do timer do AnimationClock e da entrega de
+    snapshots do TelemetrySampler, o atraso do event loop (timer de
+    LAG_PROBE_INTERVAL ms) e as pausas do coletor de lixo. Desligado,
+    restaura os métodos originais e desconecta tudo.
+    """
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """Monitor compartilhado pelo processo"""
+        if cls._instance is None:
+            cls._instance = cls(QCoreApplication.instance())
+        return cls._instance
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.enabled = False
+        self.paints = {}            # nome -> _Series do tempo de paint (ms)
+        self.jitter = {}            # nome do timer -> _Series do desvio (ms)
+        self.frames = _Series()     # Ticks do AnimationClock (valor = custo em ms)
+        self.loop_lag = _Series()
+        self.gc_pauses = _Series()
+
+        self._originals = {}        # classe -> paintEvent original
+        self._last_fired = {}       # nome do timer -> instante do último disparo
+        self._gc_started = None
+
+        self._lag_timer = QTimer(self)
+        self._lag_timer.setTimerType(Qt.PreciseTimer)
+        self._lag_timer.setInterval(LAG_PROBE_INTERVAL)
+        self._lag_timer.timeout.connect(self._probe_lag)
+        self._lag_expected = 0.0
+
+    # ------------------------------------------------------------------
+
+    def start(self):
+        """Liga a instrumentação (chamadas repetidas são ignoradas)"""
+        if self.enabled:
+            return
+        self.enabled = True
+        for series in [self.frames, self.loop_lag, self.gc_pauses,
+                       *self.paints.values(), *self.jitter.values()]:
+            series.clear()
+        self._last_fired.clear()
+
+        for cls, name in _PAINT_CLASSES.items():
+            self._wrap_paint(cls, name)
+
+        from src.core.animation_clock import AnimationClock
+        from src.core.telemetry_sampler import TelemetrySampler
+        AnimationClock.instance().ticked.connect(self._on_clock_tick)
+        TelemetrySampler.instance().snapshot_ready.connect(self._on_snapshot)
+
+        gc.callbacks.append(self._on_gc)
+        self._lag_expected = time.perf_counter() + LAG_PROBE_INTERVAL / 1000.0
+        self._lag_timer.start()
+        logger.debug("PerfMonitor ligado (%d paintEvents medidos)", len(self._originals))
+
+    def stop(self):
+        """Desliga a instrumentação e restaura os paintEvents originais"""
+        if not self.enabled:
+            return
+        self.enabled = False
+        for cls, original in self._originals.items():
+            cls.paintEvent = original
+        self._originals.clear()
+
+        from src.core.animation_clock import AnimationClock
+        from src.core.telemetry_sampler import TelemetrySampler
+        AnimationClock.instance().ticked.disconnect(self._on_clock_tick)
+        TelemetrySampler.instance().snapshot_ready.disconnect(self._on_snapshot)
+
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+        self._lag_timer.stop()
+        logger.debug("PerfMonitor desligado")
+
+    # ------------------------------------------------------------------
+    # Coleta
+
+    def _wrap_paint(self, cls, name):
+        original = cls.__dict__.get("paintEvent")
+        if original is None:
+            return
+        series = self.paints.setdefault(name, _Series())
+
+        def paintEvent(widget, event):
+            started = time.perf_counter()
+            try:
+                original(widget, event)
+            finally:
+                done = time.perf_counter()
+                series.add(done, (done - started) * 1000.0)
+
+        self._originals[cls] = original
+        cls.paintEvent = paintEvent
+
+    def _record_interval(self, name, now, expected):
+        """Desvio entre o intervalo real desde o último disparo e o esperado"""
+        last = self._last_fired.get(name)
+        self._last_fired[name] = now
+        if last is not None:
+            series = self.jitter.setdefault(name, _Series())
+            series.add(now, abs((now - last) - expected) * 1000.0)
+
+    def _on_clock_tick(self, cost):
+        # Emitido no fim do frame, com o custo dos callbacks
+        from src.core.animation_clock import AnimationClock
+        now = time.perf_counter()
+        last = self._last_fired.get("animation")
+        self._record_interval("animation", now, AnimationClock.instance().interval / 1000.0)
+        if last is not None:
+            self.frames.add(now, cost)
+
+    def _on_snapshot(self, snapshot):
+        from src.core.telemetry_sampler import TelemetrySampler
+        rates = TelemetrySampler.instance().rates()
+        self._record_interval("stats", time.perf_counter(), min(rates.values()))
+
+    def _probe_lag(self):
+        now = time.perf_counter()
+        self.loop_lag.add(now, max(0.0, (now - self._lag_expected) * 1000.0))
+        self._lag_expected = now + LAG_PROBE_INTERVAL / 1000.0
+
+    def _on_gc(self, phase, info):
+        if phase == "start":
+            self._gc_started = time.perf_counter()
+        elif self._gc_started is not None:
+            now = time.perf_counter()
+            self.gc_pauses.add(now, (now - self._gc_started) * 1000.0)
+            self._gc_started = None
+
+    # ------------------------------------------------------------------
+
+    def process_stats(self):
+        """
+        CPU (% de um núcleo), RSS (bytes) e threads do próprio processo, do
+        último snapshot do TelemetrySampler (a GUI não consulta o psutil).
+        None até o grupo "process" ser lido pela primeira vez.
+        """
+        from src.core.telemetry_sampler import TelemetrySampler
+        snapshot = TelemetrySampler.instance().latest
+        if snapshot is None or not snapshot.process_threads:
+            return None
+        return {
+            "cpu": snapshot.process_cpu_percent,
+            "rss": snapshot.process_rss,
+            "threads": snapshot.process_threads,
+        }
+
+    def report(self):
+        """Estatísticas da janela atual para o HUD"""
+        now = time.perf_counter()
+        fps, frame_cost, _, _ = self.frames.stats(now)
+        gc_rate, _, _, gc_max = self.gc_pauses.stats(now)
+        return {
+            "fps": fps,
+            "frame_cost": frame_cost,
+            "paints": {name: series.stats(now) for name, series in sorted(self.paints.items())},
+            "jitter": {name: series.stats(now) for name, series in sorted(self.jitter.items())},
+            "loop_lag": self.loop_lag.stats(now),
+            "gc": (gc_rate * WINDOW, gc_max),
+            "process": self.process_stats(),
+        }
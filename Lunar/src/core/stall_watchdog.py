@@ -0,0 +1,198 @@
+import os
+import sys
+import threading
+import time
+import traceback
+
+from PySide6.QtCore import QCoreApplication, QObject, QTimer
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+HEARTBEAT_INTERVAL = 100      # ms entre batimentos do event loop
+CHECK_INTERVAL = 0.1          # s entre verificações da thread do watchdog
+DEFAULT_THRESHOLD = 500       # ms sem batimento para contar como travamento
+STACK_LIMIT = 30              # Frames registrados por pilha
+HANG_FACTOR = 10              # Ponto repetido travado há N x o limite: registra a pilha de novo
+SUSPEND_CPU_RATIO = 0.1       # Watchdog parado com CPU do processo abaixo disso: suspensão
+
+# Frames deste diretório identificam o ponto do travamento (o frame mais
+# interno do projeto, não o do Qt/stdlib onde a pilha termina)
+SOURCE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class StallSite:
+    """Um ponto de travamento: quantas vezes e quanto tempo no total"""
+    __slots__ = ("key", "count", "total_ms", "longest_ms")
+
+    def __init__(self, key):
+        self.key = key
+        self.count = 0
+        self.total_ms = 0.0
+        self.longest_ms = 0.0
+
+    def __str__(self):
+        filename, lineno, name = self.key
+        project = os.path.dirname(SOURCE_DIR)
+        if filename.startswith(project + os.sep):
+            filename = os.path.relpath(filename, project)
+        return f"{filename}:{lineno} em {name}"
+
+
+class StallWatchdog(QObject):
+    """
+    Vigia do event loop da GUI.
+
+    Um QTimer na thread principal registra um batimento a cada
+    HEARTBEAT_INTERVAL ms; uma thread separada confere o último batimento.
+    Passado `threshold_ms` sem batimento, a pilha Python da thread
+    principal é capturada com sys._current_frames() e registrada no log.
+    Travamentos no mesmo ponto só registram a pilha na primeira vez; ao
+    destravar, cada travamento sai em uma linha com a duração e a contagem
+    daquele ponto.
+
+    Código C que segura o GIL (ex.: uma chamada lenta do psutil) também
+    para a thread do watchdog; ela detecta o travamento ao acordar e a
+    pilha sai quando o GIL é liberado, no frame que fez a chamada. Só
+    conta como suspensão do sistema um intervalo em que o processo quase
+    não usou CPU (segurando o GIL, a thread principal continua rodando).
+    """
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """Watchdog compartilhado pelo processo"""
+        if cls._instance is None:
+            cls._instance = cls(QCoreApplication.instance())
+        return cls._instance
+
+    def __init__(self, parent=None, threshold_ms=DEFAULT_THRESHOLD):
+        super().__init__(parent)
+        self.threshold_ms = threshold_ms
+        self.sites = {}             # chave -> StallSite
+        self.stall_count = 0
+
+        self._main_thread = threading.main_thread().ident
+        self._beat = time.monotonic()
+        self._stop = threading.Event()
+        self._thread = None
+
+        self._heartbeat = QTimer(self)
+        self._heartbeat.setInterval(HEARTBEAT_INTERVAL)
+        self._heartbeat.timeout.connect(self._on_heartbeat)
+
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.stop)
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def set_threshold(self, threshold_ms):
+        """Limite em ms; 0 ou None desliga o watchdog"""
+        self.threshold_ms = threshold_ms or 0
+        if self.threshold_ms > 0:
+            self.start()
+        else:
+            self.stop()
+
+    def start(self):
+        """Liga o batimento; a vigilância começa no primeiro (com o event loop rodando)"""
+        if self._heartbeat.isActive() or not self.threshold_ms:
+            return
+        self._heartbeat.start()
+
+    def stop(self):
+        self._heartbeat.stop()
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join(timeout=1.0)
+        self._thread = None
+
+    def _on_heartbeat(self):
+        self._beat = time.monotonic()
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._watch, name="stall-watchdog", daemon=True)
+            self._thread.start()
+
+    # ------------------------------------------------------------------
+    # Thread do watchdog
+
+    def _watch(self):
+        stalled = None          # [StallSite, último batimento, pilha já registrada]
+        last_check = time.monotonic()
+        last_cpu = time.process_time()
+        interval = HEARTBEAT_INTERVAL / 1000.0
+
+        while not self._stop.wait(CHECK_INTERVAL):
+            now = time.monotonic()
+            cpu = time.process_time()
+            gap = now - last_check
+            if (gap > CHECK_INTERVAL + self.threshold_ms / 1000.0
+                    and cpu - last_cpu < gap * SUSPEND_CPU_RATIO):
+                # O próprio watchdog ficou parado sem o processo rodar
+                # (suspensão do sistema): não é a GUI
+                self._beat = now
+                stalled = None
+            last_check = now
+            last_cpu = cpu
+
+            beat = self._beat
+            # O travamento começou em algum ponto do intervalo após o último
+            # batimento: desconta meio intervalo (erro de ±HEARTBEAT_INTERVAL/2)
+            late_ms = (now - beat - interval / 2) * 1000.0
+
+            if stalled is not None:
+                site, last_beat, reported = stalled
+                if beat != last_beat:
+                    self._finish(site, (beat - last_beat - interval / 2) * 1000.0)
+                    stalled = None
+                elif not reported and late_ms >= self.threshold_ms * HANG_FACTOR:
+                    # Ponto conhecido, mas travado há muito tempo: pilha de novo
+                    stalled[2] = self._capture(beat, late_ms, force=True) is not None
+                continue
+
+            if late_ms >= self.threshold_ms:
+                site = self._capture(beat, late_ms)
+                if site is not None:
+                    stalled = [site, beat, site.count == 0]
+
+    def _capture(self, beat, late_ms, force=False):
+        """Pilha da thread principal; None se a GUI destravou antes da captura"""
+        frame = sys._current_frames().get(self._main_thread)
+        stack = traceback.extract_stack(frame, limit=STACK_LIMIT) if frame is not None else []
+        del frame
+        if self._beat != beat or not stack:
+            # Com o GIL disputado a captura pode chegar depois do fim do
+            # travamento: a pilha seria de outro ponto
+            return None
+
+        inner = next((entry for entry in reversed(stack)
+                      if entry.filename.startswith(SOURCE_DIR)), stack[-1])
+        key = (inner.filename, inner.lineno, inner.name)
+        site = self.sites.get(key)
+        if site is None:
+            site = self.sites[key] = StallSite(key)
+        if not force:
+            # Repetição da pilha de um travamento longo não é um novo travamento
+            self.stall_count += 1
+
+        # Pilha só na primeira vez de cada ponto; as repetições saem em uma
+        # linha ao destravar
+        if site.count == 0 or force:
+            logger.warning("GUI travada há %.0f ms (limite %d ms) em %s\n%s",
+                           late_ms, self.threshold_ms, site,
+                           "".join(traceback.format_list(stack)).rstrip())
+        return site
+
+    def _finish(self, site, duration_ms):
+        site.count += 1
+        site.total_ms += duration_ms
+        site.longest_ms = max(site.longest_ms, duration_ms)
+        logger.warning("GUI travada por %.0f ms em %s (%dª vez neste ponto, máx %.0f ms)",
+                       duration_ms, site, site.count, site.longest_ms)
@@ -0,0 +1,278 @@
+import csv
+import io
+import json
+import os
+import queue
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from src.utils.hardware_reader import MB
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+EXPORT_HOST = "127.0.0.1"     # Só local: o endpoint não tem autenticação
+METRICS_PATH = "/metrics"
+EXPORT_QUEUE_SIZE = 1000      # Amostras à espera do arquivo (cheia = descarta)
+EXPORT_MAX_BYTES = 10 * 1024 * 1024   # Rotação do arquivo a cada 10 MB
+EXPORT_BACKUPS = 3
+EXPORT_FORMATS = ("csv", "ndjson")
+
+OPENMETRICS_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+PROMETHEUS_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Colunas do CSV (métricas escalares do HardwareSnapshot)
+CSV_COLUMNS = ("timestamp", "cpu_percent", "memory_percent", "swap_percent",
+               "disk_mbs", "network_mbs", "load_1", "load_5", "load_15",
+               "process_cpu_percent", "process_rss", "process_threads", "updated")
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def format_metrics(snapshot, dropped=0, openmetrics=True):
+    """
+    Snapshot no formato de texto OpenMetrics (ou Prometheus 0.0.4 com
+    `openmetrics=False`). Vazões em bytes/s, como pede a convenção.
+    """
+    lines = []
+
+    def family(name, kind, help_text, samples):
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for suffix, labels, value in samples:
+            label_text = ",".join(f'{key}="{_escape(label)}"' for key, label in labels)
+            lines.append(f"{name}{suffix}{{{label_text}}} {value!r}" if label_text
+                         else f"{name}{suffix} {value!r}")
+
+    if snapshot is not None:
+        family("lunar_sample_timestamp_seconds", "gauge", "Instante da última leitura.",
+               [("", (), float(snapshot.timestamp))])
+        family("lunar_cpu_percent", "gauge", "Uso total de CPU (%).",
+               [("", (), float(snapshot.cpu_percent))])
+        family("lunar_cpu_core_percent", "gauge", "Uso de CPU por núcleo (%).",
+               [("", (("core", i),), float(value)) for i, value in enumerate(snapshot.cpu_per_core)])
+        family("lunar_memory_percent", "gauge", "Uso de memória (%).",
+               [("", (), float(snapshot.memory_percent))])
+        family("lunar_swap_percent", "gauge", "Uso de swap (%).",
+               [("", (), float(snapshot.swap_percent))])
+        family("lunar_disk_read_bytes_per_second", "gauge", "Leitura por disco.",
+               [("", (("device", disk.name),), disk.read_mbs * MB) for disk in snapshot.disks])
+        family("lunar_disk_write_bytes_per_second", "gauge", "Escrita por disco.",
+               [("", (("device", disk.name),), disk.write_mbs * MB) for disk in snapshot.disks])
+        family("lunar_network_receive_bytes_per_second", "gauge", "Recebido por placa de rede.",
+               [("", (("device", nic.name),), nic.recv_mbs * MB) for nic in snapshot.nics])
+        family("lunar_network_transmit_bytes_per_second", "gauge", "Enviado por placa de rede.",
+               [("", (("device", nic.name),), nic.sent_mbs * MB) for nic in snapshot.nics])
+        family("lunar_load_average", "gauge", "Load average do sistema.",
+               [("", (("period", period),), float(value))
+                for period, value in zip(("1m", "5m", "15m"), snapshot.load_avg)])
+        family("lunar_process_cpu_percent", "gauge", "CPU do processo do Lunar (%).",
+               [("", (), float(snapshot.process_cpu_percent))])
+        family("lunar_process_resident_memory_bytes", "gauge", "RSS do processo do Lunar.",
+               [("", (), float(snapshot.process_rss))])
+        family("lunar_process_threads", "gauge", "Threads do processo do Lunar.",
+               [("", (), float(snapshot.process_threads))])
+
+    # Contadores: OpenMetrics declara a família sem _total; Prometheus com
+    counter = "lunar_exporter_dropped_samples"
+    family(counter if openmetrics else counter + "_total", "counter",
+           "Amostras descartadas com a fila do arquivo cheia.",
+           [("_total" if openmetrics else "", (), float(dropped))])
+
+    if openmetrics:
+        lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+def snapshot_row(snapshot):
+    """Linha do CSV (mesma ordem de CSV_COLUMNS)"""
+    return (repr(snapshot.timestamp), snapshot.cpu_percent, snapshot.memory_percent,
+            snapshot.swap_percent, snapshot.disk_mbs, snapshot.network_mbs,
+            *snapshot.load_avg, snapshot.process_cpu_percent, snapshot.process_rss,
+            snapshot.process_threads, "|".join(sorted(snapshot.updated)))
+
+
+def snapshot_record(snapshot):
+    """Objeto do NDJSON (inclui núcleos, discos e placas de rede)"""
+    return {
+        "timestamp": snapshot.timestamp,
+        "cpu_percent": snapshot.cpu_percent,
+        "cpu_per_core": list(snapshot.cpu_per_core),
+        "memory_percent": snapshot.memory_percent,
+        "swap_percent": snapshot.swap_percent,
+        "disk_mbs": snapshot.disk_mbs,
+        "disks": [disk._asdict() for disk in snapshot.disks],
+        "network_mbs": snapshot.network_mbs,
+        "nics": [nic._asdict() for nic in snapshot.nics],
+        "load_avg": list(snapshot.load_avg),
+        "process_cpu_percent": snapshot.process_cpu_percent,
+        "process_rss": snapshot.process_rss,
+        "process_threads": snapshot.process_threads,
+        "updated": sorted(snapshot.updated),
+    }
+
+
+class _SampleFileWriter(threading.Thread):
+    """Grava as amostras da fila em CSV/NDJSON com rotação por tamanho"""
+
+    def __init__(self, path, fmt, max_bytes, backups):
+        super().__init__(name="telemetry-export", daemon=True)
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"Formato de exportação desconhecido: {fmt}")
+        self.path = Path(path)
+        self.fmt = fmt
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.queue = queue.Queue(EXPORT_QUEUE_SIZE)
+        self.written = 0
+        self._file = None
+
+    def run(self):
+        try:
+            while True:
+                snapshot = self.queue.get()
+                if snapshot is None:
+                    return
+                # Esvazia o que já chegou antes de um único flush
+                batch = [snapshot]
+                while True:
+                    try:
+                        batch.append(self.queue.get_nowait())
+                    except queue.Empty:
+                        break
+                stop = None in batch
+                self._write([item for item in batch if item is not None])
+                if stop:
+                    return
+        except Exception as e:
+            logger.error("Erro ao exportar telemetria para %s: %s", self.path, e)
+        finally:
+            if self._file is not None:
+                self._file.close()
+
+    def stop(self):
+        self.queue.put(None)
+        self.join(timeout=5.0)
+
+    def _open(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        new = not self.path.exists() or self.path.stat().st_size == 0
+        self._file = open(self.path, "a", encoding="utf-8", newline="")
+        if new and self.fmt == "csv":
+            csv.writer(self._file).writerow(CSV_COLUMNS)
+
+    def _rotate(self):
+        """arquivo -> arquivo.1 -> ... -> arquivo.N (o mais antigo sai)"""
+        self._file.close()
+        self._file = None
+        for index in range(self.backups - 1, 0, -1):
+            source = self.path.with_name(f"{self.path.name}.{index}")
+            if source.exists():
+                os.replace(source, self.path.with_name(f"{self.path.name}.{index + 1}"))
+        if self.backups > 0:
+            os.replace(self.path, self.path.with_name(f"{self.path.name}.1"))
+        else:
+            self.path.unlink()
+
+    def _write(self, snapshots):
+        if self._file is None:
+            self._open()
+        buffer = io.StringIO()
+        if self.fmt == "csv":
+            csv.writer(buffer).writerows(snapshot_row(snapshot) for snapshot in snapshots)
+        else:
+            for snapshot in snapshots:
+                buffer.write(json.dumps(snapshot_record(snapshot)) + "\n")
+        self._file.write(buffer.getvalue())
+        self._file.flush()
+        self.written += len(snapshots)
+        if self.max_bytes and self._file.tell() >= self.max_bytes:
+            self._rotate()
+
+
+class TelemetryExporter:
+    """
+    Exporta as leituras do TelemetrySampler sem consultar o SO de novo.
+
+    Um listener na thread do sampler só guarda a referência ao último
+    snapshot e o enfileira para o arquivo (fila limitada; cheia, descarta e
+    conta). O endpoint HTTP local (`/metrics`, OpenMetrics) e a gravação
+    em CSV/NDJSON rodam em threads próprias, então nem a GUI nem o
+    sampler esperam por rede ou disco.
+    """
+
+    def __init__(self, sampler, port=None, path=None, fmt="csv", host=EXPORT_HOST,
+                 max_bytes=EXPORT_MAX_BYTES, backups=EXPORT_BACKUPS):
+        self.sampler = sampler
+        self.port = port
+        self.host = host
+        self.latest = sampler.latest
+        self.dropped = 0
+
+        self._writer = _SampleFileWriter(path, fmt, max_bytes, backups) if path else None
+        self._server = None
+        self._server_thread = None
+
+    @property
+    def url(self):
+        if self._server is None:
+            return None
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{METRICS_PATH}"
+
+    def start(self):
+        if self._writer is not None:
+            self._writer.start()
+        if self.port is not None:
+            self._server = ThreadingHTTPServer((self.host, self.port), self._handler_class())
+            self._server.daemon_threads = True
+            self._server_thread = threading.Thread(target=self._server.serve_forever,
+                                                   name="telemetry-metrics", daemon=True)
+            self._server_thread.start()
+            logger.info("Métricas de telemetria em %s", self.url)
+        self.sampler.add_listener(self._on_sample)
+
+    def stop(self):
+        self.sampler.remove_listener(self._on_sample)
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._writer is not None and self._writer.is_alive():
+            self._writer.stop()
+
+    def metrics(self, openmetrics=True):
+        return format_metrics(self.latest, self.dropped, openmetrics)
+
+    def _on_sample(self, snapshot):
+        """Thread do sampler: O(1), nunca bloqueia"""
+        self.latest = snapshot
+        if self._writer is not None:
+            try:
+                self._writer.queue.put_nowait(snapshot)
+            except queue.Full:
+                self.dropped += 1
+
+    def _handler_class(self):
+        exporter = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] != METRICS_PATH:
+                    self.send_error(404)
+                    return
+                openmetrics = "application/openmetrics-text" in self.headers.get("Accept", "")
+                body = exporter.metrics(openmetrics).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", OPENMETRICS_TYPE if openmetrics else PROMETHEUS_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug("metrics %s - %s", self.address_string(), format % args)
+
+        return MetricsHandler
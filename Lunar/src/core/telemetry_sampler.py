@@ -0,0 +1,382 @@
+import threading
+import time
+from pathlib import Path
+from PySide6.QtCore import QCoreApplication, QObject, QThread, QTimer, Qt, Signal, Slot
+
+from src.utils.hardware_reader import HardwareReader
+from src.utils.telemetry_store import TelemetryStore
+from src.utils.telemetry_trace import TraceReplay, TraceWriter, read_trace
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Grupos de métricas (METRIC_GROUPS) e intervalo padrão de cada um (segundos)
+DEFAULT_RATES = {
+    "cpu": 1.0,
+    "memory": 1.0,
+    "disk": 1.0,
+    "network": 1.0,
+    "load": 5.0,
+    "process": 2.0,
+}
+
+# Métricas cujo vencimento cai dentro desta folga são lidas no mesmo tick
+SAMPLE_SLACK = 0.05
+
+# Amostras do trace publicadas por tick do replay antes de devolver o
+# controle ao event loop da thread (replay atrasado ou speed=0)
+REPLAY_BATCH = 256
+
+
+class _SamplerWorker(QObject):
+    """
+    Vive na thread do sampler: é dono do HardwareReader e do timer.
+    Nenhuma chamada ao psutil acontece fora desta thread.
+    """
+
+    def __init__(self, rates, lock, publish, store=None):
+        super().__init__()
+        self._rates = rates
+        self._lock = lock
+        self._publish = publish
+        self._store = store
+
+        self._reader = None
+        self._timer = None
+        self._last_sample = {}
+        self._next_due = {}
+
+    @Slot()
+    def start(self):
+        """Cria o leitor e agenda a primeira leitura (chamado na thread do sampler)"""
+        self._reader = HardwareReader()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._sample)
+
+        # A primeira leitura espera um intervalo: cpu_percent e o disco
+        # precisam de uma janela desde a inicialização do leitor
+        now = time.monotonic()
+        self._last_sample = {metric: now for metric in DEFAULT_RATES}
+        self.reschedule()
+
+    @Slot()
+    def reschedule(self):
+        """Recalcula os vencimentos após uma mudança de intervalo"""
+        if self._timer is None:
+            return
+        with self._lock:
+            rates = dict(self._rates)
+        self._next_due = {metric: self._last_sample[metric] + rates[metric]
+                          for metric in DEFAULT_RATES}
+        self._schedule()
+
+    def _schedule(self):
+        delay = min(self._next_due.values()) - time.monotonic()
+        self._timer.start(max(0, int(delay * 1000)))
+
+    def _sample(self):
+        """Lê as métricas vencidas em uma única passada e publica o snapshot"""
+        with self._lock:
+            rates = dict(self._rates)
+
+        now = time.monotonic()
+        due = [metric for metric, when in self._next_due.items()
+               if when <= now + SAMPLE_SLACK]
+
+        snapshot = None
+        if due:
+            try:
+                snapshot = self._reader.snapshot(due)
+            except Exception as e:
+                logger.error("Erro ao amostrar hardware: %s", e)
+
+        done = time.monotonic()
+        for metric in due:
+            self._last_sample[metric] = done
+            # Leitura lenta: os ticks perdidos são descartados, não acumulados
+            self._next_due[metric] = max(self._next_due[metric] + rates[metric], done)
+
+        if snapshot is not None:
+            self._publish(snapshot)
+            if self._store is not None:
+                try:
+                    self._store.add(snapshot)
+                except Exception as e:
+                    logger.error("Erro ao gravar histórico de telemetria: %s", e)
+        self._schedule()
+
+
+class _ReplayWorker(QObject):
+    """
+    Substitui o _SamplerWorker no modo replay: lê um trace gravado e
+    publica cada amostra no instante relativo gravado (dividido por
+    `speed`; speed=0 publica o mais rápido possível). Nada de psutil.
+    Erro ao ler o trace encerra o replay (logado, `finished` emitido).
+    """
+
+    finished = Signal()
+
+    def __init__(self, replay, publish):
+        super().__init__()
+        self._replay = replay
+        self._publish = publish
+        self._timer = None
+        self._samples = None
+        self._next = None
+        self._origin = None     # (instante monotônico, timestamp do trace) do início
+
+    @Slot()
+    def start(self):
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self._play)
+        self._rewind()
+        self._schedule()
+
+    @Slot()
+    def reschedule(self):
+        """Intervalos vêm do trace; nada a recalcular"""
+
+    def _rewind(self):
+        self._samples = read_trace(self._replay.path)
+        self._origin = None
+        if self._advance() and self._next is None:
+            logger.warning("Trace de telemetria vazio: %s", self._replay.path)
+
+    def _advance(self):
+        """Próxima amostra em `_next`; False (e replay encerrado) se o trace falhar"""
+        try:
+            self._next = next(self._samples, None)
+            return True
+        except Exception as e:
+            logger.error("Erro ao ler o trace de telemetria %s: %s", self._replay.path, e)
+            self._samples = None
+            self._next = None
+            return False
+
+    def _due(self, snapshot):
+        """Instante monotônico em que a amostra deve ser publicada"""
+        if not self._replay.speed or self._replay.speed <= 0:
+            return 0.0
+        if self._origin is None:
+            self._origin = (time.monotonic(), snapshot.timestamp)
+        started, first = self._origin
+        return started + (snapshot.timestamp - first) / self._replay.speed
+
+    def _schedule(self):
+        if self._next is None:
+            self.finished.emit()
+            return
+        delay = self._due(self._next) - time.monotonic()
+        self._timer.start(max(0, int(delay * 1000)))
+
+    def _play(self):
+        for _ in range(REPLAY_BATCH):
+            if self._next is None or self._due(self._next) > time.monotonic():
+                break
+            self._publish(self._next)
+            if self._advance() and self._next is None and self._replay.loop:
+                self._rewind()
+        self._schedule()
+
+
+class TelemetrySampler(QObject):
+    """
+    Amostrador de hardware fora da thread da GUI.
+
+    Um QThread dedicado é dono do HardwareReader e lê cada métrica no seu
+    próprio intervalo (`rates`, em segundos). Cada leitura vira um
+    HardwareSnapshot imutável entregue por `snapshot_ready` na thread da GUI.
+    Se a GUI ainda não consumiu o snapshot anterior, o novo o substitui
+    (as métricas atualizadas são unidas), então nada se acumula na fila.
+    Com um `store` (TelemetryStore), cada snapshot também é gravado no
+    histórico persistente, ainda na thread do sampler.
+
+    `record(caminho)` grava cada leitura em um trace binário
+    (telemetry_trace); com `replay` (TraceReplay) o trace substitui o
+    HardwareReader e o resto do pipeline continua igual. Listeners
+    (`add_listener`) recebem cada leitura na thread do sampler, antes da
+    coalescência; devem ser rápidos e não bloquear.
+    """
+
+    snapshot_ready = Signal(object)
+    replay_finished = Signal()
+    _snapshot_pending = Signal()
+    _reschedule_worker = Signal()
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """Sampler compartilhado pelo processo"""
+        if cls._instance is None:
+            try:
+                store = TelemetryStore()
+            except Exception as e:
+                logger.warning("Histórico de telemetria indisponível: %s", e)
+                store = None
+            cls._instance = cls(QCoreApplication.instance(), store=store)
+        return cls._instance
+
+    @classmethod
+    def ephemeral(cls):
+        """Troca o sampler compartilhado por um sem histórico persistente (testes/benchmarks)"""
+        if cls._instance is not None:
+            cls._instance.stop()
+        cls._instance = cls(QCoreApplication.instance())
+        return cls._instance
+
+    @classmethod
+    def replaying(cls, path, speed=1.0, loop=False):
+        """
+        Troca o sampler compartilhado por um replay do trace (sem histórico
+        persistente). FileNotFoundError se o trace não existe; o sampler
+        atual continua.
+        """
+        if not Path(path).is_file():
+            raise FileNotFoundError(f"Trace de telemetria não encontrado: {path}")
+        if cls._instance is not None:
+            cls._instance.stop()
+        cls._instance = cls(QCoreApplication.instance(),
+                            replay=TraceReplay(str(path), speed, loop))
+        return cls._instance
+
+    def __init__(self, parent=None, rates=None, store=None, replay=None):
+        super().__init__(parent)
+        self.store = store
+        self.replay = replay
+        self._recorder = None
+        self._listeners = ()
+        self._lock = threading.Lock()
+        self._rates = dict(DEFAULT_RATES)
+        for metric, seconds in (rates or {}).items():
+            self._validate(metric, seconds)
+            self._rates[metric] = seconds
+
+        self._pending = None
+        self.latest = None  # Último snapshot entregue à GUI
+
+        self._thread = None
+        self._worker = None
+        self._snapshot_pending.connect(self._deliver, Qt.QueuedConnection)
+
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.stop)
+
+    @staticmethod
+    def _validate(metric, seconds):
+        if metric not in DEFAULT_RATES:
+            raise ValueError(f"Métrica desconhecida do TelemetrySampler: {metric}")
+        if seconds <= 0:
+            raise ValueError(f"Intervalo inválido para {metric}: {seconds}")
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.isRunning()
+
+    def rates(self):
+        with self._lock:
+            return dict(self._rates)
+
+    def set_rate(self, metric, seconds):
+        """Altera o intervalo de amostragem de uma métrica em tempo de execução"""
+        self._validate(metric, seconds)
+        with self._lock:
+            self._rates[metric] = seconds
+        if self._worker is not None:
+            self._reschedule_worker.emit()
+
+    def add_listener(self, callback):
+        """`callback(snapshot)` a cada leitura, na thread do sampler"""
+        with self._lock:
+            self._listeners = self._listeners + (callback,)
+
+    def remove_listener(self, callback):
+        with self._lock:
+            self._listeners = tuple(item for item in self._listeners if item != callback)
+
+    @property
+    def recording(self):
+        return self._recorder is not None
+
+    def record(self, path):
+        """Passa a gravar cada leitura em um trace binário (substitui a gravação anterior)"""
+        writer = TraceWriter(path)
+        with self._lock:
+            previous, self._recorder = self._recorder, writer
+        if previous is not None:
+            previous.close()
+        logger.info("Gravando telemetria em %s", path)
+
+    def stop_recording(self):
+        """Fecha o trace; retorna quantas amostras foram gravadas"""
+        with self._lock:
+            writer, self._recorder = self._recorder, None
+        if writer is None:
+            return 0
+        writer.close()
+        logger.info("Trace de telemetria gravado: %s (%d amostras)", writer.path, writer.count)
+        return writer.count
+
+    def start(self):
+        """Inicia a thread de amostragem (chamadas repetidas são ignoradas)"""
+        if self.running:
+            return
+
+        self._thread = QThread(self)
+        self._thread.setObjectName("TelemetrySampler")
+        if self.replay is not None:
+            self._worker = _ReplayWorker(self.replay, self._publish)
+            self._worker.finished.connect(self.replay_finished)
+        else:
+            self._worker = _SamplerWorker(self._rates, self._lock, self._publish, self.store)
+        self._worker.moveToThread(self._thread)
+
+        self._thread.started.connect(self._worker.start)
+        self._thread.finished.connect(self._worker.deleteLater)
+        self._reschedule_worker.connect(self._worker.reschedule)
+        self._thread.start(QThread.LowPriority)
+
+    def stop(self):
+        """Para a amostragem e aguarda a thread terminar"""
+        if self._thread is None:
+            return
+        self._reschedule_worker.disconnect(self._worker.reschedule)
+        self._thread.quit()
+        self._thread.wait()
+        self._thread = None
+        self._worker = None
+        if self.store is not None:
+            self.store.flush()
+        self.stop_recording()
+
+    def _publish(self, snapshot):
+        """Chamado na thread do sampler: guarda e avisa a GUI uma única vez"""
+        for listener in self._listeners:
+            try:
+                listener(snapshot)
+            except Exception as e:
+                logger.error("Erro no listener de telemetria: %s", e)
+
+        with self._lock:
+            if self._recorder is not None:
+                self._recorder.write(snapshot)
+            previous = self._pending
+            if previous is not None:
+                snapshot = snapshot.with_updated(previous.updated | snapshot.updated)
+            self._pending = snapshot
+        if previous is None:
+            self._snapshot_pending.emit()
+
+    @Slot()
+    def _deliver(self):
+        with self._lock:
+            snapshot = self._pending
+            self._pending = None
+        if snapshot is None:
+            return
+        self.latest = snapshot
+        self.snapshot_ready.emit(snapshot)
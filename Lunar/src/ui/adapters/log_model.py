@@ -0,0 +1,183 @@
+# src/ui/adapters/log_model.py
+
+import numpy as np
+from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt, Signal
+from PySide6.QtGui import QBrush, QColor
+
+from src.ui.adapters.theme_manager import ThemeManager
+from src.utils.log_index import GrowableArray
+
+PAGE_ROWS = 5000          # Linhas expostas por fetchMore()
+
+# Papéis como int: comparar com o enum do Qt custa microssegundos por
+# chamada, e data() é chamado várias vezes por linha visível a cada frame
+DISPLAY_ROLE = int(Qt.DisplayRole)
+FOREGROUND_ROLE = int(Qt.ForegroundRole)
+LEVEL_ROLE = int(Qt.UserRole) + 1
+LINE_ROLE = int(Qt.UserRole) + 2
+
+# Nível -> variável de tema da cor do texto
+LEVEL_COLORS = {
+    10: "text-disabled",
+    30: "level-warn",
+    40: "level-bad",
+    50: "level-bad",
+}
+
+
+class LogListModel(QAbstractListModel):
+    """
+    Modelo de lista sobre um LogIndex: cada linha do modelo é uma linha do
+    arquivo, lida do arquivo só quando a view pede (a view só pede as
+    visíveis).
+
+    Sem `follow`, as linhas entram em páginas de PAGE_ROWS pelo
+    canFetchMore()/fetchMore() conforme a rolagem chega ao fim; com
+    `follow`, tudo o que o índice acrescenta entra na hora (modo tail).
+    O filtro por nível usa o índice de níveis pré-calculado; o filtro de
+    texto roda na thread do índice e é estendido a cada linha nova.
+    """
+
+    rows_appended = Signal()
+
+    def __init__(self, log_index, parent=None):
+        super().__init__(parent)
+        self.log_index = log_index
+        self.follow = True
+        self.min_level = 0
+        self.text = ""
+
+        self._rows = None           # None = sem filtro (linha do modelo = linha do arquivo)
+        self._filtered_upto = 0     # Linhas do índice já avaliadas pelo filtro
+        self._search_token = None   # Busca de texto em andamento
+        self._search_end = 0
+        self._visible = 0
+
+        self.theme = ThemeManager.instance()
+        self._brushes = {}
+        self._update_brushes()
+        self.theme.theme_changed.connect(self._on_theme_changed)
+
+        log_index.grew.connect(self._on_grew)
+        log_index.reset.connect(self._on_reset)
+        log_index.search_ready.connect(self._on_search_ready)
+
+    # ------------------------------------------------------------------
+    # QAbstractListModel
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._visible
+
+    def available(self):
+        """Linhas que passam pelo filtro (expostas ou não)"""
+        return self.log_index.line_count if self._rows is None else len(self._rows)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._visible < self.available()
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        self._expose(min(self.available(), self._visible + PAGE_ROWS))
+
+    def line_number(self, row):
+        """Linha do arquivo mostrada na linha `row` do modelo"""
+        return row if self._rows is None else int(self._rows.view()[row])
+
+    def data(self, index, role=DISPLAY_ROLE):
+        if role not in (DISPLAY_ROLE, FOREGROUND_ROLE, LEVEL_ROLE, LINE_ROLE):
+            return None
+        row = index.row()
+        if row >= self._visible:
+            return None
+        line = self.line_number(row)
+        if role == DISPLAY_ROLE:
+            return self.log_index.line(line)
+        if role == FOREGROUND_ROLE:
+            return self._brushes.get(self.log_index.level(line))
+        if role == LEVEL_ROLE:
+            return self.log_index.level(line)
+        if role == LINE_ROLE:
+            return line
+        return None
+
+    # ------------------------------------------------------------------
+    # Filtro e tail
+
+    def set_follow(self, follow):
+        self.follow = follow
+        if follow:
+            self._expose(self.available())
+
+    def set_filter(self, min_level=0, text=""):
+        """Nível mínimo e texto (sem diferenciar maiúsculas); vazio = tudo"""
+        self.min_level = min_level
+        self.text = text
+        self.beginResetModel()
+        self._rows = GrowableArray(np.int64) if (min_level or text) else None
+        self._filtered_upto = 0
+        self._search_token = None
+        self._visible = 0
+        self.endResetModel()
+        self._extend_filter()
+
+    def _extend_filter(self):
+        """Avalia o filtro nas linhas indexadas desde a última vez"""
+        if self._rows is None:
+            self._expose_new()
+            return
+        if self._search_token is not None:
+            return   # A busca em andamento, ao terminar, pega o resto
+
+        start, end = self._filtered_upto, self.log_index.line_count
+        if start >= end:
+            return
+        if self.text:
+            self._search_token = self.log_index.search(self.text, start, end)
+            self._search_end = end
+            return
+
+        self._rows.extend(self.log_index.lines_at_level(self.min_level, start, end))
+        self._filtered_upto = end
+        self._expose_new()
+
+    def _on_search_ready(self, token, lines):
+        if token != self._search_token:
+            return
+        self._search_token = None
+        if self.min_level:
+            lines = lines[self.log_index.levels(lines) >= self.min_level]
+        self._rows.extend(lines)
+        self._filtered_upto = self._search_end
+        self._expose_new()
+        self._extend_filter()   # Linhas que chegaram durante a busca
+
+    def _expose_new(self):
+        if self.follow or self._visible == 0:
+            self._expose(self.available() if self.follow else min(self.available(), PAGE_ROWS))
+
+    def _expose(self, count):
+        if count <= self._visible:
+            return
+        self.beginInsertRows(QModelIndex(), self._visible, count - 1)
+        self._visible = count
+        self.endInsertRows()
+        self.rows_appended.emit()
+
+    def _on_grew(self, line_count):
+        self._extend_filter()
+
+    def _on_reset(self):
+        self.set_filter(self.min_level, self.text)
+
+    # ------------------------------------------------------------------
+
+    def _update_brushes(self):
+        self._brushes = {level: QBrush(QColor(self.theme.variable(name, default="#ffffff")))
+                         for level, name in LEVEL_COLORS.items()}
+
+    def _on_theme_changed(self, theme):
+        self._update_brushes()
+        if self._visible:
+            self.dataChanged.emit(self.index(0), self.index(self._visible - 1),
+                                  [FOREGROUND_ROLE])
@@ -1 +1,204 @@
-# TODO: Implement
+# src/ui/adapters/theme_manager.py
+
+import re
+
+from PySide6.QtCore import QObject, Signal
+from PySide6.QtGui import QGuiApplication
+
+from src.core.config import Config
+from src.utils import asset_bundle
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Folhas de estilo, relativas ao projeto (servidas pelo pacote de assets se houver)
+STYLES_DIR = "src/ui/styles"
+
+# Tema que define todas as variáveis; os demais só sobrescrevem
+BASE_THEME = "dark"
+DEFAULT_THEME = "dark"   # Se o "theme" do config.json não existir em themes/
+
+# "@nome: valor;" em themes/*.css e "@nome" nas folhas de estilo
+DEFINITION_PATTERN = re.compile(r"^[ \t]*@([A-Za-z][\w-]*)[ \t]*:[ \t]*([^;\n]+);[ \t]*$", re.M)
+VARIABLE_PATTERN = re.compile(r"@([A-Za-z][\w-]*)")
+COMMENT_PATTERN = re.compile(r"/\*.*?\*/", re.S)
+
+
+class ThemeManager(QObject):
+    """
+    Motor de temas: lê main.css, components/*.css e themes/*.css uma única
+    vez, resolve as @variáveis de cada tema e guarda a folha compilada.
+
+    O tema inicial vem do "theme" do config.json; `set_theme` grava a
+    escolha de volta (`apply` só aplica, sem gravar).
+
+    Trocar de tema aplica a folha já compilada uma vez na janela de topo;
+    mudanças de estado em tempo de execução usam propriedades dinâmicas
+    (`set_state`) com polish só do widget afetado, sem setStyleSheet.
+    """
+
+    theme_changed = Signal(str)
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """Motor compartilhado pelo processo"""
+        if cls._instance is None:
+            cls._instance = cls(QGuiApplication.instance())
+        return cls._instance
+
+    def __init__(self, parent=None, styles_dir=STYLES_DIR):
+        super().__init__(parent)
+        self.styles_dir = styles_dir
+        self.current = self._configured_theme()
+
+        self._sources = None    # Texto das folhas, lido uma vez
+        self._variables = {}    # tema -> variáveis resolvidas
+        self._compiled = {}     # tema -> folha compilada
+        self._applied = {}      # id(widget) -> tema aplicado
+
+    # ------------------------------------------------------------------
+    # Carga e compilação
+
+    def _configured_theme(self):
+        """Tema salvo no config.json, se o arquivo dele existir (senão DEFAULT_THEME)"""
+        theme = Config.instance().get("theme") or DEFAULT_THEME
+        if f"{theme}.css" not in asset_bundle.listdir(f"{self.styles_dir}/themes", "*.css"):
+            logger.warning("Tema '%s' do config.json não encontrado; usando '%s'",
+                           theme, DEFAULT_THEME)
+            return DEFAULT_THEME
+        return theme
+
+    def _load(self):
+        """Lê todas as folhas do disco (só na primeira chamada)"""
+        if self._sources is not None:
+            return self._sources
+
+        root = self.styles_dir
+        sheets = [asset_bundle.read_text(f"{root}/main.css")]
+        for name in asset_bundle.listdir(f"{root}/components", "*.css"):
+            sheets.append(asset_bundle.read_text(f"{root}/components/{name}"))
+
+        themes = {}
+        for name in asset_bundle.listdir(f"{root}/themes", "*.css"):
+            themes[name[:-len(".css")]] = asset_bundle.read_text(f"{root}/themes/{name}")
+
+        # Comentários saem já na carga (folha menor para o parser do Qt)
+        self._sources = {
+            "sheets": COMMENT_PATTERN.sub("", "\n".join(sheets)),
+            "themes": {name: COMMENT_PATTERN.sub("", text) for name, text in themes.items()},
+        }
+        return self._sources
+
+    def themes(self):
+        """Nomes dos temas disponíveis"""
+        return sorted(self._load()["themes"])
+
+    def variables(self, theme=None):
+        """Variáveis do tema (base + sobrescritas), já resolvidas"""
+        theme = theme or self.current
+        if theme in self._variables:
+            return self._variables[theme]
+
+        themes = self._load()["themes"]
+        if theme not in themes:
+            raise ValueError(f"Tema desconhecido: {theme}")
+
+        raw = dict(DEFINITION_PATTERN.findall(themes.get(BASE_THEME, "")))
+        raw.update(DEFINITION_PATTERN.findall(themes[theme]))
+
+        # Variáveis podem apontar para outras (@accent-hover: @accent;)
+        resolved = {}
+        for name in raw:
+            value = raw[name].strip()
+            seen = {name}
+            while True:
+                match = VARIABLE_PATTERN.fullmatch(value)
+                if match is None or match.group(1) in seen or match.group(1) not in raw:
+                    break
+                seen.add(match.group(1))
+                value = raw[match.group(1)].strip()
+            resolved[name] = value
+
+        self._variables[theme] = resolved
+        return resolved
+
+    def variable(self, name, theme=None, default=None):
+        return self.variables(theme).get(name, default)
+
+    def stylesheet(self, theme=None):
+        """Folha compilada do tema (compila na primeira vez e guarda em cache)"""
+        theme = theme or self.current
+        compiled = self._compiled.get(theme)
+        if compiled is not None:
+            return compiled
+
+        sources = self._load()
+        variables = self.variables(theme)
+
+        # Regras extras do próprio tema (tudo que não é definição de variável)
+        theme_rules = DEFINITION_PATTERN.sub("", sources["themes"][theme])
+        text = sources["sheets"] + "\n" + theme_rules
+
+        def substitute(match):
+            value = variables.get(match.group(1))
+            if value is None:
+                logger.warning("Variável de tema não definida: @%s", match.group(1))
+                return match.group(0)
+            return value
+
+        compiled = VARIABLE_PATTERN.sub(substitute, text)
+        self._compiled[theme] = compiled
+        return compiled
+
+    # ------------------------------------------------------------------
+    # Aplicação
+
+    def apply(self, widget, theme=None):
+        """
+        Aplica o tema à janela (uma chamada de setStyleSheet na janela de
+        topo). Não faz nada se o widget já estiver com esse tema.
+        """
+        theme = theme or self.current
+        sheet = self.stylesheet(theme)
+        if self._applied.get(id(widget)) == theme:
+            return False
+
+        key = id(widget)
+        if key not in self._applied:
+            widget.destroyed.connect(lambda *args, k=key: self._applied.pop(k, None))
+        widget.setStyleSheet(sheet)
+        self._applied[key] = theme
+
+        if theme != self.current:
+            self.current = theme
+            self.theme_changed.emit(theme)
+        return True
+
+    def set_theme(self, theme, *widgets):
+        """Troca o tema atual, reaplica nas janelas informadas e grava no config.json"""
+        self.stylesheet(theme) # Valida e compila antes de trocar
+        for widget in widgets:
+            self.apply(widget, theme)
+        if theme != self.current:
+            self.current = theme
+            self.theme_changed.emit(theme)
+        Config.instance().set("theme", theme)
+
+    @staticmethod
+    def repolish(widget):
+        """Reavalia o estilo só deste widget (após mudar uma propriedade)"""
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
+        widget.update()
+
+    @classmethod
+    def set_state(cls, widget, name, value):
+        """Muda uma propriedade dinâmica lida pelo QSS; retorna False se já estava igual"""
+        if widget.property(name) == value:
+            return False
+        widget.setProperty(name, value)
+        cls.repolish(widget)
+        return True
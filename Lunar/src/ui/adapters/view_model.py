@@ -0,0 +1,127 @@
+# src/ui/adapters/view_model.py
+
+from src.ui.adapters.theme_manager import ThemeManager
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def _formatter(spec):
+    """Aceita uma string de formato ("{:.0f}%") ou um callable"""
+    if callable(spec):
+        return spec
+    return spec.format
+
+
+class _Binding:
+    """Liga um valor do ViewModel a um widget; só toca o widget quando o resultado muda"""
+    __slots__ = ("widget", "format", "_last")
+
+    def __init__(self, widget, formatter):
+        self.widget = widget
+        self.format = _formatter(formatter)
+        self._last = None
+
+    def apply(self, value):
+        rendered = self.format(value)
+        if rendered == self._last:
+            return False
+        self._last = rendered
+        self.write(rendered)
+        return True
+
+    def write(self, rendered):
+        raise NotImplementedError
+
+
+class TextBinding(_Binding):
+    __slots__ = ()
+
+    def write(self, rendered):
+        self.widget.setText(rendered)
+
+
+class PropertyBinding(_Binding):
+    """Propriedade dinâmica lida pelo QSS (ex.: [level="high"]), com polish só deste widget"""
+    __slots__ = ("name",)
+
+    def __init__(self, widget, name, formatter):
+        super().__init__(widget, formatter)
+        self.name = name
+
+    def write(self, rendered):
+        self.widget.setProperty(self.name, rendered)
+        ThemeManager.repolish(self.widget)
+
+
+class MessageBinding(_Binding):
+    """Mensagem de uma QStatusBar"""
+    __slots__ = ()
+
+    def write(self, rendered):
+        self.widget.showMessage(rendered)
+
+
+class CallbackBinding(_Binding):
+    """Qualquer outra atualização: callback(valor formatado)"""
+    __slots__ = ()
+
+    def write(self, rendered):
+        self.widget(rendered)
+
+
+class ViewModel:
+    """
+    Estado de uma view e referências diretas aos widgets ligados a ele.
+
+    `update()` compara os valores novos com os anteriores e só repassa os
+    que mudaram; cada ligação ainda compara o resultado formatado (texto,
+    propriedade) antes de tocar o widget. Assim o trabalho por tick cresce
+    com o que mudou, não com o número de widgets.
+    """
+
+    def __init__(self):
+        self._bindings = {}
+        self._values = {}
+
+    def _add(self, name, binding):
+        self._bindings.setdefault(name, []).append(binding)
+        if name in self._values:
+            binding.apply(self._values[name])
+        return binding
+
+    def bind_text(self, name, widget, formatter="{}"):
+        """setText() com o valor formatado"""
+        return self._add(name, TextBinding(widget, formatter))
+
+    def bind_property(self, name, widget, property_name, formatter="{}"):
+        """Propriedade dinâmica do widget (cores/estados ficam no QSS)"""
+        return self._add(name, PropertyBinding(widget, property_name, formatter))
+
+    def bind_message(self, name, status_bar, formatter="{}"):
+        """showMessage() de uma QStatusBar"""
+        return self._add(name, MessageBinding(status_bar, formatter))
+
+    def bind(self, name, callback, formatter=lambda value: value):
+        """callback(valor) quando o valor muda"""
+        return self._add(name, CallbackBinding(callback, formatter))
+
+    def get(self, name, default=None):
+        return self._values.get(name, default)
+
+    def update(self, values=None, **changes):
+        """Aplica os valores que mudaram; retorna quantos widgets foram tocados"""
+        if values:
+            changes = {**values, **changes}
+
+        touched = 0
+        for name, value in changes.items():
+            if name in self._values and self._values[name] == value:
+                continue
+            self._values[name] = value
+            for binding in self._bindings.get(name, ()):
+                try:
+                    touched += binding.apply(value)
+                except Exception as e:
+                    logger.error("Erro ao atualizar ligação '%s': %s", name, e)
+        return touched
@@ -2,20 +2,37 @@ from PySide6.QtWidgets import (QFrame, QVBoxLayout, QHBoxLayout, QLabel,
                               QPushButton, QGridLayout, QWidget)
 from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QFont
+import time
+import numpy as np
 # import psutil # REMOVED (now in hardware_reader)
 
 # NEW IMPORTS
-from src.utils.hardware_reader import HardwareReader
+from src.core.telemetry_sampler import TelemetrySampler
 from src.ui.components.hardware_graphs import MiniGraphWidget
+from src.ui.adapters.view_model import ViewModel
 
 from src.ui.components.switch import SwitchButton
 
 # NOVO IMPORT
 from src.ui.components.progress_button import ProgressButton
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
 
 # NEW: Define a ceiling for the DISK graph (ex: 100 MB/s = 100%)
 DISK_GRAPH_MAX_MB_S = 100.0
 
+# Amostras guardadas por gráfico (1 h a 1 amostra/s); a roda do mouse dá zoom
+GRAPH_HISTORY_POINTS = 3600
+
+# Estado do STATUS -> texto; a cor vem do QSS via a propriedade "level"
+STATUS_TEXT = {
+    "ready": "READY",
+    "optimal": "OPTIMAL",
+    "moderate": "MODERATE",
+    "high": "HIGH LOAD",
+}
+
 class Dashboard(QFrame):
     def __init__(self, controller=None):
         super().__init__()
@@ -26,12 +43,28 @@ class Dashboard(QFrame):
             "hwid": False
         }
 
-        # Instantiate the reader
-        self.hw_reader = HardwareReader()
+        # Leituras de hardware chegam da thread do sampler (sem psutil na GUI)
+        self.sampler = TelemetrySampler.instance()
+
+        # Labels ligados ao estado; só o que mudou é tocado a cada tick
+        self.view = ViewModel()
+        self.value_labels = {}
 
         self.setup_ui()
+        self.setup_bindings()
         self.setup_timers()
 
+    def setup_bindings(self):
+        """Liga os valores de hardware aos labels (referências diretas)"""
+        self.view.bind_text("cpu", self.value_labels["CPU"], "{:.0f}%")
+        self.view.bind_text("memory", self.value_labels["MEMORY"], "{:.0f}%")
+        self.view.bind_text("disk", self.value_labels["DISK"], "{:.0f} MB/s")
+
+        status_label = self.value_labels["STATUS"]
+        self.view.bind_text("status", status_label, STATUS_TEXT.get)
+        self.view.bind_property("status", status_label, "level")
+        self.view.update(status="ready")
+
     def setup_ui(self):
         """Configura dashboard com hardware stats ACIMA e flutuante"""
         self.setObjectName("dashboard")
@@ -157,7 +190,9 @@ class Dashboard(QFrame):
         value_label.setObjectName("hardwareValue")
         value_label.setFont(QFont("Segoe UI", 16, QFont.Bold))
         value_label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-        value_label.setStyleSheet(f"color: {color}; background: transparent;")
+        # Cor pelo QSS (#hardwareValue[metric=...]), sem stylesheet por widget
+        value_label.setProperty("metric", title.lower())
+        self.value_labels[title] = value_label
 
         text_layout.addWidget(title_label)
         text_layout.addWidget(value_label)
@@ -166,7 +201,7 @@ class Dashboard(QFrame):
 
         # Gráfico (Direita)
         if show_graph:
-            graph_widget = MiniGraphWidget()
+            graph_widget = MiniGraphWidget(history_points=GRAPH_HISTORY_POINTS)
             graph_widget.set_color(color)
             main_layout.addWidget(graph_widget) # Adiciona gráfico à direita
 
@@ -306,16 +341,60 @@ class Dashboard(QFrame):
         """Handler para toggle dos módulos"""
         self.switch_states[module_id] = checked
         status = "ENABLED" if checked else "DISABLED"
-        print(f"Module {module_id}: {status}")
+        logger.info("Module %s: %s", module_id, status)
 
     def setup_timers(self):
-        """Configura timers para atualização em tempo real"""
-        self.stats_timer = QTimer()
-        self.stats_timer.timeout.connect(self.update_hardware_stats)
-        # Atualização mais rápida para o gráfico
-        self.stats_timer.start(1000) # 1 segundo
-        # A primeira chamada deve ser do timer, após 1s.
-        # self.update_hardware_stats()
+        """Conecta o sampler de hardware para atualização em tempo real"""
+        # Intervalos por métrica em TelemetrySampler (padrão: 1 segundo)
+        self.suspended_at = None
+        self.restore_history()
+        self.sampler.snapshot_ready.connect(self.update_hardware_stats)
+        self.sampler.start()
+
+    def suspend(self):
+        """Página escondida há um tempo: para de consumir snapshots (chamado pelo PageStack)"""
+        if self.suspended_at is not None:
+            return
+        self.suspended_at = time.time()
+        self.sampler.snapshot_ready.disconnect(self.update_hardware_stats)
+
+    def resume(self):
+        """Volta a consumir snapshots; o intervalo suspenso vem do histórico persistente"""
+        if self.suspended_at is None:
+            return
+        self.restore_history(since=self.suspended_at)
+        self.suspended_at = None
+        self.sampler.snapshot_ready.connect(self.update_hardware_stats)
+
+    def restore_history(self, since=None):
+        """Preenche os gráficos com os últimos pontos do histórico persistente"""
+        store = self.sampler.store
+        if store is None:
+            return
+
+        try:
+            now = time.time()
+            graphs = (
+                ("cpu_graph", "cpu_percent", 1.0),
+                ("memory_graph", "memory_percent", 1.0),
+                ("disk_graph", "disk_mbs", 100.0 / DISK_GRAPH_MAX_MB_S),
+            )
+            for attribute, channel, scale in graphs:
+                graph = getattr(self, attribute, None)
+                if graph is None:
+                    continue
+                capacity = graph.series.capacity
+                start = now - capacity if since is None else max(since, now - capacity)
+                history = store.query(start, now, channel,
+                                      max_points=capacity)["avg"]
+                # Buckets sem dados (app fechado) ficam como NaN: lacunas no
+                # gráfico, nas posições certas. Só o trecho antes da primeira
+                # amostra sai
+                recorded = np.flatnonzero(~np.isnan(history))
+                if len(recorded):
+                    graph.add_data_points(history[recorded[0]:] * scale)
+        except Exception as e:
+            logger.error("Erro ao restaurar histórico de hardware: %s", e)
 
     def on_spoof_button_click(self):
         """Handler do botão de spoofing"""
@@ -339,40 +418,35 @@ class Dashboard(QFrame):
         self.spoof_status.setText("Security protocol completed")
         QTimer.singleShot(2000, lambda: self.spoof_status.setText("System ready for spoofing protocol"))
 
-    def update_hardware_stats(self):
-        """Atualiza as estatísticas de hardware e os gráficos"""
+    def update_hardware_stats(self, snapshot):
+        """Atualiza as estatísticas de hardware e os gráficos a partir de um snapshot"""
         try:
-            # Buscar dados do Reader
-            cpu_percent = self.hw_reader.get_cpu_percent()
-            memory_percent = self.hw_reader.get_memory_percent()
-            disk_mbs = self.hw_reader.get_disk_mbs() # CHANGED
-
-            # Atualizar Labels
-            self.cpu_stat.findChild(QLabel, "hardwareValue").setText(f"{cpu_percent:.0f}%")
-            self.memory_stat.findChild(QLabel, "hardwareValue").setText(f"{memory_percent:.0f}%")
-            # CHANGED: Format the disk label as MB/s
-            self.disk_stat.findChild(QLabel, "hardwareValue").setText(f"{disk_mbs:.0f} MB/s")
-
-            # Atualizar Gráficos
-            if hasattr(self, 'cpu_graph'):
-                self.cpu_graph.add_data_point(cpu_percent)
-            if hasattr(self, 'memory_graph'):
-                self.memory_graph.add_data_point(memory_percent)
-            if hasattr(self, 'disk_graph'):
-                # CHANGED: Calculate the % for the graph
-                disk_percent_for_graph = (disk_mbs / DISK_GRAPH_MAX_MB_S) * 100.0
-                self.disk_graph.add_data_point(disk_percent_for_graph)
+            cpu_percent = snapshot.cpu_percent
+            memory_percent = snapshot.memory_percent
+            disk_mbs = snapshot.disk_mbs # CHANGED
+            updated = snapshot.updated
 
             # Atualizar Status
             if cpu_percent > 80:
-                self.status_stat.findChild(QLabel, "hardwareValue").setText("HIGH LOAD")
-                self.status_stat.findChild(QLabel, "hardwareValue").setStyleSheet("color: #FF6B6B;")
+                status = "high"
             elif cpu_percent > 50:
-                self.status_stat.findChild(QLabel, "hardwareValue").setText("MODERATE")
-                self.status_stat.findChild(QLabel, "hardwareValue").setStyleSheet("color: #FFA726;")
+                status = "moderate"
             else:
-                self.status_stat.findChild(QLabel, "hardwareValue").setText("OPTIMAL")
-                self.status_stat.findChild(QLabel, "hardwareValue").setStyleSheet("color: #B8E986;")
+                status = "optimal"
+
+            # Atualizar Labels (só os que mudaram)
+            self.view.update(cpu=cpu_percent, memory=memory_percent,
+                             disk=disk_mbs, status=status)
+
+            # Atualizar Gráficos (só as métricas amostradas neste snapshot)
+            if hasattr(self, 'cpu_graph') and "cpu" in updated:
+                self.cpu_graph.add_data_point(cpu_percent)
+            if hasattr(self, 'memory_graph') and "memory" in updated:
+                self.memory_graph.add_data_point(memory_percent)
+            if hasattr(self, 'disk_graph') and "disk" in updated:
+                # CHANGED: Calculate the % for the graph
+                disk_percent_for_graph = (disk_mbs / DISK_GRAPH_MAX_MB_S) * 100.0
+                self.disk_graph.add_data_point(disk_percent_for_graph)
 
         except Exception as e:
-            print(f"Hardware stats update error: {e}")
+            logger.error("Hardware stats update error: %s", e)
@@ -1,24 +1,140 @@
 # src/ui/components/hardware_graphs.py
 
+import numpy as np
 from PySide6.QtWidgets import QWidget
 from PySide6.QtCore import Qt, QPointF, QRectF
-from PySide6.QtGui import (QPainter, QColor, QBrush, QPolygonF,
-                           QLinearGradient, QRadialGradient, QImage) # [NOVO] QImage
-
+from PySide6.QtGui import (QPainter, QColor, QBrush, QPen, QPolygonF,
+                           QLinearGradient, QImage)
+
+from src.core.perf_monitor import profiled_paint
+from src.utils.ring_buffer import RingBuffer
+from src.utils.downsample import DownsampleCache, DOWNSAMPLE_MODES
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Fração da faixa vertical nas bordas: enquanto o último valor ficar no
+# miolo a escala não muda e o gráfico pode ser só deslocado (scroll)
+SCALE_HYSTERESIS = 0.25
+
+# Pixels extras redesenhados à esquerda da faixa nova (antialias + espessura da linha)
+SEGMENT_MARGIN = 3
+
+LINE_WIDTH = 1.5
+
+# Janelas (em amostras) percorridas pela roda do mouse
+ZOOM_LEVELS = (30, 120, 600, 1800, 3600)
+
+# "raw" desenha todas as amostras; os demais reduzem a um ponto (ou par) por pixel
+RENDER_MODES = ("raw",) + DOWNSAMPLE_MODES
+
+# Níveis de zoom com série reduzida mantida em cache
+DOWNSAMPLE_CACHE_LIMIT = 8
+
+# Recursos compartilhados entre gráficos: (w, h, rgba, dpr) -> _GraphResources
+_RESOURCE_CACHE = {}
+_RESOURCE_CACHE_LIMIT = 64
+
+class _GraphResources:
+    """Pincel, caneta e máscara de fade prontos para um (tamanho, cor, dpr)."""
+    __slots__ = ("fill_brush", "line_pen", "mask")
+
+    def __init__(self, width, height, color, dpr):
+        solid_color = QColor(color)
+        faded_color = QColor(color)
+        faded_color.setAlphaF(0.0) # 0% opaco
+
+        # Gradiente Vertical (de cima para baixo)
+        v_grad = QLinearGradient(0, 0, 0, height)
+        v_grad.setColorAt(0.0, solid_color.lighter(120)) # Cor no topo
+        v_grad.setColorAt(1.0, faded_color) # Transparente embaixo
+        self.fill_brush = QBrush(v_grad)
+
+        # Linha sólida; o fade horizontal vem da máscara na composição
+        self.line_pen = QPen(solid_color, LINE_WIDTH)
+
+        # Máscara "EIXO X": transparente -> opaco (80%) -> transparente,
+        # um fator 0-256 por coluna de pixel de dispositivo. Guardada já no
+        # formato da imagem (sem broadcast) para a multiplicação não alocar.
+        device_width = max(1, round(width * dpr))
+        device_height = max(1, round(height * dpr))
+        centers = (np.arange(device_width) + 0.5) / device_width
+        alpha = np.interp(centers, (0.0, 0.8, 1.0), (0.0, 1.0, 0.0))
+        column = np.rint(alpha * 256).astype(np.uint16)[None, :, None]
+        self.mask = np.ascontiguousarray(
+            np.broadcast_to(column, (device_height, device_width, 4)))
+
+    @classmethod
+    def get(cls, width, height, color, dpr):
+        key = (width, height, color.rgba(), dpr)
+        resources = _RESOURCE_CACHE.get(key)
+        if resources is None:
+            if len(_RESOURCE_CACHE) >= _RESOURCE_CACHE_LIMIT:
+                _RESOURCE_CACHE.clear()
+            resources = _RESOURCE_CACHE[key] = cls(width, height, color, dpr)
+        return resources
+
+@profiled_paint("graph")
 class MiniGraphWidget(QWidget):
-    def __init__(self, parent=None, max_points=30):
+    def __init__(self, parent=None, max_points=30, history_points=None, render_mode="lttb"):
         super().__init__(parent)
-        self.max_points = max_points
-        self.data_points = [0.0] * self.max_points
+        self.max_points = max_points # Amostras visíveis (zoom atual)
+        self.series = RingBuffer(max(history_points or 0, max_points))
+        self.render_mode = render_mode
+        self._downsample_caches = {}
         self.graph_color = QColor("#50E3C2") # Cor padrão
         self.setFixedSize(100, 40)
 
         # O "zoom" vertical mínimo que você sugeriu
         self.MIN_VERTICAL_RANGE = 30
 
+        # Conteúdo sem a máscara horizontal, reaproveitado entre frames
+        self._content = None
+        self._content_pixels = None
+        self._back = None           # Segundo buffer (pixels, imagem) para o scroll
+        # Imagem final (conteúdo x máscara) e buffer de trabalho da composição
+        self._frame = None
+        self._frame_bytes = None
+        self._scratch = None
+        self._resources = None
+        self._dpr = None
+        self._rendered_total = -1   # total da série desenhada na última renderização
+        self._rendered_key = None   # (modo, bucket, colunas) da última renderização
+        self._rendered_scale = None
+        self._scale = None          # (graph_min, graph_max) atual
+
+    @property
+    def data_points(self):
+        """Valores visíveis em ordem cronológica (cópia)."""
+        return self.series.tail(self.max_points)
+
+    def set_render_mode(self, mode):
+        """"raw", "lttb" ou "minmax" (só vale quando há mais amostras que pixels)."""
+        if mode not in RENDER_MODES:
+            raise ValueError(f"Modo de renderização desconhecido: {mode}")
+        self.render_mode = mode
+        self.update()
+
+    def set_zoom(self, samples):
+        """Quantas amostras do histórico ficam visíveis."""
+        self.max_points = max(2, min(int(samples), self.series.capacity))
+        self.update()
+
+    def wheelEvent(self, event):
+        """Roda do mouse: alterna entre os níveis de zoom que o histórico comporta"""
+        levels = [level for level in ZOOM_LEVELS if level <= self.series.capacity]
+        if len(levels) < 2:
+            return super().wheelEvent(event)
+
+        current = min(range(len(levels)), key=lambda i: abs(levels[i] - self.max_points))
+        step = -1 if event.angleDelta().y() > 0 else 1 # Para cima = aproximar
+        self.set_zoom(levels[max(0, min(len(levels) - 1, current + step))])
+        event.accept()
+
     def set_color(self, color_hex):
         """Define a cor principal do gráfico."""
         self.graph_color = QColor(color_hex)
+        self._build_resources()
         self.update()
 
     def add_data_point(self, value):
@@ -26,114 +142,231 @@ class MiniGraphWidget(QWidget):
         if value < 0: value = 0
         # if value > 100: value = 100  <-- [REMOVIDO]
 
-        self.data_points.append(value)
-
-        while len(self.data_points) > self.max_points:
-            self.data_points.pop(0)
-
+        self.series.append(value)
         self.update() # Solicita o redesenho
 
+    def add_data_points(self, values):
+        """Adiciona vários pontos de uma vez (ex.: histórico restaurado); NaN = lacuna."""
+        values = np.maximum(np.asarray(values, dtype=np.float64), 0.0)
+        if len(values):
+            self.series.extend(values)
+            self.update()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._build_resources(reallocate=True)
+
+    def _build_resources(self, reallocate=False):
+        """(Re)cria recursos de pintura; só chamado em resize, set_color ou troca de DPR."""
+        dpr = self.devicePixelRatioF()
+        self._resources = _GraphResources.get(self.width(), self.height(),
+                                              self.graph_color, dpr)
+        if reallocate or dpr != self._dpr or self._content is None:
+            self._allocate_content(dpr)
+        self._rendered_total = -1 # Força redesenho completo
+
+    def _update_scale(self, current_value):
+        """Escala vertical centrada no último ponto, com histerese."""
+        if self._scale is not None:
+            graph_min, graph_max = self._scale
+            band = (graph_max - graph_min) * SCALE_HYSTERESIS
+            below_ok = current_value >= graph_min + band or graph_min == 0.0
+            if below_ok and current_value <= graph_max - band:
+                return self._scale
+
+        # --- 1. Lógica de Scaling Instantâneo (Baseado no último ponto) ---
+        half_range = self.MIN_VERTICAL_RANGE / 2.0
+        graph_min = current_value - half_range
+        graph_max = current_value + half_range
+
+        # --- 2. Clamping (Travar a escala apenas em 0) ---
+        if graph_min < 0.0:
+            overshoot = 0.0 - graph_min
+            graph_min = 0.0
+            graph_max += overshoot
+
+        self._scale = (graph_min, graph_max)
+        return self._scale
+
+    def _display_series(self):
+        """
+        Série a desenhar: (chave, valores, total). Com mais amostras visíveis
+        que pixels, usa a redução em cache do nível de zoom atual, então o
+        custo do paint não depende do tamanho do histórico.
+        """
+        columns = max(2, self.width()) # Um ponto por pixel
+        if self.render_mode == "raw" or self.max_points <= columns:
+            return ("raw", self.max_points), self.series.tail(self.max_points), self.series.total
+
+        bucket_size = -(-self.max_points // columns)
+        key = (self.render_mode, bucket_size, columns)
+        cache = self._downsample_caches.get(key)
+        if cache is None:
+            if len(self._downsample_caches) >= DOWNSAMPLE_CACHE_LIMIT:
+                self._downsample_caches.clear()
+            cache = self._downsample_caches[key] = DownsampleCache(
+                self.render_mode, bucket_size, columns)
+        points = cache.update(self.series)
+        return key, points.values(), points.total
+
+    def _point_positions(self, values, scale, total):
+        """
+        Normaliza todos os pontos em uma passada vetorizada.
+
+        O X de cada amostra é arredondado em pixels de dispositivo a partir do
+        seu número absoluto, para que o deslocamento entre frames seja inteiro
+        e os pontos já desenhados não mudem de lugar.
+        """
+        w = self.width()
+        h = self.height()
+        dpr = self._content.devicePixelRatio()
+        n = len(values)
+
+        graph_min, graph_max = scale
+        current_range = graph_max - graph_min
+        if current_range < 0.01:
+            current_range = self.MIN_VERTICAL_RANGE
+
+        normalized = np.clip((values - graph_min) / current_range, 0.0, 1.0)
+        ys = h - normalized * h
+
+        step = w * dpr / (n - 1)
+        latest = total - 1
+        samples = np.arange(latest - n + 1, latest + 1)
+        xs_device = w * dpr - (np.rint(latest * step) - np.rint(samples * step))
+        return xs_device / dpr, ys
+
+    def _allocate_content(self, dpr):
+        width = max(1, round(self.width() * dpr))
+        height = max(1, round(self.height() * dpr))
+        self._dpr = dpr
+
+        self._content_pixels, self._content = self._numpy_image(width, height, dpr)
+        self._back = self._numpy_image(width, height, dpr)
+
+        frame_pixels, self._frame = self._numpy_image(width, height, dpr)
+        self._frame_bytes = frame_pixels.view(np.uint8).reshape(height, width, 4)
+        self._scratch = np.zeros((height, width, 4), dtype=np.uint16)
+
+    @staticmethod
+    def _numpy_image(width, height, dpr):
+        """QImage que compartilha a memória de um array NumPy (pixels, imagem)."""
+        pixels = np.zeros((height, width), dtype=np.uint32)
+        image = QImage(pixels.data, width, height, width * 4,
+                       QImage.Format_ARGB32_Premultiplied)
+        image.setDevicePixelRatio(dpr)
+        return pixels, image
+
+    @staticmethod
+    def _runs(ys, first):
+        """Trechos [início, fim) de pontos válidos a partir de `first` (NaN separa)"""
+        valid = np.concatenate(([False], ~np.isnan(ys[first:]), [False]))
+        edges = np.flatnonzero(valid[1:] != valid[:-1]) + first
+        return zip(edges[::2], edges[1::2])
+
+    def _draw_segments(self, xs, ys, first, clip=None):
+        """Desenha preenchimento e linha dos pontos [first:] no conteúdo (lacunas em branco)."""
+        h = self.height()
+        resources = self._resources
+
+        painter = QPainter(self._content)
+        painter.setRenderHint(QPainter.Antialiasing)
+        if clip is not None:
+            painter.setClipRect(clip)
+
+        for start, end in self._runs(ys, first):
+            if end - start < 2:
+                continue
+            line_polygon = QPolygonF([QPointF(x, y) for x, y in zip(xs[start:end], ys[start:end])])
+            polygon = QPolygonF(line_polygon)
+            polygon.prepend(QPointF(xs[start], h)) # Canto inferior esquerdo
+            polygon.append(QPointF(xs[end - 1], h)) # Canto inferior direito
+
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(resources.fill_brush)
+            painter.drawPolygon(polygon)
+
+            painter.setPen(resources.line_pen)
+            painter.setBrush(Qt.NoBrush)
+            painter.drawPolyline(line_polygon)
+        painter.end()
+
+    def _render_content(self):
+        """
+        Atualiza o conteúdo: redesenho completo quando a escala, a cor ou o
+        tamanho mudam; senão desloca a imagem e desenha só os pontos novos.
+        """
+        key, values, total = self._display_series()
+        if key != self._rendered_key:
+            self._rendered_total = -1 # Zoom/modo mudou: redesenho completo
+        recorded = np.flatnonzero(~np.isnan(values))
+        if not len(recorded):
+            # Só lacunas na janela visível
+            self._content_pixels.fill(0)
+            self._rendered_total = total
+            self._rendered_key = key
+            return True
+        scale = self._update_scale(values[recorded[-1]])
+        new_points = total - self._rendered_total
+        if new_points == 0 and scale == self._rendered_scale:
+            return False
+
+        xs, ys = self._point_positions(values, scale, total)
+        dpr = self._content.devicePixelRatio()
+        incremental = (self._rendered_total >= 0 and scale == self._rendered_scale
+                       and new_points < len(values) - 1)
+        if incremental:
+            previous = len(values) - 1 - new_points
+            shift = int(round((self.width() - xs[previous]) * dpr))
+            incremental = 0 < shift < self._content_pixels.shape[1]
+
+        if not incremental:
+            self._content_pixels.fill(0)
+            self._draw_segments(xs, ys, 0)
+        else:
+            # Scroll: copiar deslocado para o outro buffer (sem cópia temporária
+            # de áreas sobrepostas) e trocar os buffers
+            back_pixels, back_image = self._back
+            np.copyto(back_pixels[:, :-shift], self._content_pixels[:, shift:])
+            self._back = (self._content_pixels, self._content)
+            self._content_pixels, self._content = back_pixels, back_image
+
+            strip_left = int(xs[previous] * dpr) - SEGMENT_MARGIN
+            self._content_pixels[:, max(0, strip_left):] = 0
+
+            # Primeiro ponto que ainda influencia a faixa (segmento entrando nela)
+            left_logical = strip_left / dpr - LINE_WIDTH
+            first = max(0, int(np.searchsorted(xs, left_logical)) - 1)
+            clip = QRectF(strip_left / dpr, 0, self.width(), self.height())
+            self._draw_segments(xs, ys, first, clip)
+
+        self._rendered_total = total
+        self._rendered_scale = scale
+        self._rendered_key = key
+        return True
+
+    def _apply_mask(self):
+        """Aplica o FADE "EIXO X" (Esquerda E Direita) no frame, sem alocar."""
+        height, width = self._content_pixels.shape
+        content = self._content_pixels.view(np.uint8).reshape(height, width, 4)
+        np.copyto(self._scratch, content)
+        np.multiply(self._scratch, self._resources.mask, out=self._scratch)
+        np.right_shift(self._scratch, 8, out=self._scratch)
+        np.copyto(self._frame_bytes, self._scratch, casting='unsafe')
+
     def paintEvent(self, event):
         """Desenha o gráfico com scaling instantâneo E FADE NOS DOIS EIXOS."""
         try:
-            painter = QPainter(self)
-            painter.setRenderHint(QPainter.Antialiasing)
-
-            w = self.width()
-            h = self.height()
-
-            if not self.data_points:
-                return
-
-            # --- 1. Lógica de Scaling Instantâneo (Baseado no último ponto) ---
-            current_value = self.data_points[-1]
-            half_range = self.MIN_VERTICAL_RANGE / 2.0
-            graph_min = current_value - half_range
-            graph_max = current_value + half_range
-
-            # --- 2. Clamping (Travar a escala apenas em 0) ---
-            if graph_min < 0.0:
-                overshoot = 0.0 - graph_min
-                graph_min = 0.0
-                graph_max += overshoot
-
-            # --- 3. Normalização e Cálculo do Polígono ---
-            current_range = graph_max - graph_min
-            if current_range < 0.01:
-                current_range = self.MIN_VERTICAL_RANGE
-
-            polygon = QPolygonF()
-            polygon.append(QPointF(0, h)) # Canto inferior esquerdo
-
-            line_polygon = QPolygonF() # Polígono apenas para a linha
+            if self._resources is None or self._dpr != self.devicePixelRatioF():
+                self._build_resources()
 
-            step_x = w / (self.max_points - 1)
+            # Conteúdo e máscara só são refeitos quando há dados novos
+            if self._render_content():
+                self._apply_mask()
 
-            for i, value in enumerate(self.data_points):
-                normalized_y = (value - graph_min) / current_range
-
-                # Clamp de segurança
-                if normalized_y < 0.0: normalized_y = 0.0
-                if normalized_y > 1.0: normalized_y = 1.0
-
-                y = h - (normalized_y * h)
-                x = i * step_x
-
-                polygon.append(QPointF(x, y))
-                line_polygon.append(QPointF(x, y))
-
-            polygon.append(QPointF(w, h)) # Canto inferior direito
-
-            # Cores
-            solid_color = QColor(self.graph_color)
-            faded_color = QColor(self.graph_color)
-            faded_color.setAlphaF(0.0) # 0% opaco
-
-            # --- 4. [ALTERADO] Desenhar o Preenchimento (Fill) em um Buffer ---
-
-            # Criar buffer off-screen para aplicar os dois gradientes
-            buffer = QImage(self.size(), QImage.Format_ARGB32_Premultiplied)
-            buffer.fill(Qt.transparent)
-
-            buffer_painter = QPainter(buffer)
-            buffer_painter.setRenderHint(QPainter.Antialiasing)
-
-            # Etapa 1: Gradiente Vertical (de cima para baixo)
-            v_grad = QLinearGradient(0, 0, 0, h)
-            v_grad.setColorAt(0.0, solid_color.lighter(120)) # Cor no topo
-            v_grad.setColorAt(1.0, faded_color) # Transparente embaixo
-
-            buffer_painter.setPen(Qt.NoPen)
-            buffer_painter.setBrush(v_grad)
-            buffer_painter.drawPolygon(polygon)
-
-            # **ETAPA 2: APLICAR FADE "EIXO X" (Esquerda E Direita)**
-            buffer_painter.setCompositionMode(QPainter.CompositionMode_DestinationIn)
-
-            h_grad_mask = QLinearGradient(0, 0, w, 0)
-            h_grad_mask.setColorAt(0.0, QColor(0,0,0,0))   # Esquerda = Transparente
-            h_grad_mask.setColorAt(0.8, QColor(0,0,0,255)) # 80% = Opaco (Foco)
-            h_grad_mask.setColorAt(1.0, QColor(0,0,0,0))   # Direita = Transparente
-
-            buffer_painter.fillRect(self.rect(), h_grad_mask)
-            buffer_painter.end()
-
-            # --- 5. Desenhar o Buffer na Tela ---
-            painter.drawImage(0, 0, buffer)
-
-            # --- 6. Desenhar a Linha (com Fade Esquerda/Direita) ---
-            h_grad_line = QLinearGradient(0, 0, w, 0)
-            h_grad_line.setColorAt(0.0, faded_color) # Esquerda = Transparente
-            h_grad_line.setColorAt(0.8, solid_color) # 80% = Sólido (Foco)
-            h_grad_line.setColorAt(1.0, faded_color) # Direita = Transparente
-
-            pen = painter.pen()
-            pen.setBrush(h_grad_line)
-            pen.setWidthF(1.5)
-            painter.setPen(pen)
-            painter.setBrush(Qt.NoBrush)
-
-            painter.drawPolyline(line_polygon)
+            painter = QPainter(self)
+            painter.drawImage(QPointF(0, 0), self._frame)
+            painter.end()
 
         except Exception as e:
-            print(f"Erro no paintEvent do MiniGraph: {e}")
+            logger.exception("Erro no paintEvent do MiniGraph: %s", e)
@@ -0,0 +1,157 @@
+from PySide6.QtWidgets import (QFrame, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
+                               QComboBox, QCheckBox, QTableView, QAbstractItemView,
+                               QHeaderView)
+from PySide6.QtCore import QTimer
+from PySide6.QtGui import QFont
+
+from src.ui.adapters.log_model import LogListModel
+from src.utils.log_index import LEVELS, LogIndex
+from src.utils.logger import LOG_FILE
+
+TAIL_INTERVAL = 500       # ms entre verificações de linhas novas no arquivo
+FILTER_DELAY = 250        # ms sem digitar antes de aplicar o filtro de texto
+
+# Opções do filtro de nível (texto, nível mínimo)
+LEVEL_OPTIONS = [("Todos", 0)] + [(name, value) for name, value in LEVELS.items()]
+
+
+class LogViewer(QFrame):
+    """
+    Página de logs (tools): lista virtualizada sobre o arquivo de log. Só
+    as linhas visíveis são lidas do arquivo, então o tamanho do log não
+    pesa na memória nem na rolagem.
+    """
+
+    def __init__(self, path=LOG_FILE, parent=None):
+        super().__init__(parent)
+        self.log_index = LogIndex(path, self)
+        self.model = LogListModel(self.log_index, self)
+
+        self.setup_ui()
+
+        self.model.rows_appended.connect(self.on_rows_appended)
+        self.model.modelReset.connect(self.update_count)
+
+        # Tail: procura linhas novas enquanto a página está ativa
+        self.tail_timer = QTimer(self)
+        self.tail_timer.setInterval(TAIL_INTERVAL)
+        self.tail_timer.timeout.connect(self.log_index.refresh)
+
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(FILTER_DELAY)
+        self.filter_timer.timeout.connect(self.apply_filter)
+
+        # Destruída sem passar por suspend(): parar a thread do índice mesmo assim
+        log_index = self.log_index
+        self.destroyed.connect(lambda *args: log_index.close())
+
+        self.resume()
+
+    def setup_ui(self):
+        self.setObjectName("logViewer")
+        layout = QVBoxLayout(self)
+        # Topo livre para os botões do header (como no dashboard)
+        layout.setContentsMargins(30, 100, 30, 20)
+        layout.setSpacing(12)
+
+        # Barra de filtros
+        toolbar = QHBoxLayout()
+        toolbar.setSpacing(10)
+
+        title = QLabel("Logs")
+        title.setObjectName("sectionTitle")
+        toolbar.addWidget(title)
+        toolbar.addStretch(1)
+
+        self.level_combo = QComboBox()
+        self.level_combo.setObjectName("logLevel")
+        for label, level in LEVEL_OPTIONS:
+            self.level_combo.addItem(label, level)
+        self.level_combo.currentIndexChanged.connect(self.apply_filter)
+        toolbar.addWidget(self.level_combo)
+
+        self.filter_edit = QLineEdit()
+        self.filter_edit.setObjectName("logFilter")
+        self.filter_edit.setPlaceholderText("Filtrar...")
+        self.filter_edit.setClearButtonEnabled(True)
+        self.filter_edit.setFixedWidth(240)
+        self.filter_edit.textChanged.connect(lambda: self.filter_timer.start())
+        toolbar.addWidget(self.filter_edit)
+
+        self.follow_check = QCheckBox("Seguir")
+        self.follow_check.setObjectName("logFollow")
+        self.follow_check.setChecked(self.model.follow)
+        self.follow_check.toggled.connect(self.set_follow)
+        toolbar.addWidget(self.follow_check)
+
+        layout.addLayout(toolbar)
+
+        # Tabela de uma coluna com linhas de altura fixa: ao contrário do
+        # QListView, que percorre todos os itens a cada layout, ela só
+        # consulta o modelo pelas linhas visíveis
+        self.log_view = QTableView()
+        self.log_view.setObjectName("logList")
+        self.log_view.setFont(QFont("Consolas", 9))
+        self.log_view.setShowGrid(False)
+        self.log_view.setWordWrap(False)
+        self.log_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.log_view.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.log_view.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.log_view.horizontalHeader().hide()
+        self.log_view.horizontalHeader().setStretchLastSection(True)
+        rows = self.log_view.verticalHeader()
+        rows.hide()
+        rows.setSectionResizeMode(QHeaderView.Fixed)
+        rows.setDefaultSectionSize(self.log_view.fontMetrics().height() + 4)
+        self.log_view.setModel(self.model)
+        self.log_view.verticalScrollBar().valueChanged.connect(self.on_scrolled)
+        layout.addWidget(self.log_view, 1)
+
+        self.count_label = QLabel()
+        self.count_label.setObjectName("logCount")
+        layout.addWidget(self.count_label)
+
+    # ------------------------------------------------------------------
+
+    def apply_filter(self):
+        self.filter_timer.stop()
+        self.model.set_filter(self.level_combo.currentData() or 0, self.filter_edit.text().strip())
+
+    def set_follow(self, follow):
+        self.model.set_follow(follow)
+        if follow:
+            self.log_view.scrollToBottom()
+
+    def on_rows_appended(self):
+        if self.model.follow:
+            self.log_view.scrollToBottom()
+        self.update_count()
+
+    def on_scrolled(self, value):
+        # Rolar para cima larga o tail; voltar ao fim do arquivo retoma
+        scroll_bar = self.log_view.verticalScrollBar()
+        following = value >= scroll_bar.maximum() and not self.model.canFetchMore()
+        if following != self.model.follow and self.log_view.isVisible():
+            self.follow_check.setChecked(following)
+
+    def update_count(self):
+        total = self.log_index.line_count
+        shown = self.model.available()
+        if shown == total:
+            self.count_label.setText(f"{total:,} linhas".replace(",", "."))
+        else:
+            self.count_label.setText(f"{shown:,} de {total:,} linhas".replace(",", "."))
+
+    # ------------------------------------------------------------------
+    # Ganchos do PageStack
+
+    def suspend(self):
+        """Página escondida: para o tail e a thread do índice"""
+        self.tail_timer.stop()
+        self.log_index.close()
+
+    def resume(self):
+        self.log_index.open()
+        self.log_index.refresh()
+        self.tail_timer.start()
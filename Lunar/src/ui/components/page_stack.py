@@ -0,0 +1,189 @@
+from PySide6.QtWidgets import QStackedWidget
+from PySide6.QtCore import QTimer, Signal
+import time
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Página escondida há mais que isso é suspensa (timers/assinaturas parados)
+PAGE_SUSPEND_AFTER = 30.0     # segundos
+# ... e depois disso destruída (reconstruída pela fábrica na próxima visita)
+PAGE_EVICT_AFTER = 300.0      # segundos
+PAGE_SWEEP_INTERVAL = 5000    # ms entre verificações (só com páginas escondidas)
+MAX_BUILT_PAGES = 4           # Acima disso a menos usada recentemente sai
+
+
+class _PageEntry:
+    __slots__ = ("factory", "prewarm", "widget", "suspended", "hidden_since")
+
+    def __init__(self, factory, prewarm):
+        self.factory = factory
+        self.prewarm = prewarm
+        self.widget = None
+        self.suspended = False
+        self.hidden_since = None
+
+
+class PageStack(QStackedWidget):
+    """
+    Pilha de páginas construídas sob demanda.
+
+    Páginas são registradas como fábricas e só construídas na primeira vez
+    que são mostradas (ou, com `prewarm`, quando o event loop fica ocioso).
+    Páginas escondidas por `suspend_after` segundos recebem `suspend()` e,
+    ao voltar, `resume()` (ganchos opcionais da página); depois de
+    `evict_after` segundos, ou acima de `max_pages`, são destruídas.
+    """
+
+    page_created = Signal(str)
+
+    def __init__(self, parent=None, suspend_after=PAGE_SUSPEND_AFTER,
+                 evict_after=PAGE_EVICT_AFTER, max_pages=MAX_BUILT_PAGES):
+        super().__init__(parent)
+        self.suspend_after = suspend_after
+        self.evict_after = evict_after
+        self.max_pages = max_pages
+        self.current_page = None
+
+        self._pages = {}
+        self._prewarm_queue = []
+
+        self._sweep_timer = QTimer(self)
+        self._sweep_timer.setInterval(PAGE_SWEEP_INTERVAL)
+        self._sweep_timer.timeout.connect(self.sweep)
+
+    def register(self, page_id, factory, prewarm=False):
+        """Registra a fábrica da página (callable sem argumentos que retorna o widget)"""
+        self._pages[page_id] = _PageEntry(factory, prewarm)
+
+    def has_page(self, page_id):
+        return page_id in self._pages
+
+    def page(self, page_id):
+        """Widget da página, se já construída"""
+        entry = self._pages.get(page_id)
+        return entry.widget if entry is not None else None
+
+    def _build(self, page_id):
+        entry = self._pages[page_id]
+        if entry.widget is None:
+            entry.widget = entry.factory()
+            entry.suspended = False
+            entry.hidden_since = time.monotonic()
+            self.addWidget(entry.widget)
+            self.page_created.emit(page_id)
+        return entry.widget
+
+    def show_page(self, page_id):
+        """
+        Mostra a página (construindo-a se preciso). Retorna False se não há
+        página registrada com esse id; nesse caso a atual continua visível.
+        """
+        entry = self._pages.get(page_id)
+        if entry is None:
+            return False
+
+        try:
+            widget = self._build(page_id)
+        except Exception as e:
+            logger.exception("Erro ao construir página '%s': %s", page_id, e)
+            return False
+
+        previous = self._pages.get(self.current_page)
+        if previous is not None and previous is not entry and previous.widget is not None:
+            previous.hidden_since = time.monotonic()
+
+        if entry.suspended:
+            self._call(widget, "resume")
+            entry.suspended = False
+        entry.hidden_since = None
+
+        self.current_page = page_id
+        self.setCurrentWidget(widget)
+        self._update_sweep()
+        return True
+
+    # ------------------------------------------------------------------
+    # Pré-aquecimento
+
+    def prewarm_when_idle(self):
+        """Constrói as páginas com `prewarm`, uma por vez, quando não há eventos pendentes"""
+        self._prewarm_queue = [page_id for page_id, entry in self._pages.items()
+                               if entry.prewarm and entry.widget is None]
+        if self._prewarm_queue:
+            QTimer.singleShot(0, self._prewarm_next)
+
+    def _prewarm_next(self):
+        while self._prewarm_queue:
+            page_id = self._prewarm_queue.pop(0)
+            if self._pages[page_id].widget is not None:
+                continue
+            try:
+                self._build(page_id)
+            except Exception as e:
+                logger.exception("Erro ao pré-construir página '%s': %s", page_id, e)
+            break
+        if self._prewarm_queue:
+            QTimer.singleShot(0, self._prewarm_next)
+        self._update_sweep()
+
+    # ------------------------------------------------------------------
+    # Suspensão e descarte
+
+    @staticmethod
+    def _call(widget, hook):
+        method = getattr(widget, hook, None)
+        if method is None:
+            return
+        try:
+            method()
+        except Exception as e:
+            logger.exception("Erro em %s.%s(): %s", type(widget).__name__, hook, e)
+
+    def _hidden(self):
+        return [(page_id, entry) for page_id, entry in self._pages.items()
+                if entry.widget is not None and page_id != self.current_page]
+
+    def _update_sweep(self):
+        """O timer de verificação só roda enquanto há páginas escondidas"""
+        if self._hidden():
+            if not self._sweep_timer.isActive():
+                self._sweep_timer.start()
+        else:
+            self._sweep_timer.stop()
+
+    def sweep(self, now=None):
+        """Suspende/descarta páginas escondidas há tempo demais"""
+        now = time.monotonic() if now is None else now
+        hidden = self._hidden()
+
+        # Acima do limite: as escondidas há mais tempo saem primeiro
+        hidden.sort(key=lambda item: item[1].hidden_since or now)
+        excess = len(hidden) + (1 if self.current_page in self._pages else 0) - self.max_pages
+
+        for page_id, entry in hidden:
+            idle = now - (entry.hidden_since or now)
+            if excess > 0 or idle >= self.evict_after:
+                self.evict(page_id)
+                excess -= 1
+            elif idle >= self.suspend_after and not entry.suspended:
+                self._call(entry.widget, "suspend")
+                entry.suspended = True
+
+        self._update_sweep()
+
+    def evict(self, page_id):
+        """Destrói a página (a fábrica a reconstrói na próxima visita)"""
+        entry = self._pages.get(page_id)
+        if entry is None or entry.widget is None or page_id == self.current_page:
+            return False
+        widget = entry.widget
+        if not entry.suspended:
+            self._call(widget, "suspend")
+        entry.widget = None
+        entry.suspended = False
+        entry.hidden_since = None
+        self.removeWidget(widget)
+        widget.deleteLater()
+        return True
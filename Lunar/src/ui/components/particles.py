@@ -1,34 +1,252 @@
-import random
+import numpy as np
 from PySide6.QtWidgets import QWidget
-from PySide6.QtCore import Qt, QTimer, QPointF
-from PySide6.QtGui import QPainter, QColor, QBrush
-
-class Particle:
-    def __init__(self, x, y, size, color, speed_x, speed_y, opacity):
-        self.x = x
-        self.y = y
-        self.size = size
-        self.color = color
-        self.speed_x = speed_x
-        self.speed_y = speed_y
-        self.opacity = opacity
-        self.original_opacity = opacity
-        self.fade_direction = random.choice([-1, 1])
-        self.fade_speed = random.uniform(0.005, 0.02)
+from PySide6.QtCore import Qt, QRect, QRectF
+from PySide6.QtGui import QPainter, QColor, QImage
 
+from src.core.animation_clock import AnimationClock
+from src.core.perf_monitor import profiled_paint
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Cores mais vibrantes para serem visíveis através do header
+PARTICLE_COLORS = (
+    "#FFFFFF",  # Branco puro
+    "#DCE6FF",  # Azul muito claro
+    "#F0F0FF",  # Branco azulado
+    "#FFFAFA",  # Branco levemente rosado
+)
+
+# Raios pré-renderizados (antes: random.uniform(1.0, 3.0))
+PARTICLE_SIZES = (1.0, 1.5, 2.0, 2.5, 3.0)
+
+SPRITE_SIZE = 8        # Lado do sprite em pixels (diâmetro máximo 6 + antialias)
+SUBPIXEL_STEPS = 2     # Posições sub-pixel pré-renderizadas por eixo
+OPACITY_LEVELS = 32    # Níveis de opacidade pré-multiplicados por sprite
+EDGE_MARGIN = 50       # Distância fora da tela antes de reposicionar
+DIRTY_TILE_SIZE = 32   # Granularidade da invalidação parcial
+MAX_DIRTY_RECTS = 64   # Acima disso um update() completo sai mais barato
+MIN_OPACITY = 0.1
+PARTICLE_FPS = 30      # Velocidades/fade são definidos por frame a 30 FPS
+
+# Atlas já renderizados por cor de fundo (trocar de tema e voltar não re-renderiza)
+_ATLAS_CACHE = {}
+
+
+class ParticleField:
+    """Estado das partículas em arrays NumPy (struct-of-arrays)."""
+
+    def __init__(self, count, width, height, seed=None):
+        self.count = count
+        self.rng = np.random.default_rng(seed)
+        self.reset(width, height)
+
+    def reset(self, width, height):
+        """Distribui as partículas por toda a área"""
+        n = self.count
+        rng = self.rng
+
+        self.x = rng.uniform(0, width, n)
+        self.y = rng.uniform(0, height, n)
+        # Ordenado por tamanho: cada tamanho vira uma fatia contígua
+        self.size_index = np.sort(rng.integers(0, len(PARTICLE_SIZES), n))
+        self.size_bounds = np.searchsorted(self.size_index,
+                                           np.arange(len(PARTICLE_SIZES) + 1))
+        self.color_index = rng.integers(0, len(PARTICLE_COLORS), n)
+
+        # Velocidades lentas
+        self.speed_x = rng.uniform(-0.1, 0.1, n)
+        self.speed_y = rng.uniform(-0.1, 0.1, n)
+
+        # Opacidade alta para serem visíveis
+        self.original_opacity = rng.uniform(0.3, 0.8, n)
+        self.opacity = self.original_opacity.copy()
+        self.fade_direction = rng.choice([-1.0, 1.0], n)
+        self.fade_speed = rng.uniform(0.005, 0.02, n)
+
+    def step(self, width, height, frames=1.0):
+        """Avança todas as partículas `frames` frames (de 33ms) em uma única passada"""
+        self.x += self.speed_x * frames
+        self.y += self.speed_y * frames
+
+        # Efeito de fade pulsante
+        self.opacity += self.fade_speed * self.fade_direction * frames
+
+        top = self.opacity >= self.original_opacity
+        self.opacity[top] = self.original_opacity[top]
+        self.fade_direction[top] = -1.0
+
+        bottom = self.opacity <= MIN_OPACITY
+        self.opacity[bottom] = MIN_OPACITY
+        self.fade_direction[bottom] = 1.0
+
+        # Reposicionar partículas que saem da tela
+        left = self.x < -EDGE_MARGIN
+        right = self.x > width + EDGE_MARGIN
+        self.x[left] = width + EDGE_MARGIN
+        self.x[right] = -EDGE_MARGIN
+        wrapped = left | right
+        if wrapped.any():
+            self.y[wrapped] = self.rng.uniform(0, height, int(wrapped.sum()))
+
+        above = self.y < -EDGE_MARGIN
+        below = self.y > height + EDGE_MARGIN
+        self.y[above] = height + EDGE_MARGIN
+        self.y[below] = -EDGE_MARGIN
+        wrapped = above | below
+        if wrapped.any():
+            self.x[wrapped] = self.rng.uniform(0, width, int(wrapped.sum()))
+
+    def scale(self, scale_x, scale_y):
+        """Reescala as posições quando a área muda de tamanho"""
+        self.x *= scale_x
+        self.y *= scale_y
+
+
+class ParticleSpriteAtlas:
+    """Sprites pré-renderizados (tamanho x cor x sub-pixel x opacidade)."""
+
+    @classmethod
+    def get(cls, background=None):
+        """Atlas compartilhado para as cores/tamanhos padrão sobre `background`"""
+        atlas = _ATLAS_CACHE.get(background)
+        if atlas is None:
+            atlas = _ATLAS_CACHE[background] = cls(background=background)
+        return atlas
+
+    def __init__(self, colors=PARTICLE_COLORS, sizes=PARTICLE_SIZES, background=None):
+        side = SPRITE_SIZE
+        levels = np.linspace(0.0, 1.0, OPACITY_LEVELS)
+
+        # Com fundo definido, os sprites já saem compostos sobre ele (opacos)
+        self.clear_value = 0
+        if background is not None:
+            self.clear_value = QColor(background).rgba() | 0xFF000000
+
+        # Por tamanho: pixels usados no sprite e tabela só com esses pixels;
+        # `strengths` guarda o alpha de cada pixel antes da composição
+        # sobre o fundo (decide a sobreposição de partículas)
+        self.offsets = []
+        self.tables = []
+        self.strengths = []
+
+        for radius in sizes:
+            table = np.zeros(
+                (len(colors), SUBPIXEL_STEPS, SUBPIXEL_STEPS, OPACITY_LEVELS, side * side),
+                dtype=np.uint32
+            )
+            strength = np.zeros(table.shape, dtype=np.uint8)
+            for ci, color_hex in enumerate(colors):
+                color = QColor(color_hex)
+                for px in range(SUBPIXEL_STEPS):
+                    for py in range(SUBPIXEL_STEPS):
+                        base = self._render_sprite(color, radius,
+                                                   px / SUBPIXEL_STEPS,
+                                                   py / SUBPIXEL_STEPS)
+                        # Pixels pré-multiplicados: escalar os 4 canais pela opacidade
+                        channels = base.view(np.uint8).reshape(-1, 4).astype(np.float32)
+                        scaled = channels[None, :, :] * levels[:, None, None]
+                        strength[ci, px, py] = np.rint(scaled[..., 3])
+                        if background is not None:
+                            scaled = self._composite(scaled, self.clear_value)
+                        scaled = np.rint(scaled).astype(np.uint8)
+                        table[ci, px, py] = scaled.reshape(OPACITY_LEVELS, -1).view(np.uint32)
+
+            # Descartar pixels sempre transparentes (cantos do sprite)
+            used = np.flatnonzero((table != self.clear_value).any(axis=(0, 1, 2, 3)))
+            self.offsets.append(np.divmod(used, side))
+            self.tables.append(np.ascontiguousarray(table[..., used]))
+            self.strengths.append(np.ascontiguousarray(strength[..., used]))
+
+    @staticmethod
+    def _composite(channels, background):
+        """Aplica 'source over' de pixels pré-multiplicados sobre um fundo opaco"""
+        bg = np.array([background], dtype=np.uint32).view(np.uint8).astype(np.float32)
+        alpha = channels[..., 3:4] / 255.0
+        result = channels + bg * (1.0 - alpha)
+        result[..., 3] = 255.0
+        return result
+
+    @staticmethod
+    def _render_sprite(color, radius, offset_x, offset_y):
+        """Desenha um único ponto antialiased e retorna seus pixels ARGB32"""
+        side = SPRITE_SIZE
+        image = QImage(side, side, QImage.Format_ARGB32_Premultiplied)
+        image.fill(Qt.transparent)
+
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(color)
+        center = side / 2
+        painter.drawEllipse(QRectF(center + offset_x - radius, center + offset_y - radius,
+                                   radius * 2, radius * 2))
+        painter.end()
+
+        pixels = np.frombuffer(image.constBits(), dtype=np.uint32,
+                               count=side * side)
+        return pixels.copy()
+
+    @staticmethod
+    def opacity_level(opacity):
+        """Converte opacidades (0-1) para o índice do nível pré-renderizado"""
+        return np.rint(np.clip(opacity, 0.05, 1.0) * (OPACITY_LEVELS - 1)).astype(np.intp)
+
+    def lookup(self, size_index, color_index, phase_x, phase_y, level):
+        """Retorna os pixels (n, k) de partículas de um mesmo tamanho"""
+        return self.tables[size_index][color_index, phase_x, phase_y, level]
+
+    def lookup_strength(self, size_index, color_index, phase_x, phase_y, level):
+        """Alpha (n, k) dos mesmos pixels de lookup()"""
+        return self.strengths[size_index][color_index, phase_x, phase_y, level]
+
+
+@profiled_paint("particles")
 class ParticleSystem(QWidget):
-    def __init__(self, parent=None, particle_count=60):
+    """
+    Campo de partículas de fundo.
+
+    A camada de pixels fica em cache entre frames: a cada passo só os tiles
+    tocados por partículas que mudaram de sprite são redesenhados e
+    invalidados. Com `background` definido a camada é pré-composta sobre a
+    cor de fundo e o widget passa a ser opaco, poupando o Qt de repintar o
+    que está atrás dele. `dirty_regions=False` volta a invalidar o widget
+    inteiro a cada frame.
+    """
+
+    def __init__(self, parent=None, particle_count=60, background=None, dirty_regions=True,
+                 clock=None):
         super().__init__(parent)
-        self.particles = []
         self.particle_count = particle_count
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_particles)
-        self.timer.start(33)  # ~30 FPS
-        
-        # Configurar para ser completamente transparente
+        self.background = background
+        self.dirty_regions = dirty_regions
+        self.static = False
+        self.field = None
+        self.atlas = None
+
+        # Camada de pixels (NumPy) compartilhada com um QImage sem cópia e
+        # o alpha da partícula que desenhou cada pixel
+        self._layer = None
+        self._strength = None
+        self._layer_image = None
+        self._kernels = None
+        self._tile_rows = 0
+        self._tile_cols = 0
+        self._last_keys = None  # Sprite desenhado por partícula no último frame
+        self._last_base = None
+
+        # Frames vêm do relógio central (pausa sozinho quando invisível)
+        self.clock = clock or AnimationClock.instance()
+        self.clock.subscribe(self, self.update_particles, fps=PARTICLE_FPS)
+
         self.setAttribute(Qt.WA_TransparentForMouseEvents)
-        self.setAttribute(Qt.WA_TranslucentBackground)
-        
+        if background is None:
+            # Configurar para ser completamente transparente
+            self.setAttribute(Qt.WA_TranslucentBackground)
+        else:
+            # Camada opaca: o Qt não precisa pintar o que está por baixo
+            self.setAttribute(Qt.WA_OpaquePaintEvent)
+
         # Garantir que fique atrás de outros widgets
         self.lower()
 
@@ -47,34 +265,173 @@ class ParticleSystem(QWidget):
         width = self.width() if self.width() > 0 else 800
         height = self.height() if self.height() > 0 else 600
 
-        # Cores mais vibrantes para serem visíveis através do header
-        colors = [
-            QColor(255, 255, 255),  # Branco puro
-            QColor(220, 230, 255),  # Azul muito claro
-            QColor(240, 240, 255),  # Branco azulado
-            QColor(255, 250, 250),  # Branco levemente rosado
-        ]
-
-        self.particles = []
-        for _ in range(count):
-            # Distribuir partículas por toda a área
-            x = random.uniform(0, width)
-            y = random.uniform(0, height)
-            size = random.uniform(1.0, 3.0)  # Partículas um pouco maiores
-            color = random.choice(colors)
-
-            # Velocidades mais lentas
-            speed_x = random.uniform(-0.1, 0.1)
-            speed_y = random.uniform(-0.1, 0.1)
-
-            # Opacidade mais alta para serem visíveis
-            opacity = random.uniform(0.3, 0.8)
-
-            self.particles.append(Particle(x, y, size, color, speed_x, speed_y, opacity))
-
-    def update_particles(self):
-        """Atualiza posição e estado das partículas"""
-        if not self.isVisible() or not self.initialized:
+        self.particle_count = count
+        if self.atlas is None:
+            self.atlas = ParticleSpriteAtlas.get(self.background)
+        self.field = ParticleField(count, width, height)
+        self._allocate_layer()
+        self.render_layer()
+
+    def set_background(self, background):
+        """Troca a cor de fundo pré-composta (ex.: troca de tema)"""
+        if background == self.background or self.background is None or background is None:
+            return
+        self.background = background
+        self.atlas = ParticleSpriteAtlas.get(background)
+        if self.initialized:
+            self._allocate_layer()
+            self.render_layer()
+            self.update()
+
+    def set_static(self, static):
+        """Congela (ou retoma) a animação; a camada em cache continua sendo exibida"""
+        self.static = static
+        if static:
+            self.clock.unsubscribe(self)
+        else:
+            self.clock.subscribe(self, self.update_particles, fps=PARTICLE_FPS)
+
+    def _allocate_layer(self):
+        """(Re)cria o buffer de pixels com margem para sprites nas bordas"""
+        pad = SPRITE_SIZE
+        self._tile_cols = -(-(max(self.width(), 1) + pad * 2) // DIRTY_TILE_SIZE)
+        self._tile_rows = -(-(max(self.height(), 1) + pad * 2) // DIRTY_TILE_SIZE)
+        width = self._tile_cols * DIRTY_TILE_SIZE
+        height = self._tile_rows * DIRTY_TILE_SIZE
+
+        self._layer = np.full((height, width), self.atlas.clear_value, dtype=np.uint32)
+        self._strength = np.zeros((height, width), dtype=np.uint8)
+        self._layer_image = QImage(self._layer.data, width, height, width * 4,
+                                   QImage.Format_ARGB32_Premultiplied)
+
+        # Deslocamentos de cada pixel do sprite dentro do buffer linear
+        self._kernels = [rows * width + cols for rows, cols in self.atlas.offsets]
+
+        # Força o redesenho completo no próximo frame
+        self._last_keys = np.full(self.field.count, -1, dtype=np.int64)
+        self._last_base = np.zeros(self.field.count, dtype=np.intp)
+
+    def _mark_tiles(self, dirty, base):
+        """Marca os tiles cobertos pelos sprites que começam em `base`"""
+        width = self._layer.shape[1]
+        top, left = np.divmod(base, width)
+        rows = (top // DIRTY_TILE_SIZE, (top + SPRITE_SIZE - 1) // DIRTY_TILE_SIZE)
+        cols = (left // DIRTY_TILE_SIZE, (left + SPRITE_SIZE - 1) // DIRTY_TILE_SIZE)
+        for r in rows:
+            for c in cols:
+                dirty[r, c] = True
+
+    def _touches(self, dirty, base):
+        """Indica quais sprites que começam em `base` cobrem algum tile sujo"""
+        width = self._layer.shape[1]
+        top, left = np.divmod(base, width)
+        rows = (top // DIRTY_TILE_SIZE, (top + SPRITE_SIZE - 1) // DIRTY_TILE_SIZE)
+        cols = (left // DIRTY_TILE_SIZE, (left + SPRITE_SIZE - 1) // DIRTY_TILE_SIZE)
+        touch = np.zeros(base.shape, dtype=bool)
+        for r in rows:
+            for c in cols:
+                touch |= dirty[r, c]
+        return touch
+
+    def render_layer(self):
+        """
+        Redesenha na camada apenas os tiles afetados por partículas que
+        mudaram de sprite. Retorna a grade de tiles sujos (ou None).
+        """
+        field = self.field
+        layer = self._layer.reshape(-1)
+        height, width = self._layer.shape
+
+        # Posição quantizada em sub-pixels
+        qx = np.floor(field.x * SUBPIXEL_STEPS).astype(np.intp)
+        qy = np.floor(field.y * SUBPIXEL_STEPS).astype(np.intp)
+        left = qx // SUBPIXEL_STEPS - SPRITE_SIZE // 2 + SPRITE_SIZE
+        top = qy // SUBPIXEL_STEPS - SPRITE_SIZE // 2 + SPRITE_SIZE
+        phase_x = qx % SUBPIXEL_STEPS
+        phase_y = qy % SUBPIXEL_STEPS
+        level = self.atlas.opacity_level(field.opacity)
+
+        visible = ((left >= 0) & (left <= width - SPRITE_SIZE) &
+                   (top >= 0) & (top <= height - SPRITE_SIZE))
+        base = top * width + left
+
+        # Chave do sprite: posição + fase sub-pixel + nível de opacidade
+        keys = ((base * SUBPIXEL_STEPS + phase_x) * SUBPIXEL_STEPS + phase_y) * OPACITY_LEVELS + level
+        keys[~visible] = -1
+
+        changed = keys != self._last_keys
+        if not changed.any():
+            return None
+
+        dirty = np.zeros((self._tile_rows, self._tile_cols), dtype=bool)
+        self._mark_tiles(dirty, self._last_base[changed & (self._last_keys >= 0)])
+        self._mark_tiles(dirty, base[changed & visible])
+
+        # Limpar tiles sujos inteiros
+        tiles = self._layer.reshape(self._tile_rows, DIRTY_TILE_SIZE,
+                                    self._tile_cols, DIRTY_TILE_SIZE)
+        tile_rows, tile_cols = np.nonzero(dirty)
+        tiles[tile_rows, :, tile_cols, :] = self.atlas.clear_value
+        self._strength.reshape(self._tile_rows, DIRTY_TILE_SIZE, self._tile_cols,
+                               DIRTY_TILE_SIZE)[tile_rows, :, tile_cols, :] = 0
+
+        # Redesenhar toda partícula visível que cobre um tile sujo
+        redraw = visible.copy()
+        redraw[visible] = self._touches(dirty, base[visible])
+
+        for size_index, kernel in enumerate(self._kernels):
+            start, end = field.size_bounds[size_index], field.size_bounds[size_index + 1]
+            group = np.flatnonzero(redraw[start:end]) + start
+            if group.size == 0:
+                continue
+
+            sprite = (size_index, field.color_index[group], phase_x[group],
+                      phase_y[group], level[group])
+            indices = (base[group][:, None] + kernel).ravel()
+            self._draw(layer, indices, self.atlas.lookup(*sprite).ravel(),
+                       self.atlas.lookup_strength(*sprite).ravel())
+
+        self._last_keys = keys
+        self._last_base = base
+        return dirty
+
+    def _draw(self, layer, indices, pixels, strengths):
+        """
+        Sobreposição: em cada pixel fica a partícula de maior alpha (a mais
+        visível), não a de maior valor ARGB, que com sprites já compostos
+        sobre o fundo opaco seria decidida pelo vermelho. É uma aproximação
+        de 'source over' (sem somar partículas sobrepostas), que basta para
+        pontos pequenos e esparsos; em empate fica a última desenhada.
+        """
+        strength = self._strength.reshape(-1)
+        np.maximum.at(strength, indices, strengths)
+        wins = strengths == strength[indices]
+        layer[indices[wins]] = pixels[wins]
+
+    def invalidate_tiles(self, dirty):
+        """Agenda repaint apenas dos tiles sujos (faixas horizontais contíguas)"""
+        # Coluna extra falsa para que nenhuma faixa atravesse de uma linha para outra
+        cols = self._tile_cols + 1
+        padded = np.zeros((self._tile_rows, cols), dtype=np.int8)
+        padded[:, :-1] = dirty
+        edges = np.diff(padded.ravel(), prepend=0)
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+
+        if starts.size > MAX_DIRTY_RECTS:
+            self.update()
+            return
+
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            row, col = divmod(start, cols)
+            self.update(QRect(col * DIRTY_TILE_SIZE - SPRITE_SIZE,
+                              row * DIRTY_TILE_SIZE - SPRITE_SIZE,
+                              (end - start) * DIRTY_TILE_SIZE,
+                              DIRTY_TILE_SIZE))
+
+    def update_particles(self, dt=None):
+        """Atualiza posição e estado das partículas (dt em segundos)"""
+        if not self.isVisible() or not self.initialized or self.static:
             return
 
         width = self.width()
@@ -83,41 +440,21 @@ class ParticleSystem(QWidget):
         if width <= 0 or height <= 0:
             return
 
-        for particle in self.particles:
-            # Atualizar posição
-            particle.x += particle.speed_x
-            particle.y += particle.speed_y
-
-            # Efeito de fade pulsante
-            particle.opacity += particle.fade_speed * particle.fade_direction
-
-            # Garantir que a opacidade fique dentro dos limites válidos
-            if particle.opacity >= particle.original_opacity:
-                particle.opacity = particle.original_opacity
-                particle.fade_direction = -1
-            elif particle.opacity <= 0.1:
-                particle.opacity = 0.1
-                particle.fade_direction = 1
-
-            # Reposicionar partículas que saem da tela
-            if particle.x < -50:
-                particle.x = width + 50
-                particle.y = random.uniform(0, height)
-            elif particle.x > width + 50:
-                particle.x = -50
-                particle.y = random.uniform(0, height)
-
-            if particle.y < -50:
-                particle.y = height + 50
-                particle.x = random.uniform(0, width)
-            elif particle.y > height + 50:
-                particle.y = -50
-                particle.x = random.uniform(0, width)
+        frames = 1.0 if dt is None else dt * PARTICLE_FPS
+        self.field.step(width, height, frames)
+        dirty = self.render_layer()
 
-        self.update()
+        # Nada mudou de sprite: a camada em cache continua válida
+        if dirty is None:
+            return
+
+        if self.dirty_regions:
+            self.invalidate_tiles(dirty)
+        else:
+            self.update()
 
     def paintEvent(self, event):
-        """Desenha as partículas - CORRIGIDO para evitar erros de QPainter"""
+        """Copia a região exposta da camada em cache"""
         if not self.initialized or not self.isVisible():
             return
 
@@ -125,42 +462,33 @@ class ParticleSystem(QWidget):
             painter = QPainter(self)
             if not painter.isActive():
                 return
-                
-            painter.setRenderHint(QPainter.Antialiasing)
-            
-            # IMPORTANTE: Não preencher o fundo - deixar transparente
-            painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
-            
-            for particle in self.particles:
-                # Garantir que a opacidade esteja dentro do range válido
-                opacity = max(0.05, min(1.0, particle.opacity))
-
-                color = QColor(particle.color)
-                color.setAlphaF(opacity)
-
-                painter.setPen(Qt.NoPen)
-                painter.setBrush(QBrush(color))
-
-                # Desenhar partícula
-                painter.drawEllipse(QPointF(particle.x, particle.y), particle.size, particle.size)
-                
+
+            if self.background is None:
+                # IMPORTANTE: Não preencher o fundo - deixar transparente
+                painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
+            else:
+                painter.setCompositionMode(QPainter.CompositionMode_Source)
+
+            target = event.rect()
+            source = target.translated(SPRITE_SIZE, SPRITE_SIZE)
+            painter.drawImage(target, self._layer_image, source)
+
             painter.end()
-            
+
         except Exception as e:
-            print(f"Erro no ParticleSystem paintEvent: {e}")
+            logger.exception("Erro no ParticleSystem paintEvent: %s", e)
 
     def resizeEvent(self, event):
-        """Reinicializa partículas quando o tamanho muda"""
+        """Reescala partículas quando o tamanho muda"""
         super().resizeEvent(event)
-        if self.initialized and event.oldSize().width() > 0 and event.oldSize().height() > 0:
-            old_width = event.oldSize().width()
-            old_height = event.oldSize().height()
-            new_width = event.size().width()
-            new_height = event.size().height()
-
-            scale_x = new_width / old_width
-            scale_y = new_height / old_height
-
-            for particle in self.particles:
-                particle.x *= scale_x
-                particle.y *= scale_y
+        if not self.initialized:
+            return
+
+        if event.oldSize().width() > 0 and event.oldSize().height() > 0:
+            scale_x = event.size().width() / event.oldSize().width()
+            scale_y = event.size().height() / event.oldSize().height()
+            self.field.scale(scale_x, scale_y)
+
+        self._allocate_layer()
+        self.render_layer()
+        self.update()
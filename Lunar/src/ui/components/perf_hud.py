@@ -0,0 +1,90 @@
+from PySide6.QtWidgets import QFrame, QVBoxLayout, QLabel
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QFont
+
+from src.core.perf_monitor import WINDOW, PerfMonitor
+
+REFRESH_INTERVAL = 500    # ms entre atualizações do texto do HUD
+HUD_MARGIN = 12           # Distância do canto inferior direito da janela
+
+
+class PerfHud(QFrame):
+    """
+    Overlay de desempenho (F12 na janela principal): FPS do relógio de
+    animação, tempo de paint por widget, jitter dos timers, atraso do
+    event loop, pausas do GC e CPU/RSS/threads do processo.
+
+    O PerfMonitor só fica ligado enquanto o HUD está visível.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setObjectName("perfHud")
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.monitor = PerfMonitor.instance()
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(10, 8, 10, 8)
+        self.label = QLabel()
+        self.label.setObjectName("perfHudText")
+        self.label.setFont(QFont("Consolas", 9))
+        self.label.setTextFormat(Qt.PlainText)
+        layout.addWidget(self.label)
+
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(REFRESH_INTERVAL)
+        self.refresh_timer.timeout.connect(self.refresh)
+        self.hide()
+
+    def toggle(self):
+        self.set_active(self.isHidden())
+
+    def set_active(self, active):
+        if active:
+            self.monitor.start()
+            self.refresh()
+            self.show()
+            self.raise_()
+            self.refresh_timer.start()
+        else:
+            self.refresh_timer.stop()
+            self.hide()
+            self.monitor.stop()
+
+    def refresh(self):
+        self.label.setText(self.format_report(self.monitor.report()))
+        self.adjustSize()
+        self.reposition()
+
+    def reposition(self):
+        """Canto inferior direito do widget pai"""
+        parent = self.parentWidget()
+        if parent is not None:
+            self.move(parent.width() - self.width() - HUD_MARGIN,
+                      parent.height() - self.height() - HUD_MARGIN)
+
+    @staticmethod
+    def format_report(report):
+        lines = [f"FPS {report['fps']:5.1f}   custo/frame {report['frame_cost']:5.2f} ms", ""]
+
+        lines.append(f"{'paint':<16}{'/s':>6}{'média':>8}{'p95':>8}{'máx':>8}")
+        for name, (rate, mean, p95, peak) in report["paints"].items():
+            lines.append(f"{name:<16}{rate:6.0f}{mean:8.2f}{p95:8.2f}{peak:8.2f}")
+
+        lines.append("")
+        lines.append(f"{'jitter (ms)':<16}{'':>6}{'média':>8}{'p95':>8}{'máx':>8}")
+        for name, (_, mean, p95, peak) in report["jitter"].items():
+            lines.append(f"{name:<16}{'':>6}{mean:8.2f}{p95:8.2f}{peak:8.2f}")
+        _, mean, p95, peak = report["loop_lag"]
+        lines.append(f"{'event loop':<16}{'':>6}{mean:8.2f}{p95:8.2f}{peak:8.2f}")
+
+        collections, gc_peak = report["gc"]
+        process = report["process"]
+        lines.append("")
+        lines.append(f"GC {collections:.0f} coletas em {WINDOW:g} s, pausa máx {gc_peak:.2f} ms")
+        if process is None:
+            lines.append("CPU/RSS/threads: aguardando a telemetria")
+        else:
+            lines.append(f"CPU {process['cpu']:5.1f}%   RSS {process['rss'] / (1024 * 1024):.0f} MB   "
+                         f"threads {process['threads']}")
+        return "\n".join(lines)
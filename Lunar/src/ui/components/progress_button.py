@@ -1,9 +1,19 @@
 # src/ui/components/progress_button.py
 
+import time
+
 from PySide6.QtWidgets import QPushButton, QStyle, QStyleOptionButton
 from PySide6.QtCore import Qt, QTimer, Property, Signal, QRectF
 from PySide6.QtGui import QPainter, QColor, QPen
 
+from src.core.animation_clock import AnimationClock
+from src.core.perf_monitor import profiled_paint
+
+# Velocidade da simulação: 1% a cada 30ms (~33 FPS)
+SIMULATION_STEP_MS = 30
+FINISH_DELAY_MS = 500     # Espera em 100% antes de simulation_finished
+
+@profiled_paint("progress_button")
 class ProgressButton(QPushButton):
     """
     Um QPushButton customizado que exibe um anel de progresso circular
@@ -23,9 +33,15 @@ class ProgressButton(QPushButton):
         self.bg_color = QColor(self.progress_color)
         self.bg_color.setAlphaF(0.2) # Cor de fundo do anel
 
-        # Timer para simulação (apenas para este exemplo)
-        self._timer = QTimer(self)
-        self._timer.timeout.connect(self._update_simulation)
+        # Simulação (apenas para este exemplo): o progresso vem do relógio
+        # de parede e o fim de um timer próprio, então ela termina mesmo com
+        # a aplicação inativa (o relógio central para); o AnimationClock
+        # só redesenha o anel enquanto o botão está visível
+        self._clock = AnimationClock.instance()
+        self._started = None
+        self._finish_timer = QTimer(self)
+        self._finish_timer.setSingleShot(True)
+        self._finish_timer.timeout.connect(self._finish_simulation)
 
     def set_progress(self, value):
         """Define o progresso (0-100) e força o redesenho."""
@@ -47,25 +63,36 @@ class ProgressButton(QPushButton):
         self.set_progress(0) # Começa em 0%
 
         if run_simulation:
-            self._timer.start(30) # Atualiza a cada 30ms
+            self._started = time.monotonic()
+            self._finish_timer.start(100 * SIMULATION_STEP_MS)
+            self._clock.subscribe(self, self._update_simulation,
+                                  fps=1000 // SIMULATION_STEP_MS)
 
     def stop_loading(self):
         """Para o modo de carregamento e restaura o botão."""
         self._loading = False
         self.setEnabled(True)
-        self._timer.stop()
+        self._finish_timer.stop()
+        self._clock.unsubscribe(self)
+        self._started = None
         self._progress = 0
         self.setText(self._base_text) # Restaura texto original
         self.update()
 
-    def _update_simulation(self):
-        """Função interna para o timer de simulação."""
-        if self._progress < 100:
-            self.set_progress(self._progress + 1)
-        else:
-            self._timer.stop()
-            # Espera 500ms e emite o sinal de finalizado
-            QTimer.singleShot(500, self.simulation_finished.emit)
+    def _update_simulation(self, dt):
+        """Frame do relógio: progresso pelo tempo desde o início (alcança após uma pausa)."""
+        elapsed_ms = (time.monotonic() - self._started) * 1000.0
+        progress = min(99, int(elapsed_ms / SIMULATION_STEP_MS))
+        if progress != self._progress:
+            self.set_progress(progress)
+
+    def _finish_simulation(self):
+        """Fim da simulação (timer próprio, independe da visibilidade)."""
+        self._clock.unsubscribe(self)
+        self._started = None
+        self.set_progress(100)
+        # Espera e emite o sinal de finalizado
+        QTimer.singleShot(FINISH_DELAY_MS, self.simulation_finished.emit)
 
     def paintEvent(self, event):
         """
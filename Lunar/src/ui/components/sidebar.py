@@ -1,8 +1,13 @@
 from PySide6.QtWidgets import (QFrame, QVBoxLayout, QPushButton,
                               QLabel, QSizePolicy)
 from PySide6.QtCore import Qt, Signal, QSize
-from PySide6.QtGui import QFont, QPixmap, QPainter, QLinearGradient, QColor, QIcon
-import os
+from PySide6.QtGui import QFont, QPainter, QLinearGradient, QColor, QIcon
+
+from src.ui.adapters.view_model import ViewModel
+from src.utils.icon_manager import IconManager
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
 
 class Sidebar(QFrame):
     navigation_changed = Signal(str)
@@ -10,6 +15,8 @@ class Sidebar(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.current_page = "dashboard"
+        self.view = ViewModel()
+        self.assets = IconManager.instance()
         self.setup_ui()
 
     def setup_ui(self):
@@ -73,22 +80,16 @@ class Sidebar(QFrame):
         logo_label.setFixedHeight(80) # Altura similar ao header_bar
         logo_label.setAlignment(Qt.AlignCenter)
 
-        # Carregar ícone - caminho correto
-        icon_path = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'assets', 'icons', 'logo.png')
-
-        if not os.path.exists(icon_path):
-             # Fallback para pasta local de icons
-             icon_path = os.path.join(os.path.dirname(__file__), '..', 'icons', 'logo.png')
+        # Logo já decodificado e redimensionado pelo cache de assets
+        pixmap = self.assets.pixmap("logo.png", 64)
 
-        if os.path.exists(icon_path):
-            pixmap = QPixmap(icon_path)
-            pixmap = pixmap.scaled(64, 64, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        if pixmap is not None:
             logo_label.setPixmap(pixmap)
         else:
-            print(f"Logo não encontrado: {icon_path}")
+            logger.warning("Logo não encontrado: logo.png")
             logo_label.setText("LUNAR") # Fallback
             logo_label.setFont(QFont("Segoe UI", 18, QFont.Bold))
-            logo_label.setStyleSheet("color: white;")
+            logo_label.setProperty("fallback", "true") # Cor pelo QSS do tema
 
         return logo_label
 
@@ -120,30 +121,27 @@ class Sidebar(QFrame):
             btn.setFixedHeight(108)  # Altura aumentada (72 -> 108)
             btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
 
-            # Lógica para adicionar ícone
-            icon_path = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'assets', 'icons', icon_name)
+            # Ícone pré-escalado para o tamanho exibido
+            pixmap = self.assets.pixmap(icon_name, 54)
 
-            if not os.path.exists(icon_path):
-                icon_path = os.path.join(os.path.dirname(__file__), '..', 'icons', icon_name)
-
-            if os.path.exists(icon_path):
-                pixmap = QPixmap(icon_path)
+            if pixmap is not None:
                 btn.setIcon(QIcon(pixmap))
                 btn.setIconSize(QSize(54, 54)) # Ícone aumentado (36 -> 54)
             else:
-                print(f"Ícone de navegação não encontrado: {icon_path}")
+                logger.warning("Ícone de navegação não encontrado: %s", icon_name)
                 btn.setText(text) # Fallback para texto se ícone falhar
 
             # Conectar sinal
             btn.clicked.connect(lambda checked, pid=page_id: self.on_navigation_click(pid))
 
-            # Estado ativo
-            if is_active:
-                self.set_button_active(btn, True)
+            # Estado ativo: propriedade "active" ligada à página atual
+            self.view.bind_property("page", btn, "active",
+                                    lambda page, pid=page_id: "true" if page == pid else "false")
 
             layout.addWidget(btn)
             self.nav_buttons[page_id] = btn
 
+        self.view.update(page=self.current_page)
         return nav_frame
 
     def create_footer(self):
@@ -169,15 +167,8 @@ class Sidebar(QFrame):
 
     def on_navigation_click(self, page_id):
         """Handler para navegação"""
-        # Atualizar estados dos botões
-        for pid, btn in self.nav_buttons.items():
-            self.set_button_active(btn, pid == page_id)
+        # Atualizar estados dos botões (só os dois que mudam são repolidos)
+        self.view.update(page=page_id)
 
         self.current_page = page_id
         self.navigation_changed.emit(page_id)
-
-    def set_button_active(self, button, active):
-        """Define estado ativo do botão"""
-        button.setProperty("active", "true" if active else "false")
-        button.style().unpolish(button)
-        button.style().polish(button)
@@ -1,7 +1,13 @@
 from PySide6.QtWidgets import QWidget
-from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, Signal, Property
+from PySide6.QtCore import Qt, QEasingCurve, Signal, Property
 from PySide6.QtGui import QPainter, QColor, QPen, QBrush
 
+from src.core.animation_clock import AnimationClock
+from src.core.perf_monitor import profiled_paint
+
+ANIMATION_DURATION = 0.2  # segundos
+
+@profiled_paint("switch")
 class SwitchButton(QWidget):
     toggled = Signal(bool)
 
@@ -12,10 +18,12 @@ class SwitchButton(QWidget):
         self._width = width
         self._height = height
 
-        # Animação
-        self._animation = QPropertyAnimation(self, b"circle_position")
-        self._animation.setDuration(200)
-        self._animation.setEasingCurve(QEasingCurve.InOutQuad)
+        # Animação (quadros do relógio central em vez de um QPropertyAnimation)
+        self._clock = AnimationClock.instance()
+        self._easing = QEasingCurve(QEasingCurve.InOutQuad)
+        self._anim_start = 0.0
+        self._anim_end = 0.0
+        self._anim_elapsed = 0.0
 
         self.setFixedSize(self._width, self._height)
         self.setCursor(Qt.PointingHandCursor)
@@ -44,9 +52,25 @@ class SwitchButton(QWidget):
         if not checked:
             start, end = end, start
 
-        self._animation.setStartValue(start)
-        self._animation.setEndValue(end)
-        self._animation.start()
+        self._anim_start = start
+        self._anim_end = end
+        self._anim_elapsed = 0.0
+
+        if not self.isVisible():
+            # Sem frames enquanto invisível: pular direto para o fim
+            self.set_circle_position(end)
+            return
+
+        self._clock.subscribe(self, self._animation_step, fps=60)
+
+    def _animation_step(self, dt):
+        self._anim_elapsed += dt
+        progress = min(1.0, self._anim_elapsed / ANIMATION_DURATION)
+        eased = self._easing.valueForProgress(progress)
+        self.set_circle_position(self._anim_start + (self._anim_end - self._anim_start) * eased)
+
+        if progress >= 1.0:
+            self._clock.unsubscribe(self)
 
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -2,19 +2,45 @@ from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout,
                               QHBoxLayout, QStatusBar, QMessageBox, QLabel, QFrame,
                               QPushButton)
 from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QFont, QPalette, QColor, QIcon, QPixmap
-import os
+from PySide6.QtGui import QFont, QPalette, QColor, QIcon, QKeySequence, QShortcut
 
 from src.ui.components.sidebar import Sidebar
 from src.ui.components.dashboard import Dashboard
+from src.ui.components.log_viewer import LogViewer
+from src.ui.components.page_stack import PageStack
 from src.ui.components.particles import ParticleSystem
+from src.ui.components.perf_hud import PerfHud
+from src.ui.adapters.view_model import ViewModel
+from src.ui.adapters.theme_manager import ThemeManager
+from src.core.config import Config
+from src.utils.icon_manager import IconManager
+from src.utils.startup_profiler import StartupProfiler
+from src.utils.logger import get_logger
 import traceback
 
+logger = get_logger(__name__)
+
+# Mensagem da barra de status por página
+STATUS_MESSAGES = {
+    "dashboard": "Dashboard - System overview and security controls",
+    "tools": "Tools - Advanced system utilities",
+    "system_info": "System Info - Hardware and software information",
+    "settings": "Settings - Application configuration"
+}
+
 class MainWindow(QMainWindow):
     def __init__(self, spoofer_controller):
         super().__init__()
         self.controller = spoofer_controller
         self.current_page = "dashboard"
+        self.view = ViewModel()
+        self.theme = ThemeManager.instance()
+        self.profiler = StartupProfiler.instance()
+
+        # Ícones começam a ser decodificados em segundo plano já aqui
+        # (não faz nada se o LunarApp já tiver agendado)
+        self.assets = IconManager.instance()
+        self.assets.preload(fonts=False)
 
         self.setup_window()
         QTimer.singleShot(100, self.initialize_ui)
@@ -25,9 +51,11 @@ class MainWindow(QMainWindow):
         self.setGeometry(100, 100, 1400, 900)
         self.setMinimumSize(1200, 800)
 
-        # Aplicar fundo básico
-        self.setStyleSheet("QMainWindow { background-color: #1a1a1a; }")
-        
+        # Aplicar o tema compilado antes de criar os filhos: cada widget é
+        # polido uma única vez ao ser mostrado (load_stylesheet não repete)
+        with self.profiler.phase("stylesheet"):
+            self.load_stylesheet()
+
         self.center_on_screen()
 
     def center_on_screen(self):
@@ -42,15 +70,20 @@ class MainWindow(QMainWindow):
     def initialize_ui(self):
         """Inicializa a UI com partículas"""
         try:
-            self.setup_ui()
-            self.load_stylesheet()
-            print("Interface Lunar com partículas carregada")
+            with self.profiler.phase("initialize_ui"):
+                self.setup_ui()
+                self.load_stylesheet()
+            logger.info("Interface Lunar com partículas carregada")
+            self.profiler.mark_next_paint(self, "ui_paint")
+
+            # Páginas com prewarm são construídas quando o event loop ficar ocioso
+            self.content_stack.prewarm_when_idle()
 
             # Inicializar partículas após um pequeno delay
             QTimer.singleShot(100, self.initialize_particles)
 
         except Exception as e:
-            print(f"Erro na UI: {e}")
+            logger.exception("Erro na UI: %s", e)
             self.setup_fallback_ui()
 
     def setup_ui(self):
@@ -65,37 +98,48 @@ class MainWindow(QMainWindow):
         # main_layout.setContentsMargins(0, 0, 0, 0)
         # main_layout.setSpacing(0)
 
-        # Sistema de partículas como overlay transparente - FUNDO
-        self.particle_system = ParticleSystem(central_widget)
+        # Sistema de partículas como camada de FUNDO, pré-composta sobre a
+        # cor do #centralWidget (main.css) para repintar só tiles sujos
+        with self.profiler.phase("particle_system"):
+            self.particle_system = ParticleSystem(
+                central_widget, background=self.theme.variable("background", default="#141414"))
+        self.theme.theme_changed.connect(self.on_theme_changed)
 
         # HeaderBar REMOVED
 
-        # Área de conteúdo principal
-        self.content_stack = QFrame(central_widget)
+        # Área de conteúdo principal: páginas construídas na primeira visita
+        self.content_stack = PageStack(central_widget)
         self.content_stack.setObjectName("contentStack")
-        content_stack_layout = QVBoxLayout(self.content_stack)
-        content_stack_layout.setContentsMargins(0, 0, 0, 0)
-        content_stack_layout.setSpacing(0)
+        self.register_pages()
 
         # Dashboard
-        self.dashboard = Dashboard(self.controller)
-        content_stack_layout.addWidget(self.dashboard)
+        with self.profiler.phase("dashboard"):
+            self.content_stack.show_page(self.current_page)
 
         # Sidebar (CAMADA SUPERIOR)
-        self.sidebar = Sidebar(central_widget)
+        with self.profiler.phase("sidebar"):
+            self.sidebar = Sidebar(central_widget)
 
         # Floating buttons (header buttons moved here)
-        self.message_btn = self.create_icon_button("message.png", "Messages")
-        self.message_btn.setParent(central_widget)
+        with self.profiler.phase("header_widgets"):
+            self.message_btn = self.create_icon_button("message.png", "Messages")
+            self.message_btn.setParent(central_widget)
 
-        self.notification_btn = self.create_icon_button("no_notification.png", "Notifications")
-        self.notification_btn.setParent(central_widget)
+            self.notification_btn = self.create_icon_button("no_notification.png", "Notifications")
+            self.notification_btn.setParent(central_widget)
 
-        self.user_widget = self.create_user_widget()
-        self.user_widget.setParent(central_widget)
+            self.user_widget = self.create_user_widget()
+            self.user_widget.setParent(central_widget)
 
         # Barra de status
-        self.setup_status_bar()
+        with self.profiler.phase("status_bar"):
+            self.setup_status_bar()
+
+        # HUD de desempenho (F12), por cima de tudo
+        self.perf_hud = PerfHud(central_widget)
+        QShortcut(QKeySequence(Qt.Key_F12), self, self.toggle_perf_hud)
+        if Config.instance().get("perf_hud", False):
+            self.perf_hud.set_active(True)
 
         # Conectar navegação
         self.sidebar.navigation_changed.connect(self.on_navigation_changed)
@@ -103,19 +147,32 @@ class MainWindow(QMainWindow):
         # Chamar a lógica de posicionamento pela primeira vez
         self.update_geometries()
 
+    def register_pages(self):
+        """Fábricas das páginas do content stack (system_info/settings ainda não existem)"""
+        self.content_stack.register("dashboard", lambda: Dashboard(self.controller))
+        self.content_stack.register("tools", LogViewer)
+
+    @property
+    def dashboard(self):
+        return self.content_stack.page("dashboard")
+
     def on_navigation_changed(self, page_id):
         """Handler de navegação"""
+        # Sem página registrada a atual continua visível
+        self.content_stack.show_page(page_id)
         self.current_page = page_id
+        self.view.update(page=page_id)
+        logger.info("Navegando para: %s", page_id)
 
-        status_messages = {
-            "dashboard": "Dashboard - System overview and security controls",
-            "tools": "Tools - Advanced system utilities",
-            "system_info": "System Info - Hardware and software information",
-            "settings": "Settings - Application configuration"
-        }
+    def toggle_perf_hud(self):
+        """Liga/desliga o HUD de desempenho (o estado fica no config.json)"""
+        self.perf_hud.toggle()
+        Config.instance().set("perf_hud", not self.perf_hud.isHidden())
 
-        self.statusBar().showMessage(status_messages.get(page_id, "System ready"))
-        print(f"Navegando para: {page_id}")
+    def on_theme_changed(self, theme):
+        """Atualiza o que não vem do QSS (fundo pré-composto das partículas)"""
+        if hasattr(self, 'particle_system'):
+            self.particle_system.set_background(self.theme.variable("background"))
 
     def setup_fallback_ui(self):
         """UI de fallback"""
@@ -134,6 +191,10 @@ class MainWindow(QMainWindow):
         status_bar.showMessage("Lunar Spoofer initialized - Modern theme active")
         self.setStatusBar(status_bar)
 
+        # Mensagem ligada à página atual (só reescrita quando a página muda)
+        self.view.bind_message("page", status_bar,
+                               lambda page_id: STATUS_MESSAGES.get(page_id, "System ready"))
+
     def resizeEvent(self, event):
         """Gerencia a geometria dos componentes para sobreposição"""
         super().resizeEvent(event)
@@ -205,6 +266,11 @@ class MainWindow(QMainWindow):
                     )
                     self.message_btn.raise_()
 
+        # 6. HUD de desempenho (canto inferior direito, acima de tudo)
+        if hasattr(self, 'perf_hud') and not self.perf_hud.isHidden():
+            self.perf_hud.reposition()
+            self.perf_hud.raise_()
+
     # Methods moved from header_bar.py
 
     def create_icon_button(self, icon_filename, tooltip):
@@ -214,19 +280,14 @@ class MainWindow(QMainWindow):
         btn.setCursor(Qt.PointingHandCursor)
         btn.setToolTip(tooltip)
 
-        icon_path = os.path.join(os.path.dirname(__file__), '..', '..', 'assets', 'icons', icon_filename)
-
-        if not os.path.exists(icon_path):
-           icon_path = os.path.join(os.path.dirname(__file__), '..', 'icons', icon_filename)
+        # AUMENTADO DE 24, 24 para 30, 30 (pixmap já escalado pelo cache de assets)
+        pixmap = self.assets.pixmap(icon_filename, 30)
 
-        if os.path.exists(icon_path):
-            pixmap = QPixmap(icon_path)
-            # AUMENTADO DE 24, 24 para 30, 30
-            pixmap = pixmap.scaled(30, 30, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        if pixmap is not None:
             btn.setIcon(QIcon(pixmap))
-            btn.setIconSize(pixmap.size())
+            btn.setIconSize(pixmap.deviceIndependentSize().toSize())
         else:
-            print(f"Ícone não encontrado: {icon_path}")
+            logger.warning("Ícone não encontrado: %s", icon_filename)
             btn.setText("📧" if "message" in icon_filename else "🔔")
         return btn
 
@@ -256,27 +317,19 @@ class MainWindow(QMainWindow):
     def initialize_particles(self):
         """Inicializa e posiciona o sistema de partículas"""
         if hasattr(self, 'particle_system'):
-            self.particle_system.setGeometry(0, 0, self.width(), self.height())
-            self.particle_system.update()
+            with self.profiler.phase("initialize_particles"):
+                self.particle_system.setGeometry(0, 0, self.width(), self.height())
+                self.particle_system.update()
+            # Última etapa da inicialização: grava o perfil após a pintura
+            self.profiler.mark_next_paint(self.particle_system, "particles_paint", finish=True)
 
     def load_stylesheet(self):
-        """Carrega CSS atualizado de forma mais robusta"""
+        """Aplica o tema compilado (lido e resolvido uma única vez pelo ThemeManager)"""
         try:
-            # Constrói um caminho absoluto para o arquivo CSS
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            css_path = os.path.join(current_dir, 'styles', 'main.css')
-
-            if os.path.exists(css_path):
-                with open(css_path, 'r', encoding='utf-8') as f:
-                    css_content = f.read()
-                    # Aplicar CSS
-                    self.setStyleSheet(css_content)
-                print(f"CSS aplicado com sucesso de: {css_path}")
-            else:
-                print(f"ERRO: Arquivo CSS não encontrado em: {css_path}")
-                self.apply_minimal_styles()
+            if self.theme.apply(self):
+                logger.info("CSS aplicado com sucesso (tema: %s)", self.theme.current)
         except Exception as e:
-            print(f"Erro ao carregar CSS: {e}")
+            logger.error("Erro ao carregar CSS: %s", e)
             self.apply_minimal_styles()
 
     def apply_minimal_styles(self):
@@ -330,6 +383,12 @@ class MainWindow(QMainWindow):
                 font-size: 16px;
                 font-weight: bold;
             }
+            #hardwareValue[metric="cpu"] { color: #50E3C2; }
+            #hardwareValue[metric="memory"] { color: #4A90E2; }
+            #hardwareValue[metric="disk"] { color: #B8E986; }
+            #hardwareValue[level="ready"], #hardwareValue[level="high"] { color: #FF6B6B; }
+            #hardwareValue[level="optimal"] { color: #B8E986; }
+            #hardwareValue[level="moderate"] { color: #FFA726; }
         """
         self.setStyleSheet(minimal_css)
 
@@ -0,0 +1,175 @@
+# src/utils/asset_bundle.py
+#
+# Pacote único de assets (assets/ e src/ui/styles/) em um recurso binário
+# do Qt. Build: `python -m src.utils.asset_bundle` (gera lunar_assets.rcc
+# ao lado do main.py; regerar depois de editar os assets).
+#
+# Em execução o Qt mapeia o .rcc em memória uma única vez e serve cada
+# arquivo direto do mapeamento (sem compressão: sem cópia nem
+# descompressão); o índice é consultado em memória, sem chamadas ao
+# sistema de arquivos. Sem o .rcc tudo é lido do disco, com caminhos
+# relativos ao projeto e não ao diretório de trabalho.
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+from PySide6.QtCore import QDir, QFile, QIODevice, QResource
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent.parent
+BUNDLE_PATH = PROJECT_DIR / "lunar_assets.rcc"
+
+# Pastas empacotadas (relativas ao projeto) e raiz delas dentro do recurso
+BUNDLE_ROOTS = ("assets", "src/ui/styles")
+MAP_ROOT = "/lunar"
+RESOURCE_ROOT = ":" + MAP_ROOT
+
+RCC_COMMAND = "pyside6-rcc"
+
+_state = {"checked": False, "registered": None}
+
+
+# ----------------------------------------------------------------------
+# Tempo de execução
+
+def register(path=BUNDLE_PATH):
+    """Registra o pacote (uma vez); retorna o caminho registrado ou None"""
+    if _state["checked"]:
+        return _state["registered"]
+    _state["checked"] = True
+
+    path = Path(path)
+    if not path.is_file():
+        return None
+    if not QResource.registerResource(str(path), MAP_ROOT):
+        logger.error("Erro ao registrar pacote de assets: %s", path)
+        return None
+    _state["registered"] = path
+    return path
+
+
+def unregister():
+    """Remove o pacote registrado (volta a ler do disco)"""
+    path = _state["registered"]
+    if path is not None:
+        QResource.unregisterResource(str(path), MAP_ROOT)
+    _state["checked"] = False
+    _state["registered"] = None
+
+
+def resolve(relative):
+    """
+    Caminho utilizável pelo Qt (QImage, QFile, QIcon...) para um asset
+    relativo ao projeto: ":/lunar/..." dentro do pacote ou o arquivo em
+    disco. Retorna None se não existir em nenhum dos dois.
+    """
+    relative = relative.replace("\\", "/").lstrip("/")
+    if register() is not None:
+        bundled = f"{RESOURCE_ROOT}/{relative}"
+        if QFile.exists(bundled):
+            return bundled
+
+    path = PROJECT_DIR / relative
+    return str(path) if path.is_file() else None
+
+
+def listdir(relative, pattern="*"):
+    """Nomes dos arquivos de uma pasta de assets (ordenados)"""
+    relative = relative.replace("\\", "/").strip("/")
+    if register() is not None:
+        folder = QDir(f"{RESOURCE_ROOT}/{relative}")
+        if folder.exists():
+            return sorted(folder.entryList([pattern], QDir.Files))
+
+    folder = PROJECT_DIR / relative
+    if not folder.is_dir():
+        return []
+    return sorted(path.name for path in folder.glob(pattern) if path.is_file())
+
+
+def read_bytes(relative):
+    """Conteúdo de um asset (lido do mapeamento quando empacotado)"""
+    location = resolve(relative)
+    if location is None:
+        raise FileNotFoundError(relative)
+    if not location.startswith(":"):
+        return Path(location).read_bytes()
+
+    resource = QFile(location)
+    if not resource.open(QIODevice.ReadOnly):
+        raise OSError(f"Não foi possível abrir {location}")
+    try:
+        return resource.readAll().data()
+    finally:
+        resource.close()
+
+
+def read_text(relative, encoding="utf-8"):
+    return read_bytes(relative).decode(encoding)
+
+
+# ----------------------------------------------------------------------
+# Build
+
+def bundle_files(roots=BUNDLE_ROOTS):
+    """Arquivos empacotados, relativos ao projeto"""
+    files = []
+    for root in roots:
+        for folder, dirs, names in os.walk(PROJECT_DIR / root):
+            dirs[:] = [d for d in dirs if d != "__pycache__"]
+            for name in names:
+                files.append((Path(folder) / name).relative_to(PROJECT_DIR).as_posix())
+    return sorted(files)
+
+
+def build_bundle(output=BUNDLE_PATH, roots=BUNDLE_ROOTS, rcc=RCC_COMMAND):
+    """Gera o .rcc binário (sem compressão) com os arquivos de `roots`"""
+    # Só usados no build (xml.sax puxa urllib/http/ssl: ~60 ms na partida)
+    import subprocess
+    import tempfile
+    from xml.sax.saxutils import escape
+
+    files = bundle_files(roots)
+    entries = "\n".join(f'    <file alias="{escape(name)}">{escape(name)}</file>'
+                        for name in files)
+    qrc = f'<RCC>\n  <qresource prefix="/">\n{entries}\n  </qresource>\n</RCC>\n'
+
+    # O .qrc fica no projeto: os caminhos dentro dele são relativos a ele
+    handle, qrc_path = tempfile.mkstemp(suffix=".qrc", dir=PROJECT_DIR)
+    output = Path(output)
+    partial = output.with_name(output.name + ".tmp")
+    try:
+        with os.fdopen(handle, "w", encoding="utf-8") as f:
+            f.write(qrc)
+        subprocess.run([rcc, "--binary", "--no-compress", qrc_path, "-o", str(partial)],
+                       check=True)
+        os.replace(partial, output)
+    finally:
+        os.unlink(qrc_path)
+        if partial.exists():
+            partial.unlink()
+    return output, files
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Empacota os assets do Lunar em um .rcc")
+    parser.add_argument("--output", default=str(BUNDLE_PATH))
+    parser.add_argument("--rcc", default=RCC_COMMAND)
+    args = parser.parse_args()
+
+    try:
+        output, files = build_bundle(args.output, rcc=args.rcc)
+    except Exception as e:
+        print(f"Erro ao gerar pacote de assets: {e}")
+        return 1
+    print(f"{len(files)} arquivos -> {output} ({output.stat().st_size / 1024:.0f} KB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
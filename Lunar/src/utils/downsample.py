@@ -0,0 +1,126 @@
+# src/utils/downsample.py
+
+import numpy as np
+
+from src.utils.ring_buffer import RingBuffer
+
+# Modos de redução: um ponto por coluna (Largest-Triangle-Three-Buckets)
+# ou o par min/max da coluna
+DOWNSAMPLE_MODES = ("lttb", "minmax")
+
+
+def minmax_buckets(values, bucket_size):
+    """
+    Min e max de cada bucket completo, na ordem em que ocorrem (preserva
+    picos e vales). Retorna 2 pontos por bucket; NaN (lacuna) é ignorado,
+    e um bucket só de NaN continua lacuna.
+    """
+    buckets = len(values) // bucket_size
+    if buckets == 0:
+        return np.empty(0, dtype=np.float64)
+
+    grid = np.asarray(values[:buckets * bucket_size], dtype=np.float64).reshape(buckets, bucket_size)
+    gaps = np.isnan(grid)
+    low_index = np.where(gaps, np.inf, grid).argmin(axis=1)
+    high_index = np.where(gaps, -np.inf, grid).argmax(axis=1)
+    rows = np.arange(buckets)
+    lows = grid[rows, low_index]
+    highs = grid[rows, high_index]
+
+    low_first = low_index <= high_index
+    points = np.empty((buckets, 2), dtype=np.float64)
+    points[:, 0] = np.where(low_first, lows, highs)
+    points[:, 1] = np.where(low_first, highs, lows)
+    return points.ravel()
+
+
+class DownsampleCache:
+    """
+    Série reduzida de um RingBuffer para um nível de zoom.
+
+    Os buckets são alinhados ao número absoluto da amostra (bucket b cobre
+    as amostras [b * bucket_size, (b + 1) * bucket_size)), então um bucket
+    completo nunca muda: cada atualização processa só os buckets novos e o
+    custo não depende do tamanho do histórico. Os pontos reduzidos ficam em
+    `points`, um RingBuffer com `total` próprio, no mesmo formato que o
+    MiniGraphWidget usa para a série bruta.
+    """
+
+    def __init__(self, mode, bucket_size, columns):
+        if mode not in DOWNSAMPLE_MODES:
+            raise ValueError(f"Modo de redução desconhecido: {mode}")
+        self.mode = mode
+        self.bucket_size = bucket_size
+        self.columns = columns
+        per_bucket = 2 if mode == "minmax" else 1
+        self.points = RingBuffer(columns * per_bucket)
+
+        self._consumed = None    # Amostras absolutas já reduzidas
+        self._pending = None     # LTTB: bucket completo aguardando o próximo
+        self._previous = 0.0     # LTTB: valor do último ponto escolhido
+        self._previous_x = 0     # ... e seu x relativo ao bucket pendente
+
+    def update(self, series):
+        """Processa os buckets completados desde a última chamada; retorna `points`"""
+        size = self.bucket_size
+        complete = (series.total // size) * size
+
+        # Primeira vez ou atrasado demais: recomeçar da janela visível
+        # (limitada ao que o RingBuffer ainda guarda)
+        limit = min((self.columns + 1) * size, series.capacity - size)
+        if limit < size:
+            return self.points
+        if self._consumed is None or complete - self._consumed > limit:
+            self._consumed = max(0, complete - limit)
+            self._consumed -= self._consumed % size
+            self._pending = None
+
+        new = complete - self._consumed
+        if new <= 0:
+            return self.points
+
+        samples = series.tail(series.total - self._consumed)[:new]
+        self._consumed = complete
+
+        if self.mode == "minmax":
+            self.points.extend(minmax_buckets(samples, size))
+        else:
+            self._lttb_stream(samples.reshape(-1, size))
+        return self.points
+
+    def _lttb_stream(self, buckets):
+        """LTTB incremental: um bucket é decidido quando o seguinte se completa"""
+        size = self.bucket_size
+        offsets = np.arange(size, dtype=np.float64)
+        chosen = []
+        for bucket in buckets:
+            if self._pending is None:
+                # Sem bucket anterior: ancora no primeiro ponto do pendente
+                self._pending = bucket
+                self._previous = bucket[0]
+                self._previous_x = 0
+                continue
+
+            # Coordenadas relativas ao início do bucket pendente
+            avg_x = size + (size - 1) / 2.0
+            recorded = bucket[~np.isnan(bucket)]
+            avg_y = recorded.mean() if len(recorded) else np.nan
+            prev_x = self._previous_x
+            prev_y = self._previous
+            if np.isnan(avg_y) or np.isnan(prev_y):
+                # Vizinho é lacuna: sem triângulo, fica o primeiro ponto válido
+                # (NaN se o bucket inteiro for lacuna)
+                valid = np.flatnonzero(~np.isnan(self._pending))
+                index = int(valid[0]) if len(valid) else 0
+            else:
+                areas = np.abs((prev_x - avg_x) * (self._pending - prev_y)
+                               - (prev_x - offsets) * (avg_y - prev_y))
+                index = int(np.where(np.isnan(areas), -1.0, areas).argmax())
+            chosen.append(self._pending[index])
+
+            self._previous = self._pending[index]
+            self._previous_x = index - size
+            self._pending = bucket
+
+        if chosen:
+            self.points.extend(chosen)
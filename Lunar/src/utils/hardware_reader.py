@@ -1,62 +1,232 @@
 # src/utils/hardware_reader.py
 
+import os
 import psutil
 import traceback
 import time # NEW IMPORT
+from collections import namedtuple
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Grupos de métricas que snapshot() sabe ler
+METRIC_GROUPS = ("cpu", "memory", "disk", "network", "load", "process")
+
+MB = 1024 * 1024 # 1 MB = 1024*1024 Bytes
+
+# Vazão por dispositivo (MB/s)
+DiskRate = namedtuple("DiskRate", ("name", "read_mbs", "write_mbs"))
+NicRate = namedtuple("NicRate", ("name", "recv_mbs", "sent_mbs"))
+
+class HardwareSnapshot:
+    """
+    Leitura imutável das métricas de hardware em um instante.
+
+    Todas as métricas compartilham o mesmo `timestamp`. `updated` indica
+    quais grupos (METRIC_GROUPS) foram realmente lidos nesta passada; os
+    demais repetem o último valor conhecido.
+    """
+    __slots__ = ("timestamp", "cpu_percent", "cpu_per_core", "memory_percent",
+                 "swap_percent", "disk_mbs", "disks", "network_mbs", "nics",
+                 "load_avg", "process_cpu_percent", "process_rss",
+                 "process_threads", "updated")
+
+    def __init__(self, timestamp, cpu_percent=0.0, cpu_per_core=(), memory_percent=0.0,
+                 swap_percent=0.0, disk_mbs=0.0, disks=(), network_mbs=0.0, nics=(),
+                 load_avg=(0.0, 0.0, 0.0), process_cpu_percent=0.0, process_rss=0,
+                 process_threads=0, updated=frozenset()):
+        values = locals()
+        for name in self.__slots__:
+            object.__setattr__(self, name, values[name])
+        object.__setattr__(self, "cpu_per_core", tuple(cpu_per_core))
+        object.__setattr__(self, "disks", tuple(disks))
+        object.__setattr__(self, "nics", tuple(nics))
+        object.__setattr__(self, "load_avg", tuple(load_avg))
+        object.__setattr__(self, "updated", frozenset(updated))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("HardwareSnapshot é imutável")
+
+    def replace(self, **changes):
+        """Cópia com alguns campos alterados."""
+        values = {name: getattr(self, name) for name in self.__slots__}
+        values.update(changes)
+        return type(self)(**values)
+
+    def with_updated(self, updated):
+        """Cópia com outro conjunto de métricas atualizadas."""
+        return self.replace(updated=updated)
+
+    def __repr__(self):
+        return (f"HardwareSnapshot(cpu={self.cpu_percent:.1f}%, "
+                f"memory={self.memory_percent:.1f}%, disk={self.disk_mbs:.2f} MB/s, "
+                f"network={self.network_mbs:.2f} MB/s)")
+
+def _is_partition(name, base):
+    """sda -> sda1; nvme0n1 / mmcblk0 -> nvme0n1p1 / mmcblk0p1"""
+    suffix = name[len(base):]
+    if not name.startswith(base) or not suffix:
+        return False
+    if base[-1].isdigit():
+        return suffix[0] == "p" and suffix[1:].isdigit()
+    return suffix.isdigit()
+
+def _physical_disks(counters):
+    """Remove partições cujo disco base também está na lista (evita contar em dobro)."""
+    names = set(counters)
+    return {name: io for name, io in counters.items()
+            if not any(_is_partition(name, base) for base in names)}
 
 class HardwareReader:
     def __init__(self):
         """Inicializa o leitor de hardware."""
-        # Inicializar o psutil para a CPU
-        psutil.cpu_percent(interval=None)
+        # Inicializar o psutil para a CPU (por núcleo; o total é a média)
+        psutil.cpu_percent(interval=None, percpu=True)
+
+        self._process = psutil.Process(os.getpid())
+        self._process.cpu_percent(interval=None)
+
+        # NEW: Inicializar contadores de Disco e Rede (por dispositivo)
+        now = time.monotonic()
+        self.last_disk_io = self._read_disks()
+        self.last_disk_time = now
+        self.last_net_io = self._read_nics()
+        self.last_net_time = now
+
+        self._last = HardwareSnapshot(time.time())
+
+    @staticmethod
+    def _read_disks():
+        try:
+            return _physical_disks(psutil.disk_io_counters(perdisk=True) or {})
+        except Exception:
+            return {}
+
+    @staticmethod
+    def _read_nics():
+        try:
+            return psutil.net_io_counters(pernic=True) or {}
+        except Exception:
+            return {}
+
+    def snapshot(self, metrics=METRIC_GROUPS):
+        """
+        Lê os grupos pedidos em uma única passada e retorna um HardwareSnapshot.
+
+        Grupos não pedidos repetem os valores da leitura anterior. Os deltas
+        de disco/rede são calculados desde a última leitura do próprio grupo.
+        """
+        timestamp = time.time()
+        now = time.monotonic()
+        values = {}
+        updated = []
+
+        for group in metrics:
+            try:
+                reader = getattr(self, f"_snapshot_{group}")
+            except AttributeError:
+                raise ValueError(f"Grupo de métricas desconhecido: {group}")
+            try:
+                values.update(reader(now))
+                updated.append(group)
+            except Exception as e:
+                logger.error("Erro ao ler métricas de %s: %s", group, e)
+
+        self._last = self._last.replace(timestamp=timestamp, updated=updated, **values)
+        return self._last
+
+    def _snapshot_cpu(self, now):
+        per_core = psutil.cpu_percent(interval=None, percpu=True)
+        total = sum(per_core) / len(per_core) if per_core else 0.0
+        return {"cpu_percent": total, "cpu_per_core": per_core}
+
+    def _snapshot_memory(self, now):
+        return {
+            "memory_percent": psutil.virtual_memory().percent,
+            "swap_percent": psutil.swap_memory().percent,
+        }
+
+    def _snapshot_disk(self, now):
+        current = self._read_disks()
+        # Delta de tempo (em segundos)
+        time_delta = now - self.last_disk_time
+        if time_delta <= 0:
+            # Evita divisão por zero se chamado rápido demais
+            return {}
+
+        disks = []
+        for name, io in current.items():
+            last = self.last_disk_io.get(name)
+            if last is None:
+                continue
+            disks.append(DiskRate(
+                name,
+                max(0, io.read_bytes - last.read_bytes) / time_delta / MB,
+                max(0, io.write_bytes - last.write_bytes) / time_delta / MB,
+            ))
+
+        # Atualizar "last" para o próximo cálculo
+        self.last_disk_io = current
+        self.last_disk_time = now
+
+        total = sum(disk.read_mbs + disk.write_mbs for disk in disks)
+        return {"disk_mbs": total, "disks": disks}
 
-        # NEW: Inicializar contadores de Disco
-        # Pegar os contadores totais (sem ser por partição)
-        self.last_disk_io = psutil.disk_io_counters(perdisk=False)
-        self.last_disk_time = time.time()
+    def _snapshot_network(self, now):
+        current = self._read_nics()
+        time_delta = now - self.last_net_time
+        if time_delta <= 0:
+            return {}
+
+        nics = []
+        for name, io in current.items():
+            last = self.last_net_io.get(name)
+            if last is None:
+                continue
+            nics.append(NicRate(
+                name,
+                max(0, io.bytes_recv - last.bytes_recv) / time_delta / MB,
+                max(0, io.bytes_sent - last.bytes_sent) / time_delta / MB,
+            ))
+
+        self.last_net_io = current
+        self.last_net_time = now
+
+        total = sum(nic.recv_mbs + nic.sent_mbs for nic in nics)
+        return {"network_mbs": total, "nics": nics}
+
+    def _snapshot_load(self, now):
+        # No Windows o psutil emula o load average (zeros nos primeiros segundos)
+        return {"load_avg": psutil.getloadavg()}
+
+    def _snapshot_process(self, now):
+        # oneshot: uma única consulta ao SO para todos os dados do processo
+        with self._process.oneshot():
+            return {
+                "process_cpu_percent": self._process.cpu_percent(interval=None),
+                "process_rss": self._process.memory_info().rss,
+                "process_threads": self._process.num_threads(),
+            }
 
     def get_cpu_percent(self):
         """Retorna o uso atual da CPU em %."""
         try:
-            return psutil.cpu_percent(interval=None)
+            return self.snapshot(("cpu",)).cpu_percent
         except Exception:
             return 0.0
 
     def get_memory_percent(self):
         """Retorna o uso atual da memória em %."""
         try:
-            memory = psutil.virtual_memory()
-            return memory.percent
+            return self.snapshot(("memory",)).memory_percent
         except Exception:
             return 0.0
 
     def get_disk_mbs(self): # CHANGED: Name and logic
         """Retorna a atividade de R/W do disco em MB/s."""
         try:
-            current_disk_io = psutil.disk_io_counters(perdisk=False)
-            current_disk_time = time.time()
-
-            # Delta de tempo (em segundos)
-            time_delta = current_disk_time - self.last_disk_time
-            if time_delta == 0:
-                # Evita divisão por zero se chamado rápido demais
-                return 0.0
-
-            # Calcular bytes lidos/escritos no intervalo
-            read_delta = current_disk_io.read_bytes - self.last_disk_io.read_bytes
-            write_delta = current_disk_io.write_bytes - self.last_disk_io.write_bytes
-            total_bytes_delta = read_delta + write_delta
-
-            # Calcular MB/s
-            bytes_per_second = total_bytes_delta / time_delta
-            mb_per_second = bytes_per_second / (1024 * 1024) # 1 MB = 1024*1024 Bytes
-
-            # Atualizar "last" para o próximo cálculo
-            self.last_disk_io = current_disk_io
-            self.last_disk_time = current_disk_time
-
-            return mb_per_second
-
+            return self.snapshot(("disk",)).disk_mbs
         except Exception as e:
-            print(f"Erro ao ler atividade do disco (MB/s): {e}")
+            logger.error("Erro ao ler atividade do disco (MB/s): %s", e)
             return 0.0
@@ -1 +1,211 @@
-# TODO: Implement
+# src/utils/icon_manager.py
+
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from PySide6.QtCore import QObject, Qt
+from PySide6.QtGui import QFontDatabase, QGuiApplication, QIcon, QImage, QPixmap
+
+from src.utils import asset_bundle
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Pastas de cada tipo de asset, relativas ao projeto (as demais pastas de
+# ícones são os fallbacks antigos, só em disco)
+SEARCH_DIRS = {
+    "icons": ("assets/icons", "src/ui/icons", "src/icons"),
+    "fonts": ("assets/fonts",),
+}
+
+# Ícones da interface e o tamanho (px lógicos) em que são exibidos
+UI_ICONS = (
+    ("logo.png", 64),
+    ("dashboard.png", 54),
+    ("stools.png", 54),
+    ("sinfo.png", 54),
+    ("settings.png", 54),
+    ("message.png", 30),
+    ("no_notification.png", 30),
+)
+
+PIXMAP_CACHE_LIMIT = 64   # Pixmaps prontos mantidos (LRU)
+DECODE_WORKERS = min(4, os.cpu_count() or 1)
+
+
+def _decode(location, size, dpr):
+    """Decodifica e redimensiona fora da thread da GUI (QImage é seguro em threads)"""
+    image = QImage(location)
+    if image.isNull():
+        return None
+    if size is not None:
+        side = round(size * dpr)
+        image = image.scaled(side, side, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        image.setDevicePixelRatio(dpr)
+    return image
+
+
+class IconManager(QObject):
+    """
+    Cache de assets do processo (ícones e fontes).
+
+    Caminhos são resolvidos uma única vez (no pacote de assets, se houver,
+    ou em disco). `preload()` decodifica e já redimensiona os ícones num
+    pool de threads (como QImage); a thread da GUI só converte para QPixmap
+    na primeira vez que o pixmap é pedido.
+    Pixmaps são compartilhados por (nome, tamanho, devicePixelRatio) com
+    descarte LRU, então construir a janela não decodifica imagem nenhuma.
+    """
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """Cache compartilhado pelo processo"""
+        if cls._instance is None:
+            cls._instance = cls(QGuiApplication.instance())
+        return cls._instance
+
+    def __init__(self, parent=None, limit=PIXMAP_CACHE_LIMIT):
+        super().__init__(parent)
+        self.limit = limit
+        self._lock = threading.Lock()
+        self._paths = {}                  # (tipo, nome) -> caminho para o Qt ou None
+        self._pending = {}                # chave -> Future[QImage]
+        self._pixmaps = OrderedDict()     # chave -> QPixmap (LRU)
+        self._fonts = {}                  # nome -> família registrada
+        self._font_data = {}              # nome -> Future[bytes]
+        self._pool = None
+
+    # ------------------------------------------------------------------
+    # Caminhos
+
+    def path(self, name, kind="icons"):
+        """Caminho do asset para o Qt (None se não existir); resolvido uma única vez"""
+        key = (kind, name)
+        with self._lock:
+            if key in self._paths:
+                return self._paths[key]
+
+        found = None
+        for folder in SEARCH_DIRS[kind]:
+            found = asset_bundle.resolve(f"{folder}/{name}")
+            if found is not None:
+                break
+
+        with self._lock:
+            self._paths[key] = found
+        return found
+
+    @staticmethod
+    def device_pixel_ratio():
+        screen = QGuiApplication.primaryScreen()
+        return screen.devicePixelRatio() if screen is not None else 1.0
+
+    def _executor(self):
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=DECODE_WORKERS,
+                                            thread_name_prefix="asset-decode")
+        return self._pool
+
+    # ------------------------------------------------------------------
+    # Pré-carga
+
+    def preload(self, icons=UI_ICONS, fonts=True, dpr=None):
+        """Agenda a decodificação dos ícones (e a leitura das fontes) em segundo plano"""
+        dpr = dpr or self.device_pixel_ratio()
+        pool = self._executor()
+
+        # Fontes primeiro: load_fonts() espera por elas antes de criar widgets
+        if fonts:
+            for folder in SEARCH_DIRS["fonts"]:
+                for name in asset_bundle.listdir(folder, "*.ttf"):
+                    with self._lock:
+                        if name in self._fonts or name in self._font_data:
+                            continue
+                        self._font_data[name] = pool.submit(asset_bundle.read_bytes,
+                                                            f"{folder}/{name}")
+
+        for name, size in icons:
+            key = (name, size, dpr)
+            path = self.path(name)
+            with self._lock:
+                if path is None or key in self._pixmaps or key in self._pending:
+                    continue
+                self._pending[key] = pool.submit(_decode, path, size, dpr)
+
+    def load_fonts(self):
+        """Registra as fontes pré-carregadas; retorna {arquivo: família}"""
+        self.preload(icons=(), fonts=True)
+        with self._lock:
+            pending = list(self._font_data.items())
+            self._font_data.clear()
+
+        for name, future in pending:
+            try:
+                data = future.result()
+                if not data:
+                    # Arquivo vazio (placeholder): usa a fonte do sistema
+                    self._fonts[name] = None
+                    continue
+                font_id = QFontDatabase.addApplicationFontFromData(data)
+                families = QFontDatabase.applicationFontFamilies(font_id) if font_id >= 0 else []
+                if not families:
+                    raise ValueError("arquivo de fonte inválido")
+                self._fonts[name] = families[0]
+            except Exception as e:
+                logger.error("Erro ao carregar fonte %s: %s", name, e)
+                self._fonts[name] = None
+        return dict(self._fonts)
+
+    # ------------------------------------------------------------------
+    # Acesso
+
+    def pixmap(self, name, size=None, dpr=None):
+        """
+        QPixmap compartilhado do ícone em `size` px lógicos (None = tamanho
+        original). Retorna None se o arquivo não existir ou for inválido.
+        """
+        dpr = dpr or self.device_pixel_ratio()
+        key = (name, size, dpr)
+
+        with self._lock:
+            pixmap = self._pixmaps.get(key)
+            if pixmap is not None:
+                self._pixmaps.move_to_end(key)
+                return pixmap
+            future = self._pending.pop(key, None)
+
+        try:
+            if future is not None:
+                image = future.result()
+            else:
+                # Fora da pré-carga: decodifica aqui mesmo (e fica no cache)
+                path = self.path(name)
+                image = _decode(path, size, dpr) if path is not None else None
+        except Exception as e:
+            logger.error("Erro ao decodificar ícone %s: %s", name, e)
+            image = None
+
+        if image is None:
+            return None
+
+        pixmap = QPixmap.fromImage(image)
+        with self._lock:
+            self._pixmaps[key] = pixmap
+            while len(self._pixmaps) > self.limit:
+                self._pixmaps.popitem(last=False)
+        return pixmap
+
+    def icon(self, name, size=None, dpr=None):
+        """QIcon sobre o pixmap compartilhado (QIcon vazio se não existir)"""
+        pixmap = self.pixmap(name, size, dpr)
+        return QIcon(pixmap) if pixmap is not None else QIcon()
+
+    def shutdown(self):
+        """Encerra o pool de decodificação"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
@@ -0,0 +1,301 @@
+# src/utils/log_index.py
+
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from PySide6.QtCore import QObject, Signal
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+SCAN_CHUNK = 8 * 1024 * 1024   # Bytes indexados por vez (progresso emitido a cada bloco)
+SEARCH_CHUNK = 8 * 1024 * 1024
+LINE_BLOCK = 256               # Linhas lidas do arquivo de uma vez por line()
+LINE_CACHE_BLOCKS = 16         # Blocos de linhas decodificadas guardados (LRU)
+
+# Coluna do nível nas linhas do logger ("2026-10-18 04:58:13,925 WARNING ...")
+LEVEL_COLUMN = 24
+LEVELS = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40, "CRITICAL": 50}
+
+# Primeira letra do nível -> código; 0 = linha sem cabeçalho (continuação)
+_LEVEL_CODES = np.zeros(256, dtype=np.uint8)
+for _name, _code in LEVELS.items():
+    _LEVEL_CODES[ord(_name[0])] = _code
+
+
+class GrowableArray:
+    """Array NumPy que cresce dobrando a capacidade (leituras concorrentes seguras)"""
+
+    def __init__(self, dtype, capacity=1024):
+        self._data = np.empty(capacity, dtype=dtype)
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def extend(self, values):
+        end = self.size + len(values)
+        if end > len(self._data):
+            data = np.empty(max(end, len(self._data) * 2), dtype=self._data.dtype)
+            data[:self.size] = self._data[:self.size]
+            self._data = data   # Leitores com o array antigo continuam válidos
+        self._data[self.size:end] = values
+        self.size = end
+
+    def view(self):
+        return self._data[:self.size]
+
+    def clear(self):
+        self.size = 0
+
+
+class LogIndex(QObject):
+    """
+    Índice de linhas de um arquivo de log.
+
+    Uma thread percorre o arquivo em blocos e guarda o deslocamento de cada
+    linha e o nível (lido do cabeçalho do logger; linhas de traceback
+    herdam o da linha anterior). O texto fica no arquivo: `line(i)` lê um
+    bloco de linhas em volta de `i` e guarda só os últimos blocos lidos.
+    O arquivo só fica aberto durante cada leitura: no Windows um handle
+    aberto impede o rename do RotatingFileHandler. `refresh()` indexa o
+    que foi acrescentado desde a última vez; arquivo rotacionado ou
+    truncado recomeça do zero. Sinais são emitidos da thread do índice
+    (conexões enfileiradas).
+    """
+
+    grew = Signal(int)                  # total de linhas indexadas
+    reset = Signal()                    # arquivo trocado; índice recomeçou
+    search_ready = Signal(int, object)  # token, linhas encontradas (np.ndarray)
+
+    def __init__(self, path, parent=None):
+        super().__init__(parent)
+        self.path = str(path)
+        self._offsets = GrowableArray(np.int64)   # offsets[i] = início da linha i
+        self._offsets.extend([0])
+        self._levels = GrowableArray(np.uint8)
+        self._carry_level = 0
+        self._identity = None
+        self._lines = OrderedDict()     # bloco -> linhas decodificadas (LRU)
+        self._lock = threading.Lock()
+        self._scan_pending = False
+        self._search_token = 0
+        self._pool = None
+        self.open()
+
+    @property
+    def line_count(self):
+        return len(self._offsets) - 1
+
+    # ------------------------------------------------------------------
+    # Indexação (thread do índice)
+
+    def refresh(self):
+        """Agenda a indexação do que foi acrescentado ao arquivo"""
+        with self._lock:
+            if self._scan_pending or self._pool is None:
+                return
+            self._scan_pending = True
+        self._pool.submit(self._scan)
+
+    def _scan(self):
+        with self._lock:
+            self._scan_pending = False
+        try:
+            size = self._check_file()
+            if size:
+                self._index_new_lines(size)
+        except Exception as e:
+            logger.error("Erro ao indexar log %s: %s", self.path, e)
+
+    def _check_file(self):
+        """Tamanho atual do arquivo (recomeça o índice se ele foi trocado)"""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return 0
+        identity = (stat.st_dev, stat.st_ino)
+        indexed = int(self._offsets.view()[-1])
+
+        if identity != self._identity or stat.st_size < indexed:
+            # Rotacionado ou truncado: recomeça
+            if self._identity is not None:
+                self._offsets.clear()
+                self._offsets.extend([0])
+                self._levels.clear()
+                self._lines = OrderedDict()
+                self._carry_level = 0
+                self.reset.emit()
+            self._identity = identity
+        return stat.st_size
+
+    def _read(self, start, end):
+        """Bytes [start, end) do arquivo indexado; None se ele foi trocado ou sumiu"""
+        try:
+            with open(self.path, "rb") as f:
+                stat = os.fstat(f.fileno())
+                if (stat.st_dev, stat.st_ino) != self._identity:
+                    return None
+                f.seek(start)
+                return f.read(end - start)
+        except OSError:
+            return None
+
+    def _index_new_lines(self, size):
+        position = int(self._offsets.view()[-1])
+
+        while position < size:
+            # Bloco com pelo menos uma linha completa (linhas gigantes dobram o bloco)
+            length = SCAN_CHUNK
+            while True:
+                end = min(position + length, size)
+                data = self._read(position, end)
+                if data is None:
+                    return   # Trocado no meio: o próximo refresh recomeça
+                chunk = np.frombuffer(data, dtype=np.uint8)
+                newlines = np.flatnonzero(chunk == 10)
+                if newlines.size or end == size or len(data) < end - position:
+                    break
+                length *= 2
+            if not newlines.size:
+                break   # Última linha ainda sem "\n": espera o resto
+
+            starts = np.empty(newlines.size, dtype=np.int64)
+            starts[0] = 0
+            starts[1:] = newlines[:-1] + 1
+            self._levels.extend(self._line_levels(chunk, starts, newlines))
+            self._offsets.extend(newlines + 1 + position)
+            position += int(newlines[-1]) + 1
+            self.grew.emit(self.line_count)
+
+    def _line_levels(self, chunk, starts, ends):
+        """Nível de cada linha do bloco; continuações herdam o da anterior"""
+        codes = np.zeros(len(starts), dtype=np.uint8)
+        header = (ends - starts) > LEVEL_COLUMN
+        first = starts[header]
+        valid = ((chunk[first + 4] == ord("-")) & (chunk[first + 19] == ord(","))
+                 & (chunk[first + 23] == ord(" ")))
+        first = first[valid]
+        codes[np.flatnonzero(header)[valid]] = _LEVEL_CODES[chunk[first + LEVEL_COLUMN]]
+
+        # Propaga o último nível conhecido para as linhas sem cabeçalho
+        known = np.where(codes != 0, np.arange(len(codes)), -1)
+        np.maximum.accumulate(known, out=known)
+        levels = np.where(known >= 0, codes[np.maximum(known, 0)], self._carry_level).astype(np.uint8)
+        self._carry_level = int(levels[-1])
+        return levels
+
+    # ------------------------------------------------------------------
+    # Leitura (qualquer thread)
+
+    def line(self, number):
+        """Texto da linha (sem o fim de linha)"""
+        offsets = self._offsets.view()
+        if not 0 <= number < len(offsets) - 1:
+            return ""
+        block, at = divmod(number, LINE_BLOCK)
+        cache = self._lines
+        lines = cache.get(block)
+        if lines is None or at >= len(lines):
+            # Bloco novo ou que cresceu desde a última leitura
+            first = block * LINE_BLOCK
+            last = min(first + LINE_BLOCK, len(offsets) - 1)
+            data = self._read(int(offsets[first]), int(offsets[last]))
+            if data is None:
+                return ""
+            starts = (offsets[first:last + 1] - offsets[first]).tolist()
+            lines = [data[a:b].rstrip(b"\r\n").decode("utf-8", errors="replace")
+                     for a, b in zip(starts, starts[1:])]
+            cache[block] = lines
+            if len(cache) > LINE_CACHE_BLOCKS:
+                cache.popitem(last=False)
+        cache.move_to_end(block)
+        return lines[at]
+
+    def level(self, number):
+        levels = self._levels.view()
+        return int(levels[number]) if 0 <= number < len(levels) else 0
+
+    def levels(self, lines):
+        """Níveis de várias linhas de uma vez"""
+        return self._levels.view()[lines]
+
+    def lines_at_level(self, min_level, start=0, end=None):
+        """Números das linhas com nível >= min_level (índice pré-calculado)"""
+        levels = self._levels.view()[start:end]
+        return np.flatnonzero(levels >= min_level) + start
+
+    def search(self, text, start=0, end=None):
+        """
+        Procura `text` (sem diferenciar maiúsculas) nas linhas [start, end)
+        em segundo plano; o resultado chega por `search_ready(token, linhas)`.
+        Uma busca nova cancela a anterior. Retorna o token.
+        """
+        with self._lock:
+            self._search_token += 1
+            token = self._search_token
+            if self._pool is None:
+                return token
+        needle = text.lower().encode("utf-8")
+        end = self.line_count if end is None else end
+        self._pool.submit(self._search, token, needle, start, end)
+        return token
+
+    def _search(self, token, needle, start, end):
+        try:
+            offsets = self._offsets.view()
+            found = []
+            line = start
+            while line < end:
+                if token != self._search_token:
+                    return   # Cancelada por uma busca mais nova
+                # Blocos em fronteiras de linha: nenhuma ocorrência fica cortada
+                stop = int(np.searchsorted(offsets, offsets[line] + SEARCH_CHUNK, "right")) - 1
+                stop = min(max(stop, line + 1), end)
+                block = self._read(int(offsets[line]), int(offsets[stop]))
+                if block is None:
+                    return   # Arquivo trocado: o índice vai recomeçar
+                block = block.lower()
+                positions = []
+                at = block.find(needle)
+                while at >= 0:
+                    positions.append(at)
+                    # Uma ocorrência basta por linha: pula para a próxima
+                    newline = block.find(b"\n", at)
+                    if newline < 0:
+                        break
+                    at = block.find(needle, newline + 1)
+                if positions:
+                    found.append(np.searchsorted(offsets[line:stop + 1],
+                                                 np.asarray(positions) + offsets[line], "right") - 1 + line)
+                line = stop
+            lines = np.concatenate(found) if found else np.empty(0, dtype=np.int64)
+            self.search_ready.emit(token, lines)
+        except Exception as e:
+            logger.error("Erro ao buscar no log: %s", e)
+
+    # ------------------------------------------------------------------
+
+    def open(self):
+        """Religa a thread depois de close()"""
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="log-index")
+
+    def close(self):
+        """
+        Para a thread do índice e solta as linhas em cache. As linhas já
+        indexadas ficam: open() + refresh() continuam de onde parou, ou
+        recomeçam se o arquivo foi rotacionado nesse meio tempo.
+        """
+        with self._lock:
+            pool, self._pool = self._pool, None
+            self._search_token += 1
+            self._scan_pending = False   # Um scan cancelado não pode travar o próximo refresh
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+        self._lines = OrderedDict()
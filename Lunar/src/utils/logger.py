@@ -1 +1,299 @@
-# TODO: Implement
+# src/utils/logger.py
+
+import atexit
+import itertools
+import logging
+import logging.handlers
+import queue
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent.parent
+
+ROOT_LOGGER = "lunar"
+LOG_FILE = PROJECT_DIR / "logs" / "lunar.log"
+LOG_MAX_BYTES = 1024 * 1024   # Rotação a cada 1 MB
+LOG_BACKUPS = 5
+LOG_RING_SIZE = 5000          # Entradas em memória para a UI
+
+# Mesma linha de código repetindo: até REPEAT_BURST mensagens por janela de
+# REPEAT_WINDOW s; o resto é só contado e resumido quando a janela acaba
+# (com a fila parada, a thread de escrita confere a cada REPEAT_POLL s)
+REPEAT_BURST = 5
+REPEAT_WINDOW = 10.0
+REPEAT_POLL = 1.0
+
+FILE_FORMAT = "%(asctime)s %(levelname)-7s %(name)s: %(message)s"
+CONSOLE_FORMAT = "%(message)s"
+
+
+class LogEntry:
+    """Entrada do anel em memória (já formatada pela thread de escrita)"""
+    __slots__ = ("seq", "created", "level", "levelname", "name", "message")
+
+    def __init__(self, seq, created, level, levelname, name, message):
+        self.seq = seq
+        self.created = created
+        self.level = level
+        self.levelname = levelname
+        self.name = name
+        self.message = message
+
+
+class LogRing(logging.Handler):
+    """
+    Últimas entradas de log em memória, para a UI ler sem tocar em arquivo.
+    Cada entrada tem um `seq` crescente: `since(seq)` devolve só as novas.
+    """
+
+    def __init__(self, capacity=LOG_RING_SIZE):
+        super().__init__()
+        self.entries = deque(maxlen=capacity)
+        self._counter = itertools.count(1)
+        self.last_seq = 0
+
+    def emit(self, record):
+        message = record.getMessage()
+        if record.exc_info:
+            message = f"{message}\n{logging.Formatter().formatException(record.exc_info)}"
+        entry = LogEntry(next(self._counter), record.created, record.levelno,
+                         record.levelname, record.name, message)
+        with self.lock:
+            self.entries.append(entry)
+            self.last_seq = entry.seq
+
+    def since(self, seq=0, level=logging.NOTSET):
+        """Entradas com seq > `seq` (e nível >= `level`), da mais antiga para a mais nova"""
+        with self.lock:
+            if seq >= self.last_seq:
+                return []
+            entries = list(self.entries)
+        start = max(0, len(entries) - (self.last_seq - seq))
+        return [entry for entry in entries[start:] if entry.level >= level]
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+class _RepeatFilter(logging.Filter):
+    """
+    Limita mensagens repetidas da mesma linha de código (barato: roda na
+    thread que loga, com um lock porque qualquer thread pode logar).
+
+    Acabada a janela, `expired()` devolve o último registro suprimido de
+    cada linha com a contagem das outras repetições, para o resumo não se
+    perder quando a rajada para.
+    """
+
+    def __init__(self, burst=REPEAT_BURST, window=REPEAT_WINDOW):
+        super().__init__()
+        self.burst = burst
+        self.window = window
+        self._lock = threading.Lock()
+        # (logger, linha, modelo) -> [início da janela, emitidas, suprimidas, último suprimido]
+        self._sites = {}
+        self._pending = set()   # Linhas com suprimidas ainda sem resumo
+
+    def filter(self, record):
+        key = (record.name, record.lineno, record.msg)
+        now = time.monotonic()
+        with self._lock:
+            state = self._sites.get(key)
+            if state is None or now - state[0] >= self.window:
+                if state is not None and state[2]:
+                    # Resumo ainda não saiu: vai junto desta mensagem
+                    record.repeated = state[2]
+                    self._pending.discard(key)
+                self._sites[key] = [now, 1, 0, None]
+                return True
+            state[1] += 1
+            if state[1] <= self.burst:
+                return True
+            state[2] += 1
+            state[3] = record
+            self._pending.add(key)
+            return False
+
+    def expired(self, force=False):
+        """Resumos das janelas que acabaram (todas as pendentes com `force`)"""
+        if not self._pending:
+            return []
+        now = time.monotonic()
+        summaries = []
+        with self._lock:
+            for key in list(self._pending):
+                state = self._sites[key]
+                if force or now - state[0] >= self.window:
+                    record = state[3]
+                    record.repeated = state[2] - 1   # Ele próprio sai no log
+                    summaries.append(record)
+                    state[2] = 0
+                    state[3] = None
+                    self._pending.discard(key)
+        summaries.sort(key=lambda record: record.created)
+        return summaries
+
+
+class _AsyncHandler(logging.handlers.QueueHandler):
+    """
+    Só enfileira: a mensagem é montada aqui (barato), mas tracebacks e
+    escrita em console/arquivo ficam na thread do QueueListener.
+    """
+
+    def handle(self, record):
+        # Resumos de rajadas já encerradas saem antes do registro novo
+        self.flush_repeats()
+        return super().handle(record)
+
+    def flush_repeats(self, force=False):
+        for repeat in self.filters:
+            if isinstance(repeat, _RepeatFilter):
+                for summary in repeat.expired(force):
+                    self.enqueue(self.prepare(summary))
+
+    def prepare(self, record):
+        message = record.getMessage()
+        repeated = getattr(record, "repeated", 0)
+        if repeated:
+            message = f"{message} (+{repeated} repetições suprimidas)"
+        record.msg = message
+        record.args = None
+        return record
+
+
+class _RepeatListener(logging.handlers.QueueListener):
+    """
+    QueueListener que não depende de um registro novo para soltar os
+    resumos: com a fila vazia por REPEAT_POLL s, pede ao handler os das
+    janelas que já acabaram.
+    """
+
+    def __init__(self, record_queue, source, *handlers, **kwargs):
+        super().__init__(record_queue, *handlers, **kwargs)
+        self.source = source
+
+    def dequeue(self, block):
+        while True:
+            try:
+                return self.queue.get(block, REPEAT_POLL if block else None)
+            except queue.Empty:
+                if not block:
+                    raise
+                self.source.flush_repeats()
+
+
+class _LoggingState:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.queue = queue.SimpleQueue()
+        self.ring = LogRing()
+        self.handler = None
+        self.listener = None
+        self.outputs = []   # Handlers da thread de escrita (fora o anel)
+        self.configured = False
+
+
+_state = _LoggingState()
+
+
+def setup_logging(level="INFO", log_file=None, console=True, ring_size=LOG_RING_SIZE,
+                  repeat_burst=REPEAT_BURST, repeat_window=REPEAT_WINDOW):
+    """
+    Configura (ou reconfigura) o log da aplicação. Retorna o LogRing.
+
+    `log_file` liga o arquivo rotativo (None = só console e memória). Pode
+    ser chamado de novo (ex.: LunarApp ligando o arquivo depois que um
+    módulo já logou); o anel em memória é preservado. `repeat_burst`
+    mensagens da mesma linha por `repeat_window` s passam; o resto é contado.
+    """
+    with _state.lock:
+        _stop_listener()
+
+        if _state.ring.entries.maxlen != ring_size:
+            ring = LogRing(ring_size)
+            ring.entries.extend(_state.ring.entries)
+            _state.ring = ring
+
+        detailed = logging.Formatter(FILE_FORMAT)
+        _state.ring.setFormatter(detailed)
+        handlers = []
+
+        if console:
+            stream = logging.StreamHandler()
+            stream.setFormatter(logging.Formatter(CONSOLE_FORMAT))
+            handlers.append(stream)
+
+        if log_file is not None:
+            try:
+                path = Path(log_file)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                rotating = logging.handlers.RotatingFileHandler(
+                    path, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUPS, encoding="utf-8")
+                rotating.setFormatter(detailed)
+                handlers.append(rotating)
+            except Exception as e:
+                print(f"Erro ao abrir arquivo de log: {e}")
+
+        root = logging.getLogger(ROOT_LOGGER)
+        if _state.handler is None:
+            _state.handler = _AsyncHandler(_state.queue)
+            _state.handler.addFilter(_RepeatFilter())
+            root.addHandler(_state.handler)
+            root.propagate = False
+        for repeat in _state.handler.filters:
+            repeat.burst = repeat_burst
+            repeat.window = repeat_window
+        set_level(level)
+
+        _state.outputs = handlers
+        _state.listener = _RepeatListener(
+            _state.queue, _state.handler, _state.ring, *handlers, respect_handler_level=True)
+        _state.listener.start()
+        _state.configured = True
+        return _state.ring
+
+
+def set_level(level):
+    """Nível mínimo das mensagens ("DEBUG", "INFO", ... ou o número)"""
+    try:
+        logging.getLogger(ROOT_LOGGER).setLevel(level if isinstance(level, int) else str(level).upper())
+    except ValueError as e:
+        print(f"Erro ao definir nível de log: {e}")
+
+
+def get_logger(name):
+    """Logger da aplicação para um módulo (`get_logger(__name__)`)"""
+    if not _state.configured:
+        setup_logging()
+    if name.startswith("src."):
+        name = name[len("src."):]
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
+
+
+def log_ring():
+    """Anel em memória com as últimas entradas (para a UI)"""
+    return _state.ring
+
+
+def _stop_listener():
+    if _state.handler is not None:
+        _state.handler.flush_repeats(force=True)   # Resumos pendentes não se perdem
+    if _state.listener is not None:
+        _state.listener.stop()   # Processa o que estiver na fila antes de parar
+        _state.listener = None
+    for handler in _state.outputs:
+        handler.close()
+    _state.outputs = []
+
+
+def shutdown_logging():
+    """Esvazia a fila e para a thread de escrita"""
+    with _state.lock:
+        _stop_listener()
+        _state.configured = False
+
+
+atexit.register(shutdown_logging)
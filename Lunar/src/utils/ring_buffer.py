@@ -0,0 +1,55 @@
+# src/utils/ring_buffer.py
+
+import numpy as np
+
+class RingBuffer:
+    """Buffer circular de capacidade fixa sobre um array NumPy pré-alocado."""
+
+    def __init__(self, capacity, fill=0.0, dtype=np.float64):
+        self.capacity = capacity
+        self._data = np.full(capacity, fill, dtype=dtype)
+        self._head = 0   # Próxima posição de escrita (= amostra mais antiga)
+        self.total = 0   # Contador monotônico de amostras recebidas
+
+    def __len__(self):
+        return self.capacity
+
+    def append(self, value):
+        """Sobrescreve a amostra mais antiga em O(1)."""
+        self._data[self._head] = value
+        self._head = (self._head + 1) % self.capacity
+        self.total += 1
+
+    def extend(self, values):
+        """Adiciona várias amostras de uma vez."""
+        values = np.asarray(values, dtype=self._data.dtype)
+        received = len(values)
+        values = values[-self.capacity:]
+        n = len(values)
+        end = self._head + n
+        if end <= self.capacity:
+            self._data[self._head:end] = values
+        else:
+            split = self.capacity - self._head
+            self._data[self._head:] = values[:split]
+            self._data[:n - split] = values[split:]
+        self._head = end % self.capacity
+        self.total += received
+
+    def values(self):
+        """Cópia ordenada (mais antiga -> mais recente)."""
+        if self._head == 0:
+            return self._data.copy()
+        return np.concatenate((self._data[self._head:], self._data[:self._head]))
+
+    def tail(self, count):
+        """Cópia ordenada das `count` amostras mais recentes (count <= capacity)."""
+        count = min(count, self.capacity)
+        start = self._head - count
+        if start >= 0:
+            return self._data[start:self._head].copy()
+        return np.concatenate((self._data[start:], self._data[:self._head]))
+
+    @property
+    def last(self):
+        return self._data[self._head - 1]
@@ -0,0 +1,257 @@
+# src/utils/startup_profiler.py
+
+import builtins
+import json
+import platform
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+DEFAULT_REPORT_PATH = "startup_profile.json"
+REPORT_VERSION = 1
+TOP_IMPORTS = 40   # Módulos listados no resumo impresso
+
+
+class _ImportTimer:
+    """
+    Substitui builtins.__import__ e mede cada módulo carregado pela primeira
+    vez: tempo cumulativo (com os imports que ele dispara) e tempo próprio.
+    Só a thread principal é medida.
+    """
+
+    def __init__(self):
+        self.records = {}   # módulo -> [cumulativo, próprio] em segundos
+        self._stack = []    # tempo gasto em imports filhos, por nível
+        self._original = None
+        self._thread = threading.get_ident()
+
+    def install(self):
+        if self._original is None:
+            self._original = builtins.__import__
+            builtins.__import__ = self._import
+
+    def uninstall(self):
+        if self._original is not None:
+            builtins.__import__ = self._original
+            self._original = None
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        original = self._original
+        if level or threading.get_ident() != self._thread:
+            return original(name, globals, locals, fromlist, level)
+
+        # "from pacote import submódulo" carrega o submódulo mesmo com o
+        # pacote já importado
+        key = name
+        if name in sys.modules:
+            pending = [item for item in fromlist or ()
+                       if f"{name}.{item}" not in sys.modules
+                       and not hasattr(sys.modules[name], item)]
+            if not pending:
+                return original(name, globals, locals, fromlist, level)
+            key = f"{name}.{pending[0]}" if len(pending) == 1 else f"{name}.{{{','.join(pending)}}}"
+
+        self._stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return original(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - start
+            children = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += elapsed
+            record = self.records.setdefault(key, [0.0, 0.0])
+            record[0] += elapsed
+            record[1] += elapsed - children
+
+
+class StartupProfiler:
+    """
+    Perfil da inicialização (`main.py --profile-startup[=arquivo.json]`).
+
+    Cada fase registra tempo de parede e de CPU do processo, aninhada na
+    fase aberta no momento; marcas registram instantes (ex.: primeira
+    pintura). Com o perfil desligado `phase()` e `mark()` não fazem nada.
+    `finish()` grava o relatório JSON e imprime um resumo.
+    """
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """Perfil compartilhado pelo processo (desligado até enable())"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        self.enabled = False
+        self.finished = False
+        self.path = DEFAULT_REPORT_PATH
+        self.exit_when_done = False
+        self.phases = []
+        self.marks = []
+        self._open = []
+        self._imports = _ImportTimer()
+        self._origin_wall = 0.0
+        self._origin_cpu = 0.0
+        self._origin_epoch = 0.0
+        self._watchers = []
+
+    @staticmethod
+    def requested(argv):
+        """Caminho do relatório se `--profile-startup[=arquivo]` estiver em argv, senão None"""
+        for arg in argv:
+            if arg == "--profile-startup":
+                return DEFAULT_REPORT_PATH
+            if arg.startswith("--profile-startup="):
+                return arg.split("=", 1)[1] or DEFAULT_REPORT_PATH
+        return None
+
+    def enable(self, path=DEFAULT_REPORT_PATH, exit_when_done=False):
+        """Liga o perfil; deve ser chamado antes dos imports a medir"""
+        self.enabled = True
+        self.path = path
+        self.exit_when_done = exit_when_done
+        self._origin_wall = time.perf_counter()
+        self._origin_cpu = time.process_time()
+        self._origin_epoch = time.time()
+        self._imports.install()
+
+    # ------------------------------------------------------------------
+    # Registro
+
+    def _now(self):
+        return ((time.perf_counter() - self._origin_wall) * 1000.0,
+                (time.process_time() - self._origin_cpu) * 1000.0)
+
+    @contextmanager
+    def phase(self, name):
+        """Mede o bloco como uma fase (aninhada na fase aberta, se houver)"""
+        if not self.enabled or self.finished:
+            yield
+            return
+
+        wall, cpu = self._now()
+        entry = {
+            "name": name,
+            "parent": self._open[-1]["name"] if self._open else None,
+            "depth": len(self._open),
+            "start_ms": wall,
+        }
+        self.phases.append(entry)
+        self._open.append(entry)
+        try:
+            yield
+        finally:
+            end_wall, end_cpu = self._now()
+            entry["wall_ms"] = end_wall - wall
+            entry["cpu_ms"] = end_cpu - cpu
+            self._open.remove(entry)
+
+    def mark(self, name):
+        """Registra um instante (ms desde enable())"""
+        if self.enabled and not self.finished:
+            self.marks.append({"name": name, "at_ms": self._now()[0]})
+
+    def mark_next_paint(self, widget, name, finish=False):
+        """Marca a próxima pintura do widget; com `finish` grava o relatório em seguida"""
+        if not self.enabled or self.finished:
+            return
+
+        from PySide6.QtCore import QEvent, QObject, QTimer
+
+        profiler = self
+
+        class PaintWatcher(QObject):
+            def eventFilter(self, watched, event):
+                if event.type() == QEvent.Paint:
+                    watched.removeEventFilter(self)
+                    profiler.mark(name)
+                    if finish:
+                        # Depois que a pintura terminar
+                        QTimer.singleShot(0, profiler.finish)
+                return False
+
+        watcher = PaintWatcher(widget)
+        self._watchers.append(watcher)
+        widget.installEventFilter(watcher)
+
+    # ------------------------------------------------------------------
+    # Relatório
+
+    def report(self):
+        wall, cpu = self._now()
+        try:
+            from PySide6 import __version__ as pyside_version
+        except Exception:
+            pyside_version = None
+
+        # Intervalos ociosos entre fases de topo (ex.: QTimer.singleShot fixos)
+        gaps = []
+        top = [entry for entry in self.phases if entry["depth"] == 0 and "wall_ms" in entry]
+        for previous, current in zip(top, top[1:]):
+            idle = current["start_ms"] - (previous["start_ms"] + previous["wall_ms"])
+            if idle >= 1.0:
+                gaps.append({"after": previous["name"], "before": current["name"], "idle_ms": idle})
+
+        imports = sorted(
+            ({"module": name, "self_ms": own * 1000.0, "cumulative_ms": total * 1000.0}
+             for name, (total, own) in self._imports.records.items()),
+            key=lambda item: item["self_ms"], reverse=True)
+
+        return {
+            "version": REPORT_VERSION,
+            "created": self._origin_epoch,
+            "argv": sys.argv,
+            "python": platform.python_version(),
+            "pyside": pyside_version,
+            "platform": platform.platform(),
+            "total_wall_ms": wall,
+            "total_cpu_ms": cpu,
+            "phases": self.phases,
+            "marks": self.marks,
+            "gaps": gaps,
+            "imports": imports,
+        }
+
+    def finish(self):
+        """Grava o relatório (uma vez) e imprime o resumo"""
+        if not self.enabled or self.finished:
+            return None
+        self._imports.uninstall()
+        data = self.report()
+        self.finished = True
+
+        try:
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+        except Exception as e:
+            print(f"Erro ao gravar perfil de inicialização: {e}")
+
+        self.print_summary(data)
+
+        if self.exit_when_done:
+            from PySide6.QtCore import QCoreApplication
+            app = QCoreApplication.instance()
+            if app is not None:
+                app.exit(0)
+        return data
+
+    def print_summary(self, data):
+        print(f"\nPerfil de inicialização -> {self.path}")
+        print(f"{'fase':<34} {'início ms':>10} {'parede ms':>10} {'CPU ms':>9}")
+        for entry in data["phases"]:
+            label = "  " * entry["depth"] + entry["name"]
+            print(f"{label:<34} {entry['start_ms']:10.1f} "
+                  f"{entry.get('wall_ms', float('nan')):10.1f} {entry.get('cpu_ms', float('nan')):9.1f}")
+        for entry in data["marks"]:
+            print(f"{'@ ' + entry['name']:<34} {entry['at_ms']:10.1f}")
+        for entry in data["gaps"]:
+            print(f"{'… ocioso antes de ' + entry['before']:<34} {'':>10} {entry['idle_ms']:10.1f}")
+        print(f"{'total':<34} {'':>10} {data['total_wall_ms']:10.1f} {data['total_cpu_ms']:9.1f}")
+
+        print(f"\n{'import (tempo próprio)':<40} {'próprio ms':>10} {'cumul. ms':>10}")
+        for entry in data["imports"][:TOP_IMPORTS]:
+            print(f"{entry['module']:<40} {entry['self_ms']:10.1f} {entry['cumulative_ms']:10.1f}")
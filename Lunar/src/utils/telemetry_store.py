@@ -0,0 +1,251 @@
+# src/utils/telemetry_store.py
+
+import math
+import mmap
+import struct
+import threading
+from pathlib import Path
+
+import numpy as np
+
+# Métricas do HardwareSnapshot gravadas no histórico (nomes dos atributos)
+CHANNELS = ("cpu_percent", "memory_percent", "swap_percent",
+            "disk_mbs", "network_mbs", "process_cpu_percent")
+
+# (segundos por bucket, buckets no anel): 1 dia em 1 s, 7 dias em 1 min, 1 ano em 1 h
+RESOLUTIONS = ((1, 86400), (60, 7 * 24 * 60), (3600, 365 * 24))
+
+# Junto do projeto, como os logs (não na pasta de onde o app foi chamado)
+PROJECT_DIR = Path(__file__).resolve().parent.parent.parent
+HISTORY_FILE = PROJECT_DIR / "telemetry_history.bin"
+
+MAGIC = b"LUNARTS1"
+HEADER_SIZE = 4096
+# magic, nº de canais, nº de resoluções, nomes dos canais ("\0"-separados) vêm depois
+HEADER_FORMAT = "<8sII"
+
+
+def record_dtype(channel_count):
+    """Registro de largura fixa de um bucket: agregados por canal."""
+    return np.dtype([
+        ("bucket", "<i8"),   # timestamp // resolução (0 = vazio)
+        ("count", "<u4"),
+        ("pad", "<u4"),
+        ("min", "<f4", (channel_count,)),
+        ("max", "<f4", (channel_count,)),
+        ("sum", "<f8", (channel_count,)),
+    ])
+
+
+class TelemetryStore:
+    """
+    Histórico persistente de telemetria em um arquivo mapeado em memória.
+
+    Um anel de buckets de largura fixa por resolução (1 s, 1 min, 1 h),
+    cada um com min/max/soma/contagem por canal. Cada amostra atualiza o
+    bucket corrente de todas as resoluções; o bucket de um timestamp fica
+    sempre no slot `bucket % capacidade`, então leitura e escrita são acesso
+    direto ao slot, sem varrer nem carregar o histórico para a RAM.
+    """
+
+    def __init__(self, path=HISTORY_FILE, channels=CHANNELS,
+                 resolutions=RESOLUTIONS):
+        self.path = Path(path)
+        self.channels = tuple(channels)
+        self.resolutions = tuple(sorted(resolutions))
+        self._index = {name: i for i, name in enumerate(self.channels)}
+        self._dtype = record_dtype(len(self.channels))
+        self._lock = threading.Lock()
+
+        self._file = None
+        self._map = None
+        self.rings = []
+        self._open()
+
+    # ------------------------------------------------------------------
+    # Arquivo
+
+    def _header(self):
+        names = "\0".join(self.channels).encode("utf-8")
+        layout = b"".join(struct.pack("<II", seconds, capacity)
+                          for seconds, capacity in self.resolutions)
+        header = struct.pack(HEADER_FORMAT, MAGIC, len(self.channels),
+                             len(self.resolutions)) + layout + names
+        if len(header) > HEADER_SIZE:
+            raise ValueError("Cabeçalho do histórico de telemetria grande demais")
+        return header.ljust(HEADER_SIZE, b"\0")
+
+    def _open(self):
+        header = self._header()
+        size = HEADER_SIZE + sum(capacity * self._dtype.itemsize
+                                 for _, capacity in self.resolutions)
+
+        fresh = True
+        if self.path.exists() and self.path.stat().st_size == size:
+            with open(self.path, "rb") as f:
+                fresh = f.read(HEADER_SIZE) != header
+
+        if fresh:
+            # Layout novo ou diferente: recriar zerado (truncate gera um
+            # arquivo esparso; bucket 0 = slot vazio)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "wb") as f:
+                f.write(header)
+                f.truncate(size)
+
+        self._file = open(self.path, "r+b")
+        self._map = mmap.mmap(self._file.fileno(), size)
+
+        offset = HEADER_SIZE
+        self.rings = []
+        for _, capacity in self.resolutions:
+            ring = np.ndarray((capacity,), dtype=self._dtype, buffer=self._map, offset=offset)
+            self.rings.append(ring)
+            offset += capacity * self._dtype.itemsize
+
+    def flush(self):
+        with self._lock:
+            if self._map is not None:
+                self._map.flush()
+
+    def close(self):
+        """Grava e libera o mapeamento"""
+        with self._lock:
+            if self._map is None:
+                return
+            self.rings = []
+            self._map.flush()
+            self._map.close()
+            self._file.close()
+            self._map = None
+            self._file = None
+
+    # ------------------------------------------------------------------
+    # Escrita
+
+    def add(self, snapshot):
+        """Grava os canais de um HardwareSnapshot no seu timestamp"""
+        self.record(snapshot.timestamp,
+                    [getattr(snapshot, name) for name in self.channels])
+
+    def record(self, timestamp, values):
+        """Acumula uma amostra (valores na ordem de `channels`) em todas as resoluções"""
+        values = np.asarray(values, dtype=np.float64)
+        second = int(timestamp)
+
+        with self._lock:
+            for (seconds, capacity), ring in zip(self.resolutions, self.rings):
+                bucket = second // seconds
+                slot = ring[bucket % capacity]
+                if slot["bucket"] != bucket:
+                    # Bucket novo sobrescreve o mais antigo do anel
+                    slot["bucket"] = bucket
+                    slot["count"] = 1
+                    slot["min"] = values
+                    slot["max"] = values
+                    slot["sum"] = values
+                else:
+                    slot["count"] += 1
+                    np.minimum(slot["min"], values, out=slot["min"])
+                    np.maximum(slot["max"], values, out=slot["max"])
+                    slot["sum"] += values
+
+    # ------------------------------------------------------------------
+    # Consultas
+
+    def _read_buckets(self, level, first, last):
+        """Registros dos buckets [first, last) de uma resolução (válidos ou não)"""
+        capacity = self.resolutions[level][1]
+        buckets = np.arange(first, last, dtype=np.int64)
+        records = self.rings[level][buckets % capacity]
+        return buckets, records, records["bucket"] == buckets
+
+    def query(self, start, end, channel, max_points=600):
+        """
+        Série de [start, end) de um canal na resolução mais fina que caiba em
+        `max_points` buckets e ainda cubra `start`. Retorna um dict com
+        `resolution`, `timestamps`, `min`, `max` e `avg` (NaN onde não há dados).
+        O custo depende só de `max_points`, não do tamanho do histórico.
+        """
+        column = self._index[channel]
+        span = max(0.0, end - start)
+
+        level = len(self.resolutions) - 1
+        for i, (seconds, capacity) in enumerate(self.resolutions):
+            if span / seconds <= max_points and span <= seconds * capacity:
+                level = i
+                break
+
+        seconds, capacity = self.resolutions[level]
+        first = int(start) // seconds
+        last = int(math.ceil(end / seconds))
+        first = max(first, last - min(capacity, max_points))
+
+        with self._lock:
+            buckets, records, valid = self._read_buckets(level, first, last)
+            lows = np.where(valid, records["min"][:, column], np.nan)
+            highs = np.where(valid, records["max"][:, column], np.nan)
+            sums = records["sum"][:, column]
+            counts = records["count"]
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            avg = np.where(valid & (counts > 0), sums / counts, np.nan)
+
+        return {
+            "resolution": seconds,
+            "timestamps": buckets * seconds,
+            "min": lows,
+            "max": highs,
+            "avg": avg,
+        }
+
+    def summary(self, start, end):
+        """
+        Min/max/média de cada canal em [start, end).
+
+        O intervalo é decomposto do grosso para o fino: horas inteiras no
+        meio, minutos e segundos só nas bordas. Cada resolução lê no máximo
+        algumas dezenas de buckets, então o custo não cresce com o histórico.
+        Retorna {canal: (min, max, avg)} (NaN quando não há dados).
+        """
+        size = len(self.channels)
+        acc = [np.full(size, np.inf), np.full(size, -np.inf), np.zeros(size), 0]
+
+        with self._lock:
+            self._accumulate(acc, int(start), int(math.ceil(end)),
+                             len(self.resolutions) - 1)
+
+        lows, highs, sums, count = acc
+        result = {}
+        for i, name in enumerate(self.channels):
+            if count:
+                result[name] = (float(lows[i]), float(highs[i]), float(sums[i] / count))
+            else:
+                result[name] = (math.nan, math.nan, math.nan)
+        return result
+
+    def _accumulate(self, acc, start, end, level):
+        if start >= end:
+            return
+        seconds = self.resolutions[level][0]
+        if level == 0:
+            first, last = start // seconds, -(-end // seconds)
+        else:
+            # Só buckets inteiramente dentro do intervalo
+            first, last = -(-start // seconds), end // seconds
+            if first >= last:
+                self._accumulate(acc, start, end, level - 1)
+                return
+            self._accumulate(acc, start, first * seconds, level - 1)
+            self._accumulate(acc, last * seconds, end, level - 1)
+
+        capacity = self.resolutions[level][1]
+        first = max(first, last - capacity)
+        _, records, valid = self._read_buckets(level, first, last)
+        records = records[valid]
+        if len(records) == 0:
+            return
+        np.minimum(acc[0], records["min"].min(axis=0), out=acc[0])
+        np.maximum(acc[1], records["max"].max(axis=0), out=acc[1])
+        acc[2] += records["sum"].sum(axis=0)
+        acc[3] += int(records["count"].sum())
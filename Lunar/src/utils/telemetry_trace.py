@@ -0,0 +1,252 @@
+# src/utils/telemetry_trace.py
+
+import math
+import mmap
+import random
+import struct
+import time
+from collections import namedtuple
+from pathlib import Path
+
+from src.utils.hardware_reader import METRIC_GROUPS, DiskRate, HardwareSnapshot, NicRate
+
+MAGIC = b"LUNARTR1"
+TRACE_VERSION = 1
+HEADER_FORMAT = "<8sI"    # magic, versão
+
+# Registros: 1 byte de tipo + corpo
+RECORD_NAME = b"N"        # id (u16), tamanho (u8), nome utf-8 de disco/placa de rede
+RECORD_SAMPLE = b"S"      # timestamp (f64), máscara dos grupos lidos (u8), grupos
+SAMPLE_HEAD = struct.Struct("<dB")
+NAME_HEAD = struct.Struct("<HB")
+
+# Corpo de cada grupo (só os grupos lidos na amostra são gravados, em
+# float32; os demais repetem a amostra anterior, como no HardwareReader)
+CPU_HEAD = struct.Struct("<fB")        # total, nº de núcleos (+ f32 por núcleo)
+MEMORY = struct.Struct("<ff")          # memória, swap
+DEVICES_HEAD = struct.Struct("<fB")    # total MB/s, nº de dispositivos
+DEVICE = struct.Struct("<Hff")         # id do nome, leitura/recebido, escrita/enviado
+LOAD = struct.Struct("<fff")
+PROCESS = struct.Struct("<fQH")        # cpu %, rss, threads
+
+BUFFER_SIZE = 64 * 1024
+FLUSH_INTERVAL = 1.0      # Segundos entre flushes (trace legível após um crash)
+
+# Parâmetros de reprodução: speed 1 = tempo real, N = N vezes mais rápido,
+# 0 = o mais rápido possível; loop recomeça o trace ao chegar no fim
+TraceReplay = namedtuple("TraceReplay", ("path", "speed", "loop"), defaults=(1.0, False))
+
+
+class TraceWriter:
+    """
+    Grava snapshots do HardwareReader em um trace binário compacto.
+
+    Cada amostra guarda o timestamp e só os grupos lidos nela; nomes de
+    discos e placas de rede vão uma única vez para uma tabela de nomes.
+    O buffer é descarregado a cada FLUSH_INTERVAL: se o processo morrer,
+    o trace perde no máximo esse trecho (e a amostra incompleta do fim é
+    ignorada na leitura).
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "wb", buffering=BUFFER_SIZE)
+        self._file.write(struct.pack(HEADER_FORMAT, MAGIC, TRACE_VERSION))
+        self._names = {}
+        self._flushed = time.monotonic()
+        self.count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def write(self, snapshot):
+        mask = 0
+        parts = []
+        for bit, group in enumerate(METRIC_GROUPS):
+            if group in snapshot.updated:
+                mask |= 1 << bit
+                parts.append(getattr(self, f"_encode_{group}")(snapshot))
+        # Nomes novos já foram gravados pelos _encode_*, antes da amostra
+        self._file.write(RECORD_SAMPLE + SAMPLE_HEAD.pack(snapshot.timestamp, mask))
+        self._file.write(b"".join(parts))
+        self.count += 1
+
+        now = time.monotonic()
+        if now - self._flushed >= FLUSH_INTERVAL:
+            self._file.flush()
+            self._flushed = now
+
+    def flush(self):
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _name_id(self, name):
+        name_id = self._names.get(name)
+        if name_id is None:
+            name_id = self._names[name] = len(self._names)
+            encoded = name.encode("utf-8")[:255]
+            self._file.write(RECORD_NAME + NAME_HEAD.pack(name_id, len(encoded)) + encoded)
+        return name_id
+
+    def _encode_devices(self, total, devices):
+        return DEVICES_HEAD.pack(total, len(devices)) + b"".join(
+            DEVICE.pack(self._name_id(name), first, second) for name, first, second in devices)
+
+    def _encode_cpu(self, snapshot):
+        cores = snapshot.cpu_per_core
+        return CPU_HEAD.pack(snapshot.cpu_percent, len(cores)) + struct.pack(f"<{len(cores)}f", *cores)
+
+    def _encode_memory(self, snapshot):
+        return MEMORY.pack(snapshot.memory_percent, snapshot.swap_percent)
+
+    def _encode_disk(self, snapshot):
+        return self._encode_devices(snapshot.disk_mbs, snapshot.disks)
+
+    def _encode_network(self, snapshot):
+        return self._encode_devices(snapshot.network_mbs, snapshot.nics)
+
+    def _encode_load(self, snapshot):
+        return LOAD.pack(*snapshot.load_avg)
+
+    def _encode_process(self, snapshot):
+        return PROCESS.pack(snapshot.process_cpu_percent, snapshot.process_rss,
+                            snapshot.process_threads)
+
+
+def write_trace(path, snapshots):
+    """Grava uma sequência de snapshots; retorna quantos foram gravados"""
+    with TraceWriter(path) as writer:
+        for snapshot in snapshots:
+            writer.write(snapshot)
+        return writer.count
+
+
+def read_trace(path):
+    """
+    Itera os snapshots de um trace (arquivo mapeado, lido sob demanda).
+    Grupos não gravados numa amostra repetem os valores da anterior.
+    Um registro incompleto no fim (gravação interrompida) encerra a leitura.
+    """
+    with open(path, "rb") as f:
+        if f.seek(0, 2) < struct.calcsize(HEADER_FORMAT):
+            raise ValueError(f"Trace de telemetria inválido: {path}")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            magic, version = struct.unpack_from(HEADER_FORMAT, data, 0)
+            if magic != MAGIC or version != TRACE_VERSION:
+                raise ValueError(f"Trace de telemetria inválido: {path}")
+            yield from _decode(data, struct.calcsize(HEADER_FORMAT))
+
+
+def _decode(data, offset):
+    names = {}
+    last = HardwareSnapshot(0.0)
+    size = len(data)
+
+    def devices(offset, rate_type):
+        total, count = DEVICES_HEAD.unpack_from(data, offset)
+        offset += DEVICES_HEAD.size
+        items = []
+        for _ in range(count):
+            name_id, first, second = DEVICE.unpack_from(data, offset)
+            offset += DEVICE.size
+            items.append(rate_type(names[name_id], first, second))
+        return offset, total, items
+
+    def sample(offset):
+        timestamp, mask = SAMPLE_HEAD.unpack_from(data, offset)
+        offset += SAMPLE_HEAD.size
+        values = {}
+        updated = []
+        for bit, group in enumerate(METRIC_GROUPS):
+            if not mask & (1 << bit):
+                continue
+            updated.append(group)
+            if group == "cpu":
+                total, cores = CPU_HEAD.unpack_from(data, offset)
+                offset += CPU_HEAD.size
+                values["cpu_percent"] = total
+                values["cpu_per_core"] = struct.unpack_from(f"<{cores}f", data, offset)
+                offset += 4 * cores
+            elif group == "memory":
+                values["memory_percent"], values["swap_percent"] = MEMORY.unpack_from(data, offset)
+                offset += MEMORY.size
+            elif group == "disk":
+                offset, values["disk_mbs"], values["disks"] = devices(offset, DiskRate)
+            elif group == "network":
+                offset, values["network_mbs"], values["nics"] = devices(offset, NicRate)
+            elif group == "load":
+                values["load_avg"] = LOAD.unpack_from(data, offset)
+                offset += LOAD.size
+            elif group == "process":
+                (values["process_cpu_percent"], values["process_rss"],
+                 values["process_threads"]) = PROCESS.unpack_from(data, offset)
+                offset += PROCESS.size
+        return offset, timestamp, updated, values
+
+    while offset < size:
+        kind = data[offset:offset + 1]
+        offset += 1
+        try:
+            if kind == RECORD_NAME:
+                name_id, length = NAME_HEAD.unpack_from(data, offset)
+                offset += NAME_HEAD.size
+                if offset + length > size:
+                    return
+                names[name_id] = bytes(data[offset:offset + length]).decode("utf-8")
+                offset += length
+                continue
+            if kind != RECORD_SAMPLE:
+                raise ValueError(f"Registro desconhecido no trace na posição {offset - 1}")
+            offset, timestamp, updated, values = sample(offset)
+        except struct.error:
+            # Registro cortado no fim do arquivo (processo morto antes do flush)
+            return
+
+        last = last.replace(timestamp=timestamp, updated=updated, **values)
+        yield last
+
+def synthetic_trace(duration=60.0, rate=1.0, cores=8, disks=2, nics=2, seed=0, start=0.0):
+    """
+    Snapshots sintéticos e determinísticos (passeio aleatório com `seed`)
+    a `rate` amostras por segundo, todos os grupos lidos em cada amostra.
+    Para estressar o pipeline com taxas que o psutil não alcança.
+    """
+    rng = random.Random(seed)
+    disk_names = [f"disk{i}" for i in range(disks)]
+    nic_names = [f"eth{i}" for i in range(nics)]
+    per_core = [rng.uniform(5.0, 40.0) for _ in range(cores)]
+    memory = rng.uniform(30.0, 60.0)
+    rss = 120 * 1024 * 1024
+
+    def walk(value, step, low=0.0, high=100.0):
+        return min(high, max(low, value + rng.uniform(-step, step)))
+
+    for i in range(int(duration * rate)):
+        t = start + i / rate
+        per_core = [walk(value, 6.0) for value in per_core]
+        memory = walk(memory, 0.5)
+        # Rajadas periódicas de disco/rede para os gráficos terem picos
+        burst = max(0.0, math.sin(t / 7.0)) ** 8
+        disk_rates = [DiskRate(name, rng.uniform(0, 5) + 80 * burst, rng.uniform(0, 3))
+                      for name in disk_names]
+        nic_rates = [NicRate(name, rng.uniform(0, 2) + 20 * burst, rng.uniform(0, 1))
+                     for name in nic_names]
+        rss = max(64 * 1024 * 1024, rss + rng.randint(-1, 1) * 4096)
+        load = sum(per_core) / 100.0
+        yield HardwareSnapshot(
+            t,
+            cpu_percent=sum(per_core) / cores, cpu_per_core=per_core,
+            memory_percent=memory, swap_percent=memory / 10.0,
+            disk_mbs=sum(d.read_mbs + d.write_mbs for d in disk_rates), disks=disk_rates,
+            network_mbs=sum(n.recv_mbs + n.sent_mbs for n in nic_rates), nics=nic_rates,
+            load_avg=(load, load, load), process_cpu_percent=rng.uniform(0.5, 4.0),
+            process_rss=rss, process_threads=8, updated=METRIC_GROUPS)
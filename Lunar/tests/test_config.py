@@ -0,0 +1,155 @@
+"""
+Config com gravação em segundo plano (src/core/config.py): debounce e
+limite máximo, flush(), batch() aninhado e troca atômica do arquivo.
+"""
+import json
+import os
+import sys
+import time
+
+import pytest
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+pytest.importorskip("PySide6")
+
+from src.core import config as config_module
+from src.core.config import Config
+
+
+def _read(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def make_config(tmp_path, monkeypatch):
+    """Config em tmp_path que conta as gravações (`config.writes`)"""
+    created = []
+
+    def make(save_delay=0.1, max_delay=1.0, initial=None):
+        monkeypatch.setattr(config_module, "SAVE_DELAY", save_delay)
+        monkeypatch.setattr(config_module, "SAVE_MAX_DELAY", max_delay)
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps(initial or {"theme": "purple"}), encoding="utf-8")
+
+        config = Config(path)
+        config.writes = []
+        write = config._write
+
+        def counting_write():
+            config.writes.append(time.monotonic())
+            return write()
+        config._write = counting_write
+        created.append(config)
+        return config
+
+    yield make
+    for config in created:
+        config.close()
+
+
+def _wait_writes(config, count, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while len(config.writes) < count and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return len(config.writes)
+
+
+def test_debounce_coalesces_changes(make_config):
+    config = make_config(save_delay=0.2, max_delay=5.0)
+    for width in range(10):
+        config.set("window_size", [1000 + width, 800])
+        time.sleep(0.02)
+
+    assert _wait_writes(config, 1) == 1
+    time.sleep(0.4)
+    assert len(config.writes) == 1
+    assert _read(config.config_path)["window_size"] == [1009, 800]
+
+
+def test_max_delay_bounds_continuous_changes(make_config):
+    config = make_config(save_delay=0.2, max_delay=0.4)
+    started = time.monotonic()
+    # Mudanças mais frequentes que o debounce por 1.2 s (ex.: resize contínuo)
+    while time.monotonic() - started < 1.2:
+        config.set("window_size", [int((time.monotonic() - started) * 1000), 800])
+        time.sleep(0.02)
+
+    # Sem o limite máximo nada seria gravado até as mudanças pararem
+    assert len(config.writes) >= 2
+    assert config.writes[0] - started < 0.4 + 0.3
+
+
+def test_flush_writes_pending_changes(make_config):
+    config = make_config(save_delay=60.0, max_delay=60.0)
+    config.set("log_level", "DEBUG")
+    assert "log_level" not in _read(config.config_path)
+
+    assert config.flush(timeout=2.0)
+    assert _read(config.config_path)["log_level"] == "DEBUG"
+    assert len(config.writes) == 1
+
+    # Nada pendente: flush() não grava de novo
+    assert config.flush(timeout=2.0)
+    assert len(config.writes) == 1
+
+
+def test_nested_batch_notifies_once(make_config):
+    config = make_config(save_delay=60.0, max_delay=60.0)
+    signals = []
+    config.changed.connect(lambda key, value: signals.append((key, value)))
+    seen = []
+    config.subscribe("theme", seen.append)
+
+    with config.batch():
+        config.set("theme", "dark")
+        with config.batch():
+            config.set("theme", "light")
+            config.update(log_level="WARNING", perf_hud=True)
+        # O bloco interno não emite nada
+        assert signals == [] and seen == []
+        assert config.get("theme") == "light"
+
+    assert sorted(signals) == [("log_level", "WARNING"), ("perf_hud", True), ("theme", "light")]
+    assert seen == ["light"]
+    # Uma única gravação agendada para o bloco inteiro
+    assert config._writer.generation == 1
+    config.flush(timeout=2.0)
+    assert len(config.writes) == 1
+
+
+def test_unchanged_values_are_not_written(make_config):
+    config = make_config(save_delay=60.0, max_delay=60.0)
+    config.set("theme", "purple")
+    assert config._writer.generation == 0
+
+
+def test_failed_write_keeps_old_file(make_config, monkeypatch):
+    config = make_config(save_delay=60.0, max_delay=60.0, initial={"theme": "purple"})
+    before = config.config_path.read_bytes()
+
+    fsync = os.fsync
+
+    def disk_full(fd):
+        raise OSError(28, "No space left on device")
+    monkeypatch.setattr(config_module.os, "fsync", disk_full)
+
+    config.set("theme", "dark")
+    assert config.flush(timeout=2.0)
+    assert config.config_path.read_bytes() == before
+
+    # O valor continua em memória e sai na próxima gravação que der certo
+    monkeypatch.setattr(config_module.os, "fsync", fsync)
+    config.set("log_level", "ERROR")
+    config.flush(timeout=2.0)
+    assert _read(config.config_path)["theme"] == "dark"
+
+
+def test_default_path_ignores_working_directory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert Config.__init__.__defaults__[0] == config_module.CONFIG_FILE
+    assert config_module.CONFIG_FILE.is_absolute()
+    assert config_module.CONFIG_FILE.parent == config_module.PROJECT_DIR
+    assert (config_module.PROJECT_DIR / "src" / "core" / "config.py").is_file()
@@ -0,0 +1,133 @@
+"""
+Log da aplicação (src/utils/logger.py): limite de repetições por linha de
+código, resumo das rajadas e o anel em memória lido pela UI.
+"""
+import logging
+import os
+import sys
+import time
+
+import pytest
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+from src.utils import logger as logger_module
+from src.utils.logger import LogRing, _RepeatFilter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(logger_module, "time", clock)
+    return clock
+
+
+def _record(msg="falhou %s", args=("x",), lineno=10, level=logging.ERROR, created=None):
+    record = logging.LogRecord("lunar.test", level, __file__, lineno, msg, args, None)
+    if created is not None:
+        record.created = created
+    return record
+
+
+def test_burst_passes_then_suppresses(clock):
+    repeat = _RepeatFilter(burst=3, window=10.0)
+    passed = [repeat.filter(_record()) for _ in range(10)]
+    assert passed == [True] * 3 + [False] * 7
+
+    # Outra linha (ou outro modelo de mensagem) tem a própria contagem
+    assert repeat.filter(_record(lineno=11))
+    assert repeat.filter(_record(msg="outro %s"))
+
+    # Janela ainda aberta: nada a resumir
+    clock.now += 5.0
+    assert repeat.expired() == []
+
+
+def test_window_rollover_carries_count(clock):
+    repeat = _RepeatFilter(burst=2, window=10.0)
+    for _ in range(6):
+        repeat.filter(_record())
+
+    clock.now += 10.0
+    record = _record()
+    assert repeat.filter(record)
+    assert record.repeated == 4
+    # O resumo já saiu com a mensagem nova
+    assert repeat.expired(force=True) == []
+
+    # Nova janela: o limite recomeça
+    assert [repeat.filter(_record()) for _ in range(3)] == [True, False, False]
+
+
+def test_expired_summarizes_after_window(clock):
+    repeat = _RepeatFilter(burst=1, window=10.0)
+    records = [_record(args=(i,), created=i) for i in range(5)]
+    for record in records:
+        repeat.filter(record)
+
+    clock.now += 10.0
+    summaries = repeat.expired()
+    # O último suprimido sai no log e conta os outros três
+    assert summaries == [records[-1]]
+    assert records[-1].repeated == 3
+    assert repeat.expired() == []
+
+
+def test_forced_flush_emits_all_pending_in_order(clock):
+    repeat = _RepeatFilter(burst=1, window=10.0)
+    for i in range(3):
+        repeat.filter(_record(lineno=20, created=10 + i))
+    for i in range(2):
+        repeat.filter(_record(lineno=21, created=5 + i))
+
+    summaries = repeat.expired(force=True)
+    assert [record.lineno for record in summaries] == [21, 20]
+    assert [record.repeated for record in summaries] == [0, 1]
+    assert repeat.expired(force=True) == []
+
+
+def test_ring_since_returns_only_new_entries():
+    ring = LogRing(capacity=5)
+    assert ring.since(0) == []
+    for i in range(8):
+        ring.emit(_record(msg=f"linha {i}", args=None,
+                          level=logging.WARNING if i % 2 else logging.INFO))
+
+    # Só as 5 últimas cabem no anel
+    assert [entry.message for entry in ring.since(0)] == [f"linha {i}" for i in range(3, 8)]
+    assert [entry.seq for entry in ring.since(6)] == [7, 8]
+    assert ring.since(ring.last_seq) == []
+    assert [entry.message for entry in ring.since(0, logging.WARNING)] == \
+        ["linha 3", "linha 5", "linha 7"]
+
+    ring.clear()
+    assert ring.since(0) == []
+
+
+def test_summary_is_written_without_new_records(monkeypatch):
+    monkeypatch.setattr(logger_module, "REPEAT_POLL", 0.05)
+    ring = logger_module.setup_logging(console=False, repeat_burst=2, repeat_window=0.2)
+    try:
+        log = logger_module.get_logger("test_logger")
+        start = ring.last_seq
+        for _ in range(7):
+            log.error("rajada")
+
+        deadline = time.monotonic() + 3.0
+        while time.monotonic() < deadline:
+            messages = [entry.message for entry in ring.since(start)]
+            if any("repetições suprimidas" in message for message in messages):
+                break
+            time.sleep(0.02)
+        assert messages == ["rajada", "rajada", "rajada (+4 repetições suprimidas)"]
+    finally:
+        logger_module.setup_logging()
@@ -0,0 +1,131 @@
+"""
+Exportador do projeto para um único arquivo texto (script.py): ordem
+determinística com qualquer nº de threads, arquivos binários, fallback
+para latin-1, cópia em streaming e filtros include/exclude.
+"""
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+import script
+
+
+def _write(root, relative, data):
+    path = root.joinpath(*relative.split("/"))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data.encode("utf-8") if isinstance(data, str) else data)
+    return path
+
+
+def _export(root, tmp_path, **options):
+    output = tmp_path / "saida.txt"
+    count, written = script.export_project_structure(str(root), str(output), **options)
+    text = output.read_text(encoding="utf-8")
+    assert written == output.stat().st_size
+    return count, text
+
+
+def _headers(text):
+    return [line[2:] for line in text.split("\n") if line.startswith("# ")]
+
+
+def _name(relative):
+    return relative.replace("/", os.sep)
+
+
+@pytest.fixture
+def project(tmp_path):
+    root = tmp_path / "projeto"
+    for relative in ["main.py", "b.js", "a.py", "src/z.py", "src/core/app.py",
+                     "src/a_first.css", "docs/guia.md", "zz/ultimo.sh"]:
+        _write(root, relative, f"conteudo de {relative}\n")
+    _write(root, "notas.txt", "fora das extensões\n")
+    _write(root, "node_modules/lib.js", "ignorado\n")
+    _write(root, "build/gerado.py", "ignorado\n")
+    return root
+
+
+def test_order_is_stable_across_worker_counts(project, tmp_path):
+    expected = ["a.py", "b.js", "main.py", "docs/guia.md", "src/a_first.css",
+                "src/z.py", "src/core/app.py", "zz/ultimo.sh"]
+    outputs = []
+    for workers in (1, 2, 8):
+        count, text = _export(project, tmp_path, workers=workers)
+        assert count == len(expected)
+        assert _headers(text) == [_name(relative) for relative in expected]
+        outputs.append(text)
+    assert outputs[0] == outputs[1] == outputs[2]
+    assert f"# {_name('src/core/app.py')}\n\nconteudo de src/core/app.py\n\n\n" in outputs[0]
+
+
+def test_output_inside_root_is_not_exported(project):
+    output = project / "saida.py"
+    script.export_project_structure(str(project), str(output), workers=2)
+    assert "saida.py" not in _headers(output.read_text(encoding="utf-8"))
+
+
+def test_binary_file_gets_marker(tmp_path):
+    root = tmp_path / "projeto"
+    _write(root, "dados.json", b"\x89PNG\x00\x01\x02")
+    _, text = _export(root, tmp_path)
+    assert "[Arquivo binário ignorado: dados.json]" in text
+
+
+def test_latin1_fallback(tmp_path):
+    root = tmp_path / "projeto"
+    _write(root, "antigo.c", "/* café com ação */\r\n".encode("latin-1"))
+    _write(root, "novo.c", "/* café */\n")
+    _, text = _export(root, tmp_path)
+    assert "/* café com ação */\n" in text
+    assert "/* café */\n" in text
+
+
+def test_streaming_copy_handles_crlf_across_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(script, "STREAM_THRESHOLD", 64)
+    monkeypatch.setattr(script, "CHUNK_SIZE", 16)
+    root = tmp_path / "projeto"
+    # "\r" no fim de um pedaço e "\n" no começo do seguinte
+    lines = ["x" * 15 + "\r\n", "ação\r\n", "\r\n", "fim sem quebra"] * 8
+    _write(root, "grande.py", "".join(lines))
+    _write(root, "pequeno.py", "curto\r\n")
+
+    _, text = _export(root, tmp_path, workers=2)
+    expected = "".join(lines).replace("\r\n", "\n")
+    assert f"# grande.py\n\n{expected}\n\n" in text
+    assert "\r" not in text
+    assert "# pequeno.py\n\ncurto\n" in text
+
+
+def test_streaming_latin1(tmp_path, monkeypatch):
+    monkeypatch.setattr(script, "STREAM_THRESHOLD", 64)
+    monkeypatch.setattr(script, "CHUNK_SIZE", 16)
+    root = tmp_path / "projeto"
+    _write(root, "grande.sql", ("-- descrição\n" * 20).encode("latin-1"))
+    _, text = _export(root, tmp_path)
+    assert "-- descrição\n" * 20 in text
+
+
+def test_include_replaces_default_extensions(project, tmp_path):
+    count, text = _export(project, tmp_path, include=["*.txt", "src/core/*"])
+    assert _headers(text) == ["notas.txt", _name("src/core/app.py")]
+    assert count == 2
+
+
+def test_exclude_prunes_files_and_folders(project, tmp_path):
+    _, text = _export(project, tmp_path, exclude=["src", "*.md", "b.js"])
+    assert _headers(text) == ["a.py", "main.py", _name("zz/ultimo.sh")]
+
+    # Padrão de caminho completo também poda a subpasta
+    _, text = _export(project, tmp_path, exclude=["src/core"])
+    headers = _headers(text)
+    assert _name("src/z.py") in headers
+    assert _name("src/core/app.py") not in headers
+
+
+def test_headers_use_os_separator(project, tmp_path):
+    _, text = _export(project, tmp_path)
+    assert f"# src{os.sep}core{os.sep}app.py\n" in text
@@ -0,0 +1,142 @@
+"""
+Histórico persistente de telemetria (src/utils/telemetry_store.py) com
+anéis pequenos: volta do anel, fronteiras dos buckets agregados, lacunas
+em NaN e summary() combinando várias resoluções.
+"""
+import math
+import os
+import sys
+
+import numpy as np
+import pytest
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+from src.utils.telemetry_store import TelemetryStore
+
+CHANNELS = ("a", "b")
+# 20 s em 1 s, 2 min em 5 s, 10 min em 30 s
+RESOLUTIONS = ((1, 20), (5, 24), (30, 20))
+# Anel fino que guarda as bordas de summary()
+WIDE_RESOLUTIONS = ((1, 200), (5, 48), (30, 20))
+# Timestamps reais (bucket 0 marca slot vazio); múltiplo de todas as resoluções
+BASE = 30 * 56_666_667
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = TelemetryStore(tmp_path / "history.bin", channels=CHANNELS,
+                           resolutions=RESOLUTIONS)
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def wide_store(tmp_path):
+    store = TelemetryStore(tmp_path / "wide.bin", channels=CHANNELS,
+                           resolutions=WIDE_RESOLUTIONS)
+    yield store
+    store.close()
+
+
+def _fill(store, seconds):
+    """Uma amostra por instante `BASE + t`, com a = t e b = 100 - t"""
+    for t in seconds:
+        store.record(BASE + t, (float(t), 100.0 - t))
+
+
+def _query(store, start, end, channel="a", max_points=600):
+    result = store.query(BASE + start, BASE + end, channel, max_points)
+    result["timestamps"] = result["timestamps"] - BASE
+    return result
+
+
+def test_ring_wraps_and_drops_oldest(store):
+    _fill(store, range(30))
+    result = _query(store, 0, 30, max_points=30)
+    # 30 buckets de 1 s não cabem no anel de 20: resolução seguinte
+    assert result["resolution"] == 5
+
+    result = _query(store, 10, 30, max_points=20)
+    assert result["resolution"] == 1
+    assert result["timestamps"].tolist() == list(range(10, 30))
+    assert result["avg"].tolist() == [float(t) for t in range(10, 30)]
+
+    # Slots de 0..9 foram sobrescritos por 20..29: não voltam como dados antigos
+    result = _query(store, 5, 15, max_points=20)
+    assert np.isnan(result["avg"][:5]).all()
+    assert result["avg"][5:].tolist() == [10.0, 11.0, 12.0, 13.0, 14.0]
+
+
+def test_rollup_bucket_boundaries(store):
+    _fill(store, [4, 4.9, 5, 9.99, 10])
+    result = _query(store, 0, 15, max_points=3)
+    assert result["resolution"] == 5
+    assert result["timestamps"].tolist() == [0, 5, 10]
+    # int(timestamp): 4.9 fica no segundo 4, 9.99 no 9
+    assert result["min"].tolist() == [4.0, 5.0, 10.0]
+    assert result["max"].tolist() == pytest.approx([4.9, 9.99, 10.0], rel=1e-6)
+    assert result["avg"].tolist() == pytest.approx([4.45, 7.495, 10.0], rel=1e-6)
+
+    hour = _query(store, 0, 60, "b", max_points=2)
+    assert hour["resolution"] == 30
+    assert hour["min"][0] == pytest.approx(90.0)
+    assert hour["max"][0] == pytest.approx(96.0)
+    assert math.isnan(hour["avg"][1])
+
+
+def test_gaps_stay_nan(store):
+    _fill(store, [0, 1, 2, 7, 8])
+    result = _query(store, 0, 10, max_points=10)
+    assert result["resolution"] == 1
+    avg = result["avg"]
+    assert avg[[0, 1, 2, 7, 8]].tolist() == [0.0, 1.0, 2.0, 7.0, 8.0]
+    assert np.isnan(avg[[3, 4, 5, 6, 9]]).all()
+    assert np.isnan(result["min"][3]) and np.isnan(result["max"][3])
+
+
+@pytest.mark.parametrize("start,end", [(0, 120), (3, 97), (29, 31), (7, 8), (31, 89), (100, 119)])
+def test_summary_across_resolutions(wide_store, start, end):
+    _fill(wide_store, range(120))
+    values = np.arange(start, end, dtype=np.float64)
+
+    result = wide_store.summary(BASE + start, BASE + end)
+    low, high, avg = result["a"]
+    assert low == values.min()
+    assert high == values.max()
+    assert avg == pytest.approx(values.mean())
+    assert result["b"][2] == pytest.approx(100.0 - values.mean())
+
+
+def test_summary_skips_gaps_and_empty_ranges(wide_store):
+    _fill(wide_store, [0, 1, 2, 40, 41])
+    low, high, avg = wide_store.summary(BASE, BASE + 60)["a"]
+    assert (low, high) == (0.0, 41.0)
+    assert avg == pytest.approx(np.mean([0, 1, 2, 40, 41]))
+
+    assert all(math.isnan(v) for v in wide_store.summary(BASE + 10, BASE + 30)["a"])
+
+
+def test_summary_uses_coarse_buckets_after_fine_ring_wraps(store):
+    # 10 min de dados: o anel de 1 s só guarda os últimos 20 s, mas o
+    # intervalo é feito só de buckets inteiros de 30 s
+    _fill(store, range(600))
+    low, high, avg = store.summary(BASE + 30, BASE + 570)["a"]
+    assert (low, high) == (30.0, 569.0)
+    assert avg == pytest.approx(np.arange(30, 570).mean())
+
+
+def test_reopen_keeps_history_and_new_layout_resets(tmp_path):
+    path = tmp_path / "history.bin"
+    store = TelemetryStore(path, channels=CHANNELS, resolutions=RESOLUTIONS)
+    _fill(store, range(5))
+    store.close()
+
+    store = TelemetryStore(path, channels=CHANNELS, resolutions=RESOLUTIONS)
+    assert _query(store, 0, 5, max_points=5)["avg"].tolist() == [0.0, 1.0, 2.0, 3.0, 4.0]
+    store.close()
+
+    store = TelemetryStore(path, channels=CHANNELS + ("c",), resolutions=RESOLUTIONS)
+    assert np.isnan(_query(store, 0, 5, max_points=5)["avg"]).all()
+    store.close()
@@ -0,0 +1,115 @@
+"""
+Codec do trace binário de telemetria (src/utils/telemetry_trace.py):
+ida e volta, fim truncado (processo morto antes do flush) e cabeçalho
+inválido.
+"""
+import os
+import struct
+import sys
+
+import pytest
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+from src.utils import telemetry_trace
+from src.utils.hardware_reader import HardwareSnapshot
+from src.utils.telemetry_trace import (HEADER_FORMAT, TraceWriter, read_trace,
+                                       synthetic_trace, write_trace)
+
+
+def _assert_same(read, original):
+    assert read.timestamp == original.timestamp
+    assert read.updated == original.updated
+    # Valores gravados em float32
+    assert read.cpu_percent == pytest.approx(original.cpu_percent, rel=1e-6)
+    assert read.cpu_per_core == pytest.approx(original.cpu_per_core, rel=1e-6)
+    assert read.memory_percent == pytest.approx(original.memory_percent, rel=1e-6)
+    assert read.disk_mbs == pytest.approx(original.disk_mbs, rel=1e-6)
+    assert [d.name for d in read.disks] == [d.name for d in original.disks]
+    assert [n.name for n in read.nics] == [n.name for n in original.nics]
+    assert read.load_avg == pytest.approx(original.load_avg, rel=1e-6)
+    assert read.process_rss == original.process_rss
+    assert read.process_threads == original.process_threads
+
+
+def test_round_trip(tmp_path):
+    path = tmp_path / "trace.bin"
+    snapshots = list(synthetic_trace(duration=20, rate=2))
+    assert write_trace(path, snapshots) == len(snapshots)
+
+    read = list(read_trace(path))
+    assert len(read) == len(snapshots)
+    for got, expected in zip(read, snapshots):
+        _assert_same(got, expected)
+
+
+def test_partial_groups_repeat_previous_values(tmp_path):
+    path = tmp_path / "trace.bin"
+    full = next(synthetic_trace(duration=1))
+    partial = HardwareSnapshot(1.0, memory_percent=12.5, updated={"memory"})
+    write_trace(path, [full, partial])
+
+    first, second = read_trace(path)
+    assert second.updated == {"memory"}
+    assert second.memory_percent == 12.5
+    assert second.cpu_per_core == first.cpu_per_core
+    assert second.process_threads == full.process_threads
+
+
+@pytest.mark.parametrize("cut", [1, 7, 20])
+def test_truncated_tail_is_ignored(tmp_path, cut):
+    path = tmp_path / "trace.bin"
+    snapshots = list(synthetic_trace(duration=10))
+    write_trace(path, snapshots)
+    with open(path, "r+b") as f:
+        f.truncate(os.path.getsize(path) - cut)
+
+    read = list(read_trace(path))
+    assert len(read) == len(snapshots) - 1
+    _assert_same(read[-1], snapshots[-2])
+
+
+def test_truncated_name_record_is_ignored(tmp_path):
+    path = tmp_path / "trace.bin"
+    write_trace(path, synthetic_trace(duration=1))
+    # Corta dentro do primeiro nome de disco, antes de qualquer amostra
+    with open(path, "r+b") as f:
+        f.truncate(struct.calcsize(HEADER_FORMAT) + 5)
+    assert list(read_trace(path)) == []
+
+
+def test_writer_flushes_periodically(tmp_path, monkeypatch):
+    monkeypatch.setattr(telemetry_trace, "FLUSH_INTERVAL", 0.0)
+    path = tmp_path / "trace.bin"
+    snapshots = list(synthetic_trace(duration=5))
+    writer = TraceWriter(path)
+    try:
+        for snapshot in snapshots:
+            writer.write(snapshot)
+        # Sem close(): o que já foi descarregado é legível
+        assert len(list(read_trace(path))) == len(snapshots)
+    finally:
+        writer.close()
+
+
+@pytest.mark.parametrize("header", [
+    b"",
+    b"LUNAR",
+    struct.pack(HEADER_FORMAT, b"NOTATRCE", 1),
+    struct.pack(HEADER_FORMAT, telemetry_trace.MAGIC, 99),
+])
+def test_bad_header(tmp_path, header):
+    path = tmp_path / "trace.bin"
+    path.write_bytes(header)
+    with pytest.raises(ValueError):
+        list(read_trace(path))
+
+
+def test_unknown_record(tmp_path):
+    path = tmp_path / "trace.bin"
+    write_trace(path, synthetic_trace(duration=2))
+    with open(path, "ab") as f:
+        f.write(b"X" + bytes(16))
+    with pytest.raises(ValueError):
+        list(read_trace(path))
@@ -1 +1,75 @@
-# TODO: Implement
+"""
+Renderização dos widgets customizados na plataforma Qt offscreen.
+
+Cada caso do benchmarks/bench_render.py é renderizado em QImage e precisa
+desenhar alguma coisa. A comparação de tempo com o baseline
+(benchmarks/render_baseline.json) só roda com LUNAR_RENDER_BENCH=1: tempo
+de paint varia demais em máquinas compartilhadas para rodar sempre.
+"""
+import os
+import sys
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+pytest.importorskip("PySide6")
+
+from PySide6.QtGui import QColor, QImage
+from PySide6.QtWidgets import QApplication
+
+import bench_render
+from src.ui.adapters.theme_manager import ThemeManager
+
+RENDER_CASES = [(name, size) for name, sizes in bench_render.CASES for size in sizes]
+
+
+@pytest.fixture(scope="module")
+def app():
+    from src.core.telemetry_sampler import TelemetrySampler
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    app.setStyleSheet(ThemeManager.instance().stylesheet())
+    # Sem TelemetryStore: os testes não criam o arquivo de histórico
+    TelemetrySampler.ephemeral()
+    yield app
+    TelemetrySampler.instance().stop()
+
+
+@pytest.mark.parametrize("name,size", RENDER_CASES,
+                         ids=[f"{name}-{w}x{h}" for name, (w, h) in RENDER_CASES])
+def test_widget_renders(app, tmp_path, name, size):
+    result = bench_render.measure(name, size, frames=5, images=str(tmp_path))
+    assert result["p50"] > 0
+
+    files = list(tmp_path.glob(f"{name}_*.png"))
+    assert len(files) == 1
+    image = QImage(str(files[0]))
+    assert (image.width(), image.height()) == (round(size[0] * image.devicePixelRatio()),
+                                               round(size[1] * image.devicePixelRatio()))
+
+    # Algo além do fundo foi desenhado (comparação de todos os pixels: as
+    # partículas são esparsas e aleatórias)
+    blank = QImage(image.size(), image.format())
+    blank.fill(QColor(ThemeManager.instance().variable("background")))
+    assert image != blank
+
+
+@pytest.mark.skipif(os.environ.get("LUNAR_RENDER_BENCH") != "1",
+                    reason="benchmark de renderização: defina LUNAR_RENDER_BENCH=1")
+def test_render_performance_against_baseline():
+    baseline = bench_render.load_baseline()
+    if baseline is None:
+        pytest.skip("sem benchmarks/render_baseline.json (gere com --save-baseline)")
+
+    threshold = float(os.environ.get("LUNAR_RENDER_THRESHOLD", bench_render.DEFAULT_THRESHOLD))
+    results = bench_render.run(frames=100)
+    failures = [f"{result['case']}: {result[bench_render.DEFAULT_METRIC]:.3f} ms "
+                f"(base {base[bench_render.DEFAULT_METRIC]:.3f} ms)"
+                for result, base, change, regression
+                in bench_render.compare(results, baseline["cases"], threshold)
+                if regression]
+    assert not failures, "Renderização acima do baseline:\n" + "\n".join(failures)